@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+LarkClient 吞吐量基准测试
+
+在本地模拟多维表格服务上测量记录读取、查询和结果回写的耗时与请求数，
+不需要飞书账号，结果可复现。
+
+用法:
+    python examples/benchmark_lark_client.py --records 2000 --latency 0.02
+"""
+
+import argparse
+import time
+
+from lark_tester import setup_logging
+from lark_tester.core.lark_client import LarkClient
+from lark_tester.testing import MockBitableServer
+
+TABLE_ID = 'tblBenchmark'
+
+
+def measure(server: MockBitableServer, name: str, func) -> None:
+    """执行一次操作并打印耗时和请求数"""
+    server.reset_stats()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {elapsed * 1000:>9.1f} ms  {sum(server.requests.values()):>5} 次请求  {name}")
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='LarkClient 吞吐量基准测试（本地模拟服务）')
+    parser.add_argument('--records', type=int, default=2000, help='测试用例记录数')
+    parser.add_argument('--latency', type=float, default=0.02, help='模拟服务每个请求的延迟(秒)')
+    parser.add_argument('--qps', type=float, default=0, help='模拟服务的限流速率(次/秒)，0表示不限流')
+    args = parser.parse_args()
+
+    setup_logging(level="WARNING", use_rich=False)
+
+    cases = [
+        {'接口编号': f'API-{i:05d}', '请求方法': 'GET', '接口路径': f'/items/{i}', '预期状态码': 200}
+        for i in range(args.records)
+    ]
+
+    with MockBitableServer(latency=args.latency, rate_limit_qps=args.qps) as server:
+        record_ids = server.add_table(TABLE_ID, cases, fields={'是否通过': 1, '响应时间': 2})
+        client = LarkClient('pt-benchmark', server.app_token, domain=server.url, qps=0)
+        prefetch_client = LarkClient('pt-benchmark', server.app_token, domain=server.url, qps=0, prefetch_pages=True)
+        updates = [{'record_id': record_id, 'fields': {'是否通过': 'PASS', '响应时间': 12.5}} for record_id in record_ids]
+
+        print(f"📊 {args.records} 条记录, 模拟延迟 {args.latency * 1000:.0f}ms, 服务地址 {server.url}")
+
+        print("\n读取记录:")
+        measure(server, "get_all_records(page_size=100)", lambda: client.get_all_records(TABLE_ID, page_size=100))
+        measure(server, "get_all_records(page_size=500)", lambda: client.get_all_records(TABLE_ID, page_size=500))
+        measure(server, "预取下一页(page_size=100)", lambda: prefetch_client.get_all_records(TABLE_ID, page_size=100))
+        measure(server, "search_records(按接口编号)",
+                lambda: client.find_records_by_field(TABLE_ID, '接口编号', 'API-00001'))
+
+        print("\n字段结构:")
+        client.invalidate_field_cache()
+        measure(server, "list_fields(首次)", lambda: client.list_fields(TABLE_ID))
+        measure(server, "list_fields(缓存)", lambda: client.list_fields(TABLE_ID))
+
+        print("\n结果回写:")
+        sample = updates[:min(len(updates), 100)]
+        measure(server, f"update_record × {len(sample)}",
+                lambda: [client.update_record(TABLE_ID, u['record_id'], u['fields']) for u in sample])
+        measure(server, f"batch_update_records({len(updates)})", lambda: client.batch_update_records(TABLE_ID, updates))
+
+        if server.rate_limited:
+            print(f"\n⚠️  共触发限流 {server.rate_limited} 次")
+
+
+if __name__ == "__main__":
+    main()
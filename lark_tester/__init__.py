@@ -13,10 +13,14 @@ __author__ = "Lark API Tester Team"
 __email__ = "dev@example.com"
 
 from .core.lark_client import LarkClient
-from .core.api_client import APIClient, AssertionValidator
+from .core.api_client import APIClient, AssertionValidator, pool_options_from_config
+from .core.retry_policy import RetryPolicy, RetryBudget
+from .core.cassette import Cassette
 from .core.test_executor import TestExecutor, TestResults
 from .core.config_manager import ConfigManager, config_manager
 from .core.config_table import create_config_reader
+from .core.async_client import AsyncAPIClient, AsyncLarkClient
+from .core.async_executor import AsyncTestExecutor
 
 from .utils.logger import setup_logging, get_logger
 from .utils.validator import validate_test_case, validate_config
@@ -37,6 +41,12 @@ __all__ = [
     "ConfigManager",
     "config_manager",
     "create_config_reader",
+    "AsyncAPIClient",
+    "AsyncLarkClient",
+    "AsyncTestExecutor",
+    "RetryPolicy",
+    "RetryBudget",
+    "Cassette",
     
     # 工具函数
     "setup_logging",
@@ -77,12 +87,18 @@ class LarkAPITester:
         """
         self.table_id = table_id
         
-        # 初始化组件
-        self.lark_client = LarkClient(personal_token, app_token)
-        
         # 加载配置
         config = config_manager.load_config(config_env)
         
+        # 初始化组件
+        self.lark_client = LarkClient(
+            personal_token, app_token,
+            domain=config.get('domain'),
+            qps=config.get('lark_qps', LarkClient.DEFAULT_QPS),
+            prefetch_pages=config.get('lark_prefetch', False),
+            field_cache_ttl=config.get('field_cache_ttl', 300)
+        )
+        
         # 如果api_base_url为空，尝试从配置表读取
         if not api_base_url:
             # 优先使用参数中的config_table_id，其次使用配置文件中的
@@ -91,7 +107,11 @@ class LarkAPITester:
             
             if config_table_id:
                 try:
-                    config_reader = create_config_reader(personal_token, app_token, config_table_id)
+                    config_reader = create_config_reader(
+                        personal_token, app_token, config_table_id,
+                        rate_limiter=self.lark_client.rate_limiter,
+                        domain=self.lark_client.domain
+                    )
                     dynamic_config = config_reader.load_config()
                     api_base_url = dynamic_config.get('api_base_url', '')
                     if api_base_url:
@@ -101,7 +121,13 @@ class LarkAPITester:
             else:
                 print("⚠️  未配置 config_table_id，跳过配置表读取")
         
-        self.api_client = APIClient(base_url=api_base_url)
+        self.api_client = APIClient(
+            base_url=api_base_url,
+            max_body_bytes=config.get('max_body_bytes', 1048576),
+            retry_policy=RetryPolicy.from_config(config),
+            cassette=Cassette.from_config(config),
+            **pool_options_from_config(config)
+        )
         
         self.executor = TestExecutor(
             lark_client=self.lark_client,
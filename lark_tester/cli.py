@@ -6,11 +6,13 @@
 
 import click
 import sys
-from typing import Optional
+from typing import Dict, Any, Optional
 
 from .core.config_manager import config_manager
 from .core.lark_client import LarkClient
-from .core.api_client import APIClient
+from .core.api_client import APIClient, pool_options_from_config
+from .core.cassette import Cassette
+from .core.retry_policy import RetryPolicy
 from .core.test_executor import TestExecutor
 from .core.config_table import create_config_reader
 from .utils.logger import setup_logging, get_logger
@@ -30,8 +32,13 @@ logger = get_logger(__name__)
     type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']),
     help='日志级别'
 )
+@click.option(
+    '--lark-domain',
+    default=None,
+    help='多维表格API域名（覆盖配置中的domain，如指向本地模拟服务 http://127.0.0.1:8080）'
+)
 @click.pass_context
-def cli(ctx: click.Context, env: str, log_level: Optional[str]):
+def cli(ctx: click.Context, env: str, log_level: Optional[str], lark_domain: Optional[str]):
     """Lark API 自动化测试框架"""
     ctx.ensure_object(dict)
     ctx.obj['env'] = env
@@ -40,6 +47,9 @@ def cli(ctx: click.Context, env: str, log_level: Optional[str]):
     config = config_manager.load_config(env)
     ctx.obj['config'] = config
     
+    if lark_domain:
+        config['domain'] = lark_domain
+    
     # 设置日志
     if log_level:
         config['log_level'] = log_level
@@ -50,73 +60,141 @@ def cli(ctx: click.Context, env: str, log_level: Optional[str]):
     )
 
 
+def _create_executor(ctx: click.Context, overrides: Optional[Dict[str, Any]] = None) -> TestExecutor:
+    """
+    根据当前环境配置创建测试执行器，缺少必需配置时退出
+    
+    Args:
+        ctx: click上下文
+        overrides: 命令行参数覆盖的API配置项（值为None的项忽略）
+        
+    Returns:
+        测试执行器
+    """
+    config = ctx.obj['config']
+    
+    # 验证必需配置
+    required_fields = ['personal_token', 'app_token', 'table_id']
+    missing_fields = [field for field in required_fields if not config.get(field)]
+    
+    if missing_fields:
+        click.echo(f"❌ 缺少必需配置: {', '.join(missing_fields)}", err=True)
+        click.echo("请检查配置文件或设置环境变量", err=True)
+        sys.exit(1)
+    
+    # 初始化组件
+    lark_config = config_manager.get_lark_config(ctx.obj['env'])
+    api_config = config_manager.get_api_config(ctx.obj['env'])
+    # 在创建客户端前覆盖，使连接池大小与实际并发一致
+    api_config.update({k: v for k, v in (overrides or {}).items() if v is not None})
+    
+    click.echo("🚀 初始化测试组件...")
+    
+    lark_client = LarkClient(
+        app_token=lark_config['app_token'],
+        personal_token=lark_config['personal_token'],
+        domain=lark_config['domain'],
+        qps=lark_config['qps'],
+        prefetch_pages=lark_config['prefetch_pages'],
+        field_cache_ttl=lark_config['field_cache_ttl']
+    )
+    
+    # 读取配置表中的API域名配置
+    click.echo("📊 读取配置表...")
+    config_table_id = lark_config.get('config_table_id')  # 从配置文件读取
+    
+    if not config_table_id:
+        click.echo("⚠️  未配置 config_table_id，跳过配置表读取")
+        api_base_url = api_config['base_url']
+    else:
+        config_reader = create_config_reader(
+            lark_config['personal_token'],
+            lark_config['app_token'],
+            config_table_id,
+            rate_limiter=lark_client.rate_limiter,
+            domain=lark_client.domain
+        )
+        
+        # 获取动态配置
+        dynamic_config = config_reader.load_config()
+        api_base_url = dynamic_config.get('api_base_url', api_config['base_url'])
+    
+    if api_base_url:
+        click.echo(f"⚙️  使用配置表中API域名: {api_base_url}")
+    else:
+        click.echo("⚠️  未找到有效的API域名配置")
+    
+    api_client = APIClient(
+        base_url=api_base_url,
+        timeout=api_config['timeout'],
+        max_retries=api_config['max_retries'],
+        retry_delay=api_config['retry_delay'],
+        max_body_bytes=api_config['max_body_bytes'],
+        retry_policy=RetryPolicy.from_config(api_config),
+        cassette=Cassette.from_config(api_config),
+        **pool_options_from_config(api_config)
+    )
+    if api_client.cassette is not None:
+        click.echo(f"📼 {'回放' if api_client.cassette.replaying else '录制'}API响应: {api_client.cassette.path}")
+    
+    return TestExecutor(
+        lark_client=lark_client,
+        api_client=api_client,
+        config=api_config
+    )
+
+
+def _cassette_overrides(record: Optional[str], replay: Optional[str], replay_latency: bool) -> Dict[str, Any]:
+    """
+    根据--record/--replay参数生成录制回放配置
+    
+    Args:
+        record: 录制文件路径
+        replay: 回放文件路径
+        replay_latency: 回放时是否按录制的响应时间等待
+        
+    Returns:
+        覆盖的API配置项
+    """
+    if record and replay:
+        raise click.UsageError("--record 和 --replay 不能同时使用")
+    if record:
+        return {'cassette_mode': 'record', 'cassette_path': record}
+    if replay:
+        return {'cassette_mode': 'replay', 'cassette_path': replay, 'replay_latency': replay_latency or None}
+    return {}
+
+
+def cassette_options(func):
+    """为命令添加录制回放参数"""
+    func = click.option('--replay-latency', is_flag=True, help='回放时按录制的响应时间等待')(func)
+    func = click.option('--replay', type=click.Path(exists=True, dir_okay=False), default=None,
+                        help='从录制文件回放API响应，不访问目标API')(func)
+    func = click.option('--record', type=click.Path(dir_okay=False), default=None,
+                        help='把API响应录制到文件（.gz结尾时压缩）')(func)
+    return func
+
+
 @cli.command()
+@click.option('--workers', type=click.IntRange(min=1), default=None, help='并发工作线程数（覆盖配置中的concurrency）')
+@cassette_options
 @click.pass_context
-def run_tests(ctx: click.Context):
+def run_tests(ctx: click.Context, workers: Optional[int], record: Optional[str], replay: Optional[str],
+              replay_latency: bool):
     """执行所有API测试"""
     config = ctx.obj['config']
     
     try:
-        # 验证必需配置
-        required_fields = ['personal_token', 'app_token', 'table_id']
-        missing_fields = [field for field in required_fields if not config.get(field)]
-        
-        if missing_fields:
-            click.echo(f"❌ 缺少必需配置: {', '.join(missing_fields)}", err=True)
-            click.echo("请检查配置文件或设置环境变量", err=True)
-            sys.exit(1)
-        
-        # 初始化组件
-        lark_config = config_manager.get_lark_config(ctx.obj['env'])
-        api_config = config_manager.get_api_config(ctx.obj['env'])
-        
-        click.echo("🚀 初始化测试组件...")
-        
-        lark_client = LarkClient(
-            app_token=lark_config['app_token'],
-            personal_token=lark_config['personal_token']
-        )
-        
-        # 读取配置表中的API域名配置
-        click.echo("📊 读取配置表...")
-        config_table_id = lark_config.get('config_table_id')  # 从配置文件读取
-        
-        if not config_table_id:
-            click.echo("⚠️  未配置 config_table_id，跳过配置表读取")
-            api_base_url = api_config['base_url']
-        else:
-            config_reader = create_config_reader(
-                lark_config['personal_token'],
-                lark_config['app_token'],
-                config_table_id
-            )
-            
-            # 获取动态配置
-            dynamic_config = config_reader.load_config()
-            api_base_url = dynamic_config.get('api_base_url', api_config['base_url'])
-        
-        if api_base_url:
-            click.echo(f"⚙️  使用配置表中API域名: {api_base_url}")
-        else:
-            click.echo("⚠️  未找到有效的API域名配置")
-        
-        api_client = APIClient(
-            base_url=api_base_url,
-            timeout=api_config['timeout'],
-            max_retries=api_config['max_retries'],
-            retry_delay=api_config['retry_delay']
-        )
-        
-        executor = TestExecutor(
-            lark_client=lark_client,
-            api_client=api_client,
-            config=api_config
-        )
+        executor = _create_executor(ctx, {
+            'concurrency': workers,
+            **_cassette_overrides(record, replay, replay_latency)
+        })
         
         # 执行测试
         click.echo("📋 开始执行API测试...")
         
-        results = executor.run_full_test_cycle(lark_config['table_id'])
+        with executor.api_client:
+            results = executor.run_full_test_cycle(config['table_id'])
         
         # 显示结果
         click.echo("\n" + "="*50)
@@ -127,6 +205,9 @@ def run_tests(ctx: click.Context):
         if results.failed > 0:
             click.echo(f"\n❌ {results.failed} 个测试失败")
             sys.exit(1)
+        elif results.sla_failed > 0:
+            click.echo(f"\n⚠️  {results.sla_failed} 个测试未满足响应时间要求")
+            sys.exit(1)
         else:
             click.echo(f"\n✅ 所有测试通过!")
         
@@ -136,6 +217,62 @@ def run_tests(ctx: click.Context):
         sys.exit(1)
 
 
+@cli.command()
+@click.option('--duration', type=click.FloatRange(min=0, min_open=True), default=None, help='每个用例的压测时长(秒)')
+@click.option('--concurrency', type=click.IntRange(min=1), default=None, help='并发工作线程数')
+@click.option('--rate', type=click.FloatRange(min=0), default=None, help='目标总速率(请求/秒)，0表示不限速')
+@click.option('--mode', type=click.Choice(['closed', 'open']), default=None,
+              help='closed: 固定并发闭环压测; open: 按--rate固定到达速率开环压测')
+@click.option('--case', 'test_ids', multiple=True, help='只压测指定接口编号的用例，可重复指定')
+@click.option('--no-write', is_flag=True, help='不回写压测结果到表格')
+@cassette_options
+@click.pass_context
+def load_test(ctx: click.Context, duration: Optional[float], concurrency: Optional[int],
+              rate: Optional[float], mode: Optional[str], test_ids: tuple, no_write: bool,
+              record: Optional[str], replay: Optional[str], replay_latency: bool):
+    """压测API用例并统计百分位延迟"""
+    config = ctx.obj['config']
+    
+    try:
+        # 命令行参数覆盖配置
+        executor = _create_executor(ctx, {
+            'load_duration': duration,
+            'load_concurrency': concurrency,
+            'load_rate': rate,
+            'load_mode': mode,
+            **_cassette_overrides(record, replay, replay_latency)
+        })
+        
+        if executor.config.get('load_mode') == 'open' and not executor.config.get('load_rate'):
+            click.echo("❌ 开环压测需要指定 --rate", err=True)
+            sys.exit(1)
+        
+        click.echo("🔥 开始压测...")
+        
+        with executor.api_client:
+            results = executor.run_load_test(
+                config['table_id'],
+                test_ids=list(test_ids) or None,
+                write_back=not no_write
+            )
+        
+        if not results:
+            click.echo("⚠️  没有找到需要压测的测试用例")
+            sys.exit(1)
+        
+        # 显示结果
+        click.echo("\n" + "="*50)
+        click.echo("📊 压测结果摘要")
+        click.echo("="*50)
+        for result in results:
+            click.echo(result.summary())
+        
+    except Exception as e:
+        logger.error(f"压测失败: {str(e)}")
+        click.echo(f"❌ 压测失败: {str(e)}", err=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.option('--table-id', help='指定表格ID')
 @click.pass_context
@@ -156,7 +293,11 @@ def validate_table(ctx: click.Context, table_id: Optional[str]):
         lark_config = config_manager.get_lark_config(ctx.obj['env'])
         lark_client = LarkClient(
             app_token=lark_config['app_token'],
-            personal_token=lark_config['personal_token']
+            personal_token=lark_config['personal_token'],
+            domain=lark_config['domain'],
+            qps=lark_config['qps'],
+            prefetch_pages=lark_config['prefetch_pages'],
+            field_cache_ttl=lark_config['field_cache_ttl']
         )
         
         click.echo(f"🔍 验证表格: {table_id}")
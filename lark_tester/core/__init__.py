@@ -5,19 +5,41 @@
 """
 
 from .lark_client import LarkClient
-from .api_client import APIClient, AssertionValidator
+from .api_client import APIClient, APIResponse, AssertionValidator
+from .prepared_request import PreparedCase, compile_test_case
+from .retry_policy import RetryPolicy, RetryBudget
+from .cassette import Cassette
 from .test_executor import TestExecutor, TestResults
+from .dependency import DependencyScheduler
 from .config_manager import ConfigManager, config_manager
 from .config_table import ConfigTableReader, create_config_reader
+from .record_cache import RecordCache
+from .load_runner import LoadTestRunner, ConstantRateRunner, LoadResult
+from .async_client import AsyncAPIClient, AsyncLarkClient
+from .async_executor import AsyncTestExecutor
 
 __all__ = [
     "LarkClient",
     "APIClient", 
+    "APIResponse",
+    "PreparedCase",
+    "compile_test_case",
+    "RetryPolicy",
+    "RetryBudget",
+    "Cassette",
     "AssertionValidator",
     "TestExecutor",
     "TestResults",
+    "DependencyScheduler",
     "ConfigManager",
     "config_manager",
     "ConfigTableReader",
     "create_config_reader",
+    "RecordCache",
+    "LoadTestRunner",
+    "ConstantRateRunner",
+    "LoadResult",
+    "AsyncAPIClient",
+    "AsyncLarkClient",
+    "AsyncTestExecutor",
 ]
\ No newline at end of file
@@ -4,16 +4,205 @@ HTTP API客户端模块
 提供HTTP请求发送、响应处理、超时管理和重试机制
 """
 
+import hashlib
+import operator
+import threading
 import time
 import requests
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.exceptions import NewConnectionError
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Any, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 
+from .cassette import Cassette
+from .http_timing import TimingHTTPAdapter, collect_timings, new_timings
+from .prepared_request import PreparedCase, PreparedCaseCache, compile_request, DEFAULT_USER_AGENT, FULL_BODY_FIELD
+from .retry_policy import RetryPolicy, parse_retry_after, FAILURE_CONNECT, FAILURE_CONNECTION, FAILURE_TIMEOUT
+from ..utils.assertion import AssertionSyntaxError, compile_assertion
+from ..utils.jsonpath import compile_path, parse_json
 from ..utils.logger import get_logger
-from ..utils.formatter import parse_headers, parse_request_body, format_url
+from ..utils.response_body import ResponseBody
 
 logger = get_logger(__name__)
 
+# 响应时间断言的比较运算
+_LATENCY_OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+# 响应时间上限字段（毫秒）
+LATENCY_BUDGET_FIELD = '响应时间上限'
+
+
+# 响应体默认保留的最大字节数
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+# 流式读取响应体的分块大小
+BODY_CHUNK_SIZE = 64 * 1024
+
+# requests默认的连接池参数：缓存10个主机的连接池，每个主机保留10个长连接
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+def pool_options_from_config(config: Dict[str, Any]) -> Dict[str, int]:
+    """
+    根据API配置计算连接池参数
+
+    pool_maxsize为0时取并发线程数和压测并发数中的较大值（不小于默认值），
+    保证每个工作线程都能归还长连接，避免连接池满后连接被丢弃重建。
+
+    Args:
+        config: get_api_config返回的配置字典
+
+    Returns:
+        APIClient的pool_connections和pool_maxsize参数
+    """
+    pool_maxsize = int(config.get('pool_maxsize', 0) or 0)
+    if pool_maxsize <= 0:
+        pool_maxsize = max(
+            DEFAULT_POOL_MAXSIZE,
+            int(config.get('concurrency', 1) or 1),
+            int(config.get('load_concurrency', 1) or 1)
+        )
+    return {
+        'pool_connections': max(1, int(config.get('pool_connections', DEFAULT_POOL_CONNECTIONS) or 1)),
+        'pool_maxsize': pool_maxsize,
+    }
+
+
+@dataclass
+class APIResponse:
+    """HTTP请求结果封装"""
+    status_code: int
+    body: str
+    response_time: float
+    error: Optional[str] = None
+    # 最后一次尝试的分阶段耗时(秒): dns/connect/tls/ttfb/download/total
+    timings: Dict[str, float] = field(default_factory=dict)
+    # 完整响应体的字节数和SHA-256（超过上限被截断时同样覆盖完整响应体）
+    body_size: int = 0
+    body_sha256: str = ""
+    truncated: bool = False
+    # 每次尝试的状态码、错误、分阶段耗时(毫秒)和重试前的退避时间(秒)
+    attempts: List[Dict[str, Any]] = field(default_factory=list)
+    # 响应头
+    headers: Dict[str, str] = field(default_factory=dict)
+    # 原始响应体，断言和结果格式化共用其解析结果
+    payload: Optional[ResponseBody] = field(default=None, repr=False, compare=False)
+
+    def to_record(self) -> Dict[str, Any]:
+        """转换为录制文件中的响应记录"""
+        return {
+            'status_code': self.status_code,
+            'headers': self.headers,
+            'body': self.body,
+            'body_size': self.body_size,
+            'body_sha256': self.body_sha256,
+            'truncated': self.truncated,
+            'response_time': round(self.response_time, 6),
+            'timings': {phase: round(value, 6) for phase, value in self.timings.items()},
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> 'APIResponse':
+        """根据录制文件中的响应记录创建结果"""
+        return cls(
+            record['status_code'],
+            record.get('body', ''),
+            record.get('response_time', 0.0),
+            None,
+            dict(record.get('timings') or {}),
+            body_size=record.get('body_size', 0),
+            body_sha256=record.get('body_sha256', ''),
+            truncated=record.get('truncated', False),
+            headers=dict(record.get('headers') or {})
+        )
+
+    def as_tuple(self) -> Tuple[int, str, float, Optional[str]]:
+        """转换为 (状态码, 响应体, 响应时间, 错误信息) 元组"""
+        return self.status_code, self.body, self.response_time, self.error
+
+    def response_body(self) -> ResponseBody:
+        """响应体对象，没有原始字节时（回放、请求失败）由文本创建"""
+        if self.payload is None:
+            self.payload = ResponseBody.from_text(self.body)
+        return self.payload
+
+    def body_info(self) -> Dict[str, Any]:
+        """响应体的大小、摘要和截断信息"""
+        return {'size': self.body_size, 'sha256': self.body_sha256, 'truncated': self.truncated}
+
+
+class CappedBody:
+    """
+    按字节上限保留响应体
+    
+    只在内存中保留前max_bytes字节，超出部分仍参与大小统计和SHA-256计算，
+    避免超大响应体占满内存。
+    """
+    
+    def __init__(self, max_bytes: int = 0):
+        """
+        初始化响应体缓冲区
+        
+        Args:
+            max_bytes: 保留的最大字节数，0表示不限制
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._kept = bytearray()
+        self._digest = hashlib.sha256()
+    
+    def feed(self, chunk: bytes) -> None:
+        """写入一个数据块"""
+        self.size += len(chunk)
+        self._digest.update(chunk)
+        if not self.max_bytes:
+            self._kept += chunk
+        elif len(self._kept) < self.max_bytes:
+            self._kept += chunk[:self.max_bytes - len(self._kept)]
+    
+    @property
+    def truncated(self) -> bool:
+        """是否超过上限被截断"""
+        return self.size > len(self._kept)
+    
+    @property
+    def sha256(self) -> str:
+        """完整响应体的SHA-256十六进制摘要"""
+        return self._digest.hexdigest()
+    
+    def body(self, encoding: Optional[str] = None) -> ResponseBody:
+        """
+        生成保留部分的响应体对象
+        
+        Args:
+            encoding: 响应声明的编码，默认utf-8
+            
+        Returns:
+            ResponseBody对象
+        """
+        return ResponseBody(bytes(self._kept), encoding)
+    
+    def text(self, encoding: Optional[str] = None) -> str:
+        """
+        解码保留的响应体
+        
+        Args:
+            encoding: 响应声明的编码，默认utf-8
+            
+        Returns:
+            响应体文本（截断处不完整的字符被替换）
+        """
+        return self.body(encoding).text
+
 
 class APIClient:
     """HTTP API客户端"""
@@ -23,7 +212,12 @@ class APIClient:
         base_url: str = "",
         timeout: int = 30,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        cassette: Optional[Cassette] = None
     ):
         """
         初始化API客户端
@@ -32,13 +226,28 @@ class APIClient:
             base_url: 基础URL
             timeout: 请求超时时间(秒)
             max_retries: 最大重试次数
-            retry_delay: 重试延迟(秒)
+            retry_delay: 重试退避基准时间(秒)
+            max_body_bytes: 响应体保留的最大字节数，0表示不限制
+            retry_policy: 重试策略，默认按max_retries和retry_delay创建
+            pool_connections: 缓存连接池的主机数
+            pool_maxsize: 每个主机保留的最大长连接数，应不小于并发线程数
+            cassette: 录制文件，录制模式下保存响应，回放模式下不访问网络
         """
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_body_bytes = max_body_bytes
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries, base_delay=retry_delay)
+        self.pool_maxsize = pool_maxsize
+        self.cassette = cassette
+        self.prepared_cache = PreparedCaseCache()
         self.session = requests.Session()
+        
+        # 挂载分阶段计时适配器
+        adapter = TimingHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def send_request(
         self,
@@ -61,69 +270,171 @@ class APIClient:
         Returns:
             (状态码, 响应体, 响应时间, 错误信息)
         """
-        # 格式化URL
-        if self.base_url and not url.startswith('http'):
-            url = format_url(self.base_url, url)
+        return self.send_request_detailed(method, url, headers, data, params).as_tuple()
+    
+    def send_request_detailed(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Any = None,
+        params: Optional[Dict[str, str]] = None,
+        full_body: bool = False
+    ) -> APIResponse:
+        """
+        发送HTTP请求，返回包含分阶段耗时的结果
+        
+        Args:
+            method: HTTP方法
+            url: 请求URL
+            headers: 请求头
+            data: 请求体数据
+            params: URL参数
+            full_body: 是否保留完整响应体（忽略max_body_bytes）
+            
+        Returns:
+            APIResponse对象
+        """
+        prepared = compile_request(method, url, self.base_url, headers, data, params, full_body)
+        return self.send_prepared(prepared)
+    
+    def send_prepared(self, prepared: PreparedCase) -> APIResponse:
+        """
+        发送预编译的请求
+        
+        响应体流式读取，默认只保留前max_body_bytes字节，完整响应体的
+        大小和SHA-256记录在结果中。配置了录制文件时，录制模式下保存收到的响应，
+        回放模式下直接返回录制的响应（可按录制的响应时间等待）。
+        
+        Args:
+            prepared: 预编译请求
+            
+        Returns:
+            APIResponse对象
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            result = self._replay(self.cassette, prepared)
+            if self.cassette.simulate_latency and result.response_time > 0:
+                time.sleep(result.response_time)
+            return result
         
-        # 设置默认请求头
-        if headers is None:
-            headers = {}
+        result = self._send_with_retries(prepared)
+        # 只录制收到HTTP响应的请求，网络异常不录制
+        if self.cassette is not None and result.status_code and not result.error:
+            self.cassette.record(prepared, result.to_record())
+        return result
+    
+    @staticmethod
+    def _replay(cassette: Cassette, prepared: PreparedCase) -> APIResponse:
+        """从录制文件获取响应，未录制的请求返回错误结果"""
+        record = cassette.replay(prepared)
+        if record is None:
+            error_msg = f"录制文件中没有该请求: {prepared.method} {prepared.url}"
+            logger.error(error_msg)
+            return APIResponse(0, "", 0.0, error_msg)
         
-        if 'User-Agent' not in headers:
-            headers['User-Agent'] = 'lark-api-tester/1.0.0'
+        logger.info(f"回放{prepared.method}请求: {prepared.url}, 状态码: {record['status_code']}")
+        return APIResponse.from_record(record)
+    
+    def _send_with_retries(self, prepared: PreparedCase) -> APIResponse:
+        """发送请求，按重试策略重试"""
+        policy = self.retry_policy
+        policy.record_request()
+        attempts = []
+        attempt = 0
         
-        # 执行请求（带重试机制）
-        for attempt in range(self.max_retries + 1):
+        # 执行请求（按重试策略重试）
+        while True:
+            timings = new_timings()
+            response = None
+            failure = None
             try:
-                start_time = time.time()
+                logger.info(f"发送{prepared.method}请求到: {prepared.url}")
+                logger.debug(f"请求头: {prepared.headers}")
+                logger.debug(f"请求体: {prepared.body}")
                 
-                logger.info(f"发送{method}请求到: {url}")
-                logger.debug(f"请求头: {headers}")
-                logger.debug(f"请求体: {data}")
+                with collect_timings(timings):
+                    start_time = perf_counter()
+                    response = self.session.request(
+                        method=prepared.method,
+                        url=prepared.url,
+                        headers=prepared.header_dict(),
+                        data=prepared.body,
+                        timeout=self.timeout,
+                        stream=True
+                    )
+                    headers_received = perf_counter()
+                    body = CappedBody(0 if prepared.full_body else self.max_body_bytes)
+                    with response:
+                        for chunk in response.iter_content(chunk_size=BODY_CHUNK_SIZE):
+                            body.feed(chunk)
+                    finished = perf_counter()
                 
-                response = self.session.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=headers,
-                    json=data if isinstance(data, dict) else None,
-                    data=data if not isinstance(data, dict) else None,
-                    params=params,
-                    timeout=self.timeout
-                )
-                
-                response_time = time.time() - start_time
+                # 首字节时间为发出请求到收到响应头的耗时，扣除建立连接的各阶段
+                timings['ttfb'] = max(0.0, headers_received - start_time
+                                      - timings['dns'] - timings['connect'] - timings['tls'])
+                timings['download'] = finished - headers_received
+                timings['total'] = finished - start_time
+                response_time = timings['total']
                 
                 logger.info(f"响应状态码: {response.status_code}, 响应时间: {response_time:.3f}s")
+                if body.truncated:
+                    logger.warning(f"响应体共{body.size}字节，超过上限{body.max_bytes}字节，只保留前部分")
                 
-                return (
-                    response.status_code,
-                    response.text,
-                    response_time,
-                    None
+                payload = body.body(response.encoding)
+                result = APIResponse(
+                    response.status_code, payload.text, response_time, None, timings,
+                    body_size=body.size, body_sha256=body.sha256, truncated=body.truncated,
+                    headers=dict(response.headers), payload=payload
                 )
                 
-            except requests.exceptions.Timeout:
-                error_msg = f"请求超时 (attempt {attempt + 1}/{self.max_retries + 1})"
-                logger.warning(error_msg)
-                
-                if attempt == self.max_retries:
-                    return 0, "", 0.0, "请求超时"
-                
-                time.sleep(self.retry_delay * (attempt + 1))
-                
-            except requests.exceptions.ConnectionError:
-                error_msg = f"连接错误 (attempt {attempt + 1}/{self.max_retries + 1})"
-                logger.warning(error_msg)
-                
-                if attempt == self.max_retries:
-                    return 0, "", 0.0, "连接错误"
+            except requests.exceptions.Timeout as e:
+                failure = FAILURE_CONNECT if isinstance(e, requests.exceptions.ConnectTimeout) else FAILURE_TIMEOUT
+                result = APIResponse(0, "", 0.0, "请求超时", timings)
                 
-                time.sleep(self.retry_delay * (attempt + 1))
+            except requests.exceptions.ConnectionError as e:
+                failure = FAILURE_CONNECT if self._is_connect_failure(e) else FAILURE_CONNECTION
+                result = APIResponse(0, "", 0.0, "连接错误", timings)
                 
             except Exception as e:
                 error_msg = f"请求异常: {str(e)}"
                 logger.error(error_msg)
-                return 0, "", 0.0, error_msg
+                result = APIResponse(0, "", 0.0, error_msg, timings)
+                result.attempts = attempts + [self._attempt_record(attempt, result)]
+                return result
+            
+            attempts.append(self._attempt_record(attempt, result))
+            result.attempts = attempts
+            
+            status_code = None if failure else result.status_code
+            if not policy.should_retry(prepared, attempt, status_code, failure):
+                return result
+            
+            retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+            delay = policy.backoff(attempt, retry_after)
+            attempts[-1]['backoff'] = round(delay, 3)
+            logger.warning(
+                f"{result.error or f'状态码{result.status_code}'}，{delay:.2f}秒后重试 "
+                f"(attempt {attempt + 1}/{policy.max_retries + 1})"
+            )
+            time.sleep(delay)
+            attempt += 1
+    
+    @staticmethod
+    def _is_connect_failure(error: requests.exceptions.ConnectionError) -> bool:
+        """判断连接错误是否发生在建立连接阶段（请求尚未发出）"""
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    
+    @staticmethod
+    def _attempt_record(attempt: int, response: APIResponse) -> Dict[str, Any]:
+        """生成单次尝试的记录，耗时单位为毫秒"""
+        return {
+            'attempt': attempt + 1,
+            'status_code': response.status_code,
+            'error': response.error,
+            'timings': {phase: round(value * 1000, 2) for phase, value in response.timings.items()},
+        }
     
     def execute_test_case(self, test_case: Dict[str, Any]) -> Tuple[int, str, float, Optional[str]]:
         """
@@ -135,34 +446,114 @@ class APIClient:
         Returns:
             (状态码, 响应体, 响应时间, 错误信息)
         """
-        try:
-            # 提取测试用例信息
-            method = test_case.get('请求方法', 'GET').upper()
-            path = test_case.get('接口路径', '')
-            headers_str = test_case.get('请求头', '')
-            body_str = test_case.get('请求体', '')
+        return self.execute_test_case_detailed(test_case).as_tuple()
+    
+    def execute_test_case_detailed(
+        self,
+        test_case: Dict[str, Any],
+        variables: Optional[Dict[str, Any]] = None
+    ) -> APIResponse:
+        """
+        执行单个测试用例，返回包含分阶段耗时的结果
+        
+        用例按记录ID、请求字段和变量值的摘要编译为预编译请求并缓存，重复执行时不再解析。
+        勾选了"完整响应体"字段的用例保留完整响应体，不受max_body_bytes限制。
+        
+        Args:
+            test_case: 测试用例数据
+            variables: 代入请求字段的变量值
             
-            # 解析请求头和请求体
-            headers = parse_headers(headers_str)
-            body = parse_request_body(body_str)
+        Returns:
+            APIResponse对象
+        """
+        try:
+            # 相同用例只解析一次请求头和请求体
+            prepared = self.prepared_cache.get(test_case, self.base_url, variables)
             
             # 发送请求
-            return self.send_request(
-                method=method,
-                url=path,
-                headers=headers,
-                data=body
-            )
+            return self.send_prepared(prepared)
             
         except Exception as e:
             error_msg = f"执行测试用例失败: {str(e)}"
             logger.error(error_msg)
-            return 0, "", 0.0, error_msg
+            return APIResponse(0, "", 0.0, error_msg)
     
+    def warm_up(self, connections: Optional[int] = None, url: Optional[str] = None) -> int:
+        """
+        预先建立长连接并放入连接池
+
+        通过会话并发发送connections个HEAD请求，所有请求都收到响应后才读完响应、归还连接，
+        保证建立的是不同的连接；之后的请求直接复用这些连接，计时结果不包含建连耗时。
+        请求经过与正式请求相同的会话（包括证书校验、代理设置和响应读取），
+        不使用urllib3连接池的私有接口。
+
+        Args:
+            connections: 预建的连接数，默认且最多为pool_maxsize
+            url: 目标地址，默认为base_url
+
+        Returns:
+            成功建立的连接数
+        """
+        url = url or self.base_url
+        if not url or not url.startswith('http') or (self.cassette is not None and self.cassette.replaying):
+            return 0
+        count = min(connections or self.pool_maxsize, self.pool_maxsize)
+        if count <= 0:
+            return 0
+
+        try:
+            pool = self._connection_pool(url)
+            created_before = pool.num_connections
+        except Exception as e:
+            logger.warning(f"连接预热失败: {str(e)}")
+            return 0
+
+        # 每个请求拿到响应后先不读取（连接保持占用），全部请求都拿到响应后再读完归还，
+        # 避免先完成的请求归还的连接被后面的请求复用
+        barrier = threading.Barrier(count)
+
+        def send_head(_) -> bool:
+            try:
+                response = self.session.head(url, timeout=self.timeout, allow_redirects=False, stream=True)
+            except requests.RequestException as e:
+                logger.debug(f"预热连接失败: {str(e)}")
+                barrier.abort()
+                return False
+            try:
+                barrier.wait(timeout=self.timeout)
+            except threading.BrokenBarrierError:
+                pass
+            # 读完响应后requests将连接归还连接池
+            response.content
+            return response.headers.get('Connection', '').lower() != 'close'
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            kept = sum(executor.map(send_head, range(count)))
+        opened = min(kept, pool.num_connections - created_before)
+
+        if opened < count:
+            logger.warning(f"连接预热: {opened}/{count} 个连接建立成功 ({url})")
+        else:
+            logger.info(f"连接预热: 已建立 {opened} 个连接 ({url})")
+        return opened
+
+    def _connection_pool(self, url: str):
+        """获取requests发送该URL时使用的urllib3连接池"""
+        adapter = self.session.get_adapter(url)
+        settings = self.session.merge_environment_settings(url, {}, None, self.session.verify, None)
+        if hasattr(adapter, 'get_connection_with_tls_context'):
+            request = requests.Request('GET', url).prepare()
+            return adapter.get_connection_with_tls_context(
+                request, settings['verify'], settings['proxies'], settings['cert']
+            )
+        return adapter.get_connection(url, settings['proxies'])
+
     def close(self):
-        """关闭会话"""
+        """关闭会话和录制文件"""
         if self.session:
             self.session.close()
+        if self.cassette is not None:
+            self.cassette.close()
     
     def __enter__(self):
         return self
@@ -177,18 +568,20 @@ class AssertionValidator:
     @staticmethod
     def validate_response(
         response_status: int,
-        response_body: str,
+        response_body: Union[str, ResponseBody],
         expected_status: Optional[str] = None,
-        assertion_rules: Optional[str] = None
+        assertion_rules: Optional[str] = None,
+        response_doc: Any = None
     ) -> Tuple[bool, str]:
         """
         验证响应结果
         
         Args:
             response_status: 实际状态码
-            response_body: 实际响应体
+            response_body: 实际响应体或ResponseBody（与格式化共用解析结果）
             expected_status: 预期状态码
             assertion_rules: 断言规则
+            response_doc: 文本响应体的parse_json结果，为None时按需解析
             
         Returns:
             (是否通过, 错误信息)
@@ -200,11 +593,13 @@ class AssertionValidator:
                 if response_status != expected_code:
                     return False, f"状态码不匹配: 期望{expected_code}, 实际{response_status}"
             
-            # 验证断言规则
+            # 验证断言规则（按规则文本缓存编译结果）
             if assertion_rules:
-                is_valid, error = AssertionValidator._execute_assertion(
-                    response_body, assertion_rules
-                )
+                try:
+                    assertion = compile_assertion(assertion_rules)
+                except AssertionSyntaxError as e:
+                    return False, f"断言规则语法错误: {str(e)}"
+                is_valid, error = assertion.evaluate(response_status, response_body, response_doc)
                 if not is_valid:
                     return False, f"断言失败: {error}"
             
@@ -214,45 +609,71 @@ class AssertionValidator:
             return False, f"验证异常: {str(e)}"
     
     @staticmethod
-    def _execute_assertion(response_body: str, assertion_rule: str) -> Tuple[bool, str]:
+    def extract_value(response_body: str, path: str, response_doc: Any = None) -> Any:
         """
-        执行断言规则
+        按JSON路径从响应体中取值
         
         Args:
             response_body: 响应体
-            assertion_rule: 断言规则
+            path: JSON路径，如 $.data.token 或 data.token（编译结果按路径缓存）
+            response_doc: 响应体的parse_json结果，为None时解析response_body
             
         Returns:
-            (是否通过, 错误信息)
+            路径的值，路径不存在或响应体不是JSON时返回None
         """
-        try:
-            # 简单的断言规则解析和执行
-            # 支持格式: status_code == 200, body contains "success"
-            
-            if 'contains' in assertion_rule:
-                # 包含检查
-                parts = assertion_rule.split('contains')
-                if len(parts) == 2:
-                    expected_text = parts[1].strip().strip('"\'')
-                    if expected_text not in response_body:
-                        return False, f"响应体不包含: {expected_text}"
-            
-            elif '==' in assertion_rule:
-                # 等于检查
-                parts = assertion_rule.split('==')
-                if len(parts) == 2:
-                    field = parts[0].strip()
-                    expected = parts[1].strip().strip('"\'')
-                    
-                    if field == 'status_code':
-                        # 状态码已在上层验证
-                        pass
-                    else:
-                        # 其他字段检查（简化版）
-                        if expected not in response_body:
-                            return False, f"字段{field}值不匹配"
+        doc = parse_json(response_body) if response_doc is None else response_doc
+        return compile_path(path).get(doc)
+    
+    @staticmethod
+    def extract_latency_budgets(
+        assertion_rules: Optional[str],
+        budget_ms: Any = None
+    ) -> Tuple[Optional[str], List[Tuple[str, float]]]:
+        """
+        获取断言规则中的响应时间断言
+        
+        响应时间断言由编译后的规则收集，支持文本形式 "response_time < 300ms"
+        （单位ms或s，默认ms）和JSON形式 {"response_time": "< 1000"}（毫秒）。
+        响应时间上限字段的值视为 "<= 上限"。
+        
+        Args:
+            assertion_rules: 断言规则
+            budget_ms: 响应时间上限字段的值(毫秒)
             
-            return True, ""
+        Returns:
+            (功能断言规则, [(运算符, 毫秒), ...])；规则中只有响应时间断言时功能断言规则为None，
+            规则语法错误时原样返回，由validate_response报告
+        """
+        budgets = []
+        if budget_ms not in (None, ''):
+            budgets.append(('<=', float(budget_ms)))
+        
+        if not assertion_rules or 'response_time' not in assertion_rules:
+            return assertion_rules, budgets
+        
+        try:
+            assertion = compile_assertion(assertion_rules)
+        except AssertionSyntaxError:
+            return assertion_rules, budgets
+        
+        # 响应时间断言在功能断言执行时视为成立，规则无需改写
+        budgets.extend(assertion.latency_budgets)
+        return (assertion_rules if assertion.has_checks else None), budgets
+    
+    @staticmethod
+    def validate_response_time(response_time: float, budgets: List[Tuple[str, float]]) -> Tuple[bool, str]:
+        """
+        验证响应时间断言
+        
+        Args:
+            response_time: 响应时间(秒)
+            budgets: [(运算符, 毫秒), ...]
             
-        except Exception as e:
-            return False, f"断言执行异常: {str(e)}"
\ No newline at end of file
+        Returns:
+            (是否通过, 错误信息)
+        """
+        elapsed_ms = response_time * 1000
+        for op, limit_ms in budgets:
+            if not _LATENCY_OPERATORS[op](elapsed_ms, limit_ms):
+                return False, f"响应时间{elapsed_ms:.0f}ms, 要求{op} {limit_ms:g}ms"
+        return True, ""
@@ -0,0 +1,623 @@
+"""
+异步HTTP客户端模块
+
+基于asyncio和aiohttp的APIClient与LarkClient异步版本，
+返回值约定与同步客户端保持一致，适合单个事件循环驱动大量并发请求。
+
+需要安装可选依赖: pip install lark-api-tester[async]
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - 可选依赖
+    aiohttp = None
+
+from .api_client import APIClient, APIResponse, CappedBody, BODY_CHUNK_SIZE, DEFAULT_MAX_BODY_BYTES
+from .cassette import Cassette
+from .prepared_request import PreparedCase, PreparedCaseCache, compile_request
+from .retry_policy import RetryPolicy, parse_retry_after, FAILURE_CONNECT, FAILURE_CONNECTION, FAILURE_TIMEOUT
+from .lark_client import LarkResponse, BatchResult, LarkClient
+from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
+
+logger = get_logger(__name__)
+
+
+def _require_aiohttp() -> None:
+    """检查aiohttp是否可用"""
+    if aiohttp is None:
+        raise ImportError("异步客户端需要安装aiohttp: pip install lark-api-tester[async]")
+
+
+class AsyncAPIClient:
+    """异步HTTP API客户端"""
+
+    def __init__(
+        self,
+        base_url: str = "",
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        retry_policy: Optional[RetryPolicy] = None,
+        cassette: Optional[Cassette] = None
+    ):
+        """
+        初始化异步API客户端
+
+        Args:
+            base_url: 基础URL
+            timeout: 请求超时时间(秒)
+            max_retries: 最大重试次数
+            retry_delay: 重试退避基准时间(秒)
+            max_connections: 连接池总连接数上限
+            max_connections_per_host: 每个主机的连接数上限，0表示不限制
+            max_body_bytes: 响应体保留的最大字节数，0表示不限制
+            retry_policy: 重试策略，默认按max_retries和retry_delay创建
+            cassette: 录制文件，录制模式下保存响应，回放模式下不访问网络
+        """
+        _require_aiohttp()
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_body_bytes = max_body_bytes
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries, base_delay=retry_delay)
+        self.cassette = cassette
+        self.prepared_cache = PreparedCaseCache()
+        self.session: Optional['aiohttp.ClientSession'] = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """获取会话（aiohttp会话需要在事件循环中创建）"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self.session
+
+    async def send_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Any = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str, float, Optional[str]]:
+        """
+        发送HTTP请求
+
+        Args:
+            method: HTTP方法
+            url: 请求URL
+            headers: 请求头
+            data: 请求体数据
+            params: URL参数
+
+        Returns:
+            (状态码, 响应体, 响应时间, 错误信息)
+        """
+        response = await self.send_request_detailed(method, url, headers, data, params)
+        return response.as_tuple()
+
+    async def send_request_detailed(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Any = None,
+        params: Optional[Dict[str, str]] = None,
+        full_body: bool = False
+    ) -> APIResponse:
+        """
+        发送HTTP请求，响应体按max_body_bytes流式截断
+
+        Args:
+            method: HTTP方法
+            url: 请求URL
+            headers: 请求头
+            data: 请求体数据
+            params: URL参数
+            full_body: 是否保留完整响应体（忽略max_body_bytes）
+
+        Returns:
+            APIResponse对象（不包含分阶段耗时）
+        """
+        prepared = compile_request(method, url, self.base_url, headers, data, params, full_body)
+        return await self.send_prepared(prepared)
+
+    async def send_prepared(self, prepared: PreparedCase) -> APIResponse:
+        """
+        发送预编译的请求，录制回放行为与APIClient.send_prepared一致
+
+        Args:
+            prepared: 预编译请求
+
+        Returns:
+            APIResponse对象（不包含分阶段耗时）
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            result = APIClient._replay(self.cassette, prepared)
+            if self.cassette.simulate_latency and result.response_time > 0:
+                await asyncio.sleep(result.response_time)
+            return result
+
+        result = await self._send_with_retries(prepared)
+        if self.cassette is not None and result.status_code and not result.error:
+            self.cassette.record(prepared, result.to_record())
+        return result
+
+    async def _send_with_retries(self, prepared: PreparedCase) -> APIResponse:
+        """发送请求，按重试策略重试"""
+        session = self._get_session()
+        policy = self.retry_policy
+        policy.record_request()
+        attempts = []
+        attempt = 0
+
+        # 执行请求（按重试策略重试）
+        while True:
+            retry_after = None
+            failure = None
+            try:
+                start_time = time.time()
+
+                logger.info(f"发送{prepared.method}请求到: {prepared.url}")
+                logger.debug(f"请求头: {prepared.headers}")
+                logger.debug(f"请求体: {prepared.body}")
+
+                async with session.request(
+                    method=prepared.method,
+                    url=prepared.url,
+                    headers=prepared.header_dict(),
+                    data=prepared.body
+                ) as response:
+                    body = CappedBody(0 if prepared.full_body else self.max_body_bytes)
+                    async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+                        body.feed(chunk)
+                    payload = body.body(response.charset)
+                    response_headers = dict(response.headers)
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+                response_time = time.time() - start_time
+
+                logger.info(f"响应状态码: {response.status}, 响应时间: {response_time:.3f}s")
+                if body.truncated:
+                    logger.warning(f"响应体共{body.size}字节，超过上限{body.max_bytes}字节，只保留前部分")
+
+                result = APIResponse(
+                    response.status, payload.text, response_time, None,
+                    timings={'total': response_time},
+                    body_size=body.size, body_sha256=body.sha256, truncated=body.truncated,
+                    headers=response_headers, payload=payload
+                )
+
+            except asyncio.TimeoutError:
+                failure = FAILURE_TIMEOUT
+                result = APIResponse(0, "", 0.0, "请求超时")
+
+            except aiohttp.ClientConnectorError:
+                failure = FAILURE_CONNECT
+                result = APIResponse(0, "", 0.0, "连接错误")
+
+            except aiohttp.ClientConnectionError:
+                failure = FAILURE_CONNECTION
+                result = APIResponse(0, "", 0.0, "连接错误")
+
+            except Exception as e:
+                error_msg = f"请求异常: {str(e)}"
+                logger.error(error_msg)
+                result = APIResponse(0, "", 0.0, error_msg)
+                result.attempts = attempts + [APIClient._attempt_record(attempt, result)]
+                return result
+
+            attempts.append(APIClient._attempt_record(attempt, result))
+            result.attempts = attempts
+
+            status_code = None if failure else result.status_code
+            if not policy.should_retry(prepared, attempt, status_code, failure):
+                return result
+
+            delay = policy.backoff(attempt, retry_after)
+            attempts[-1]['backoff'] = round(delay, 3)
+            logger.warning(
+                f"{result.error or f'状态码{result.status_code}'}，{delay:.2f}秒后重试 "
+                f"(attempt {attempt + 1}/{policy.max_retries + 1})"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def execute_test_case(self, test_case: Dict[str, Any]) -> Tuple[int, str, float, Optional[str]]:
+        """
+        执行单个测试用例
+
+        Args:
+            test_case: 测试用例数据
+
+        Returns:
+            (状态码, 响应体, 响应时间, 错误信息)
+        """
+        response = await self.execute_test_case_detailed(test_case)
+        return response.as_tuple()
+
+    async def execute_test_case_detailed(
+        self,
+        test_case: Dict[str, Any],
+        variables: Optional[Dict[str, Any]] = None
+    ) -> APIResponse:
+        """
+        执行单个测试用例，返回包含响应体信息的结果
+
+        Args:
+            test_case: 测试用例数据
+            variables: 代入请求字段的变量值
+
+        Returns:
+            APIResponse对象
+        """
+        try:
+            prepared = self.prepared_cache.get(test_case, self.base_url, variables)
+            return await self.send_prepared(prepared)
+
+        except Exception as e:
+            error_msg = f"执行测试用例失败: {str(e)}"
+            logger.error(error_msg)
+            return APIResponse(0, "", 0.0, error_msg)
+
+    async def close(self):
+        """关闭会话和录制文件"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        if self.cassette is not None:
+            self.cassette.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncLarkClient:
+    """
+    异步Lark多维表格客户端
+
+    认证方式和接口路径与LarkClient一致，覆盖测试执行所需的记录读写操作。
+    """
+
+    BATCH_LIMIT = LarkClient.BATCH_LIMIT
+
+    def __init__(self, personal_token: str, app_token: str, domain: str = None, use_international: bool = False,
+                 qps: float = LarkClient.DEFAULT_QPS, rate_limiter: Optional[TokenBucket] = None):
+        """
+        初始化异步Lark客户端
+
+        Args:
+            personal_token: 个人授权码（pt-开头格式）
+            app_token: 应用Token
+            domain: API域名，默认使用原始baseopensdk域名
+            use_international: 是否使用国际版域名
+            qps: 请求频率上限（次/秒），小于等于0表示不限流
+            rate_limiter: 共享的限流器，优先于qps
+        """
+        _require_aiohttp()
+        self.personal_token = personal_token.strip()
+        self.app_token = app_token.strip()
+
+        if not self.personal_token.startswith('pt-'):
+            raise ValueError('personal_token必须以"pt-"开头（多维表格授权码格式）')
+
+        if domain:
+            self.domain = domain
+        elif use_international:
+            self.domain = LarkClient.INTERNATIONAL_DOMAIN
+        else:
+            self.domain = LarkClient.LARK_DOMAIN
+
+        self.headers = {
+            'Authorization': f'Bearer {self.personal_token}',
+            'User-Agent': 'base-open-sdk-python/v1.0.0'
+        }
+        self.session: Optional['aiohttp.ClientSession'] = None
+        self.rate_limiter = rate_limiter or TokenBucket(qps)
+        self.logger = logging.getLogger(__name__)
+
+    def _build_url(self, endpoint: str) -> str:
+        """构建完整API URL"""
+        return urljoin(self.domain + '/', endpoint.lstrip('/'))
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """获取会话（aiohttp会话需要在事件循环中创建）"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self.session
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> LarkResponse:
+        """
+        统一的HTTP请求处理方法（限流与退避策略与LarkClient一致）
+
+        Args:
+            method: HTTP方法
+            endpoint: API端点路径
+            **kwargs: 传递给aiohttp的额外参数
+
+        Returns:
+            LarkResponse对象
+        """
+        for attempt in range(LarkClient.MAX_RATE_LIMIT_RETRIES + 1):
+            wait = self.rate_limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            lark_resp, retry_after = await self._send_once(method, endpoint, **kwargs)
+
+            if retry_after is None:
+                return lark_resp
+            if attempt == LarkClient.MAX_RATE_LIMIT_RETRIES:
+                self.logger.error(f"频率限制重试次数已用尽: {method} {endpoint} "
+                                  f"(attempts {attempt + 1}/{LarkClient.MAX_RATE_LIMIT_RETRIES + 1})")
+                return lark_resp
+
+            backoff = retry_after if retry_after > 0 else min(2 ** attempt, 30)
+            self.logger.warning(f"触发频率限制，{backoff:.1f}秒后重试 "
+                                f"(attempt {attempt + 1}/{LarkClient.MAX_RATE_LIMIT_RETRIES + 1})")
+            self.rate_limiter.pause(backoff)
+
+        return lark_resp
+
+    async def _send_once(self, method: str, endpoint: str, **kwargs) -> Tuple[LarkResponse, Optional[float]]:
+        """
+        发送单次请求
+
+        Args:
+            method: HTTP方法
+            endpoint: API端点路径
+            **kwargs: 传递给aiohttp的额外参数
+
+        Returns:
+            (LarkResponse对象, 限流时建议的等待秒数；未限流为None)
+        """
+        url = self._build_url(endpoint)
+
+        try:
+            self.logger.debug(f"发起请求: {method} {url}")
+
+            async with self._get_session().request(method, url, **kwargs) as response:
+                response_text = await response.text(errors='replace')
+                status = response.status
+                retry_after = LarkClient._get_retry_after(response)
+
+            if status != 200:
+                error_msg = f"HTTP {status}: {response_text}"
+                lark_resp = LarkResponse(code=status, message=error_msg, success=False)
+                if status == 429:
+                    return lark_resp, retry_after
+                self.logger.error(error_msg)
+                return lark_resp, None
+
+            try:
+                lark_resp = LarkResponse.from_dict(json.loads(response_text))
+            except json.JSONDecodeError as e:
+                error_msg = f"JSON解析失败: {str(e)}"
+                self.logger.error(error_msg)
+                return LarkResponse(code=-1, message=error_msg, success=False), None
+
+            if lark_resp.code in LarkClient.RATE_LIMIT_CODES:
+                return lark_resp, retry_after
+
+            if not lark_resp.success:
+                self.logger.warning(f"API错误: {lark_resp.code} - {lark_resp.message}")
+            return lark_resp, None
+
+        except asyncio.TimeoutError:
+            error_msg = "请求超时"
+            self.logger.error(error_msg)
+            return LarkResponse(code=-1, message=error_msg, success=False), None
+
+        except aiohttp.ClientError as e:
+            error_msg = f"请求异常: {str(e)}"
+            self.logger.error(error_msg)
+            return LarkResponse(code=-1, message=error_msg, success=False), None
+
+    async def get_all_records(self, table_id: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        获取表格所有记录（自动处理分页）
+
+        Args:
+            table_id: 表格ID
+            page_size: 每页记录数（最大200，默认100）
+
+        Returns:
+            包含所有记录的列表
+        """
+        all_records = []
+        page_token = ""
+        page_size = min(page_size, 200)
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records"
+
+        while True:
+            params = {'page_size': page_size}
+            if page_token:
+                params['page_token'] = page_token
+
+            response = await self._make_request('GET', endpoint, params=params)
+
+            if not response.success:
+                self.logger.error(f"获取记录失败: {response.message}")
+                break
+
+            for record in (response.data or {}).get('items') or []:
+                all_records.append({
+                    'record_id': record.get('record_id', ''),
+                    'fields': record.get('fields', {})
+                })
+
+            if not response.data or not response.data.get('has_more', False):
+                break
+
+            page_token = response.data.get('page_token', '')
+            if not page_token:
+                break
+
+        self.logger.info(f"成功获取 {len(all_records)} 条记录")
+        return all_records
+
+    async def get_record_by_id(self, table_id: str, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        根据记录ID获取单条记录
+
+        Args:
+            table_id: 表格ID
+            record_id: 记录ID
+
+        Returns:
+            记录信息或None
+        """
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records/{record_id}"
+        response = await self._make_request('GET', endpoint)
+
+        if response.success and response.data and 'record' in response.data:
+            record_data = response.data['record']
+            return {
+                'record_id': record_data.get('record_id', ''),
+                'fields': record_data.get('fields', {})
+            }
+
+        return None
+
+    async def update_record(self, table_id: str, record_id: str, fields: Dict[str, Any]) -> bool:
+        """
+        更新指定记录
+
+        Args:
+            table_id: 表格ID
+            record_id: 记录ID
+            fields: 要更新的字段字典
+
+        Returns:
+            更新是否成功
+        """
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records/{record_id}"
+        response = await self._make_request('PUT', endpoint, json={'fields': fields})
+
+        if not response.success:
+            self.logger.error(f"更新记录失败: {response.message}")
+        return response.success
+
+    async def batch_update_records(self, table_id: str, updates: List[Dict[str, Any]]) -> BatchResult:
+        """
+        批量更新记录（按500条自动分块，各分块并发提交）
+
+        Args:
+            table_id: 表格ID
+            updates: 更新列表，每项格式为 {'record_id': ..., 'fields': {...}}
+
+        Returns:
+            BatchResult，包含成功的记录ID和失败记录ID到错误信息的映射
+        """
+        result = BatchResult()
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records/batch_update"
+        chunks = [updates[i:i + self.BATCH_LIMIT] for i in range(0, len(updates), self.BATCH_LIMIT)]
+
+        responses = await asyncio.gather(*[
+            self._make_request('POST', endpoint, json={
+                'records': [{'record_id': u['record_id'], 'fields': u['fields']} for u in chunk]
+            })
+            for chunk in chunks
+        ])
+
+        for chunk, response in zip(chunks, responses):
+            if not response.success:
+                self.logger.error(f"批量更新记录分块失败 ({len(chunk)} 条): {response.message}")
+            result.add_chunk([u['record_id'] for u in chunk], response)
+
+        self.logger.info(f"批量更新记录完成: 成功{len(result.succeeded)}/{len(updates)}")
+        return result
+
+    async def list_fields(self, table_id: str) -> List[Dict[str, Any]]:
+        """
+        获取表格所有字段信息
+
+        Args:
+            table_id: 表格ID
+
+        Returns:
+            字段信息列表
+        """
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/fields"
+        fields = []
+        page_token = ""
+
+        while True:
+            params = {'page_size': 100}
+            if page_token:
+                params['page_token'] = page_token
+
+            response = await self._make_request('GET', endpoint, params=params)
+
+            if not (response.success and response.data and 'items' in response.data):
+                self.logger.error(f"获取字段列表失败: {response.message}")
+                return []
+
+            fields.extend(response.data['items'] or [])
+
+            page_token = response.data.get('page_token', '') if response.data.get('has_more') else ''
+            if not page_token:
+                break
+
+        return fields
+
+    async def ensure_field_exists(self, table_id: str, field_name: str, field_type: int) -> Optional[Dict[str, Any]]:
+        """
+        确保字段存在，如果不存在则创建
+
+        Args:
+            table_id: 表格ID
+            field_name: 字段名称
+            field_type: 字段类型
+
+        Returns:
+            字段信息或None
+        """
+        for field_info in await self.list_fields(table_id):
+            if field_info.get('field_name') == field_name:
+                return field_info
+
+        self.logger.info(f"字段不存在，正在创建: {field_name}")
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/fields"
+        response = await self._make_request('POST', endpoint, json={'field_name': field_name, 'type': field_type})
+
+        if response.success and response.data and 'field' in response.data:
+            return response.data['field']
+
+        self.logger.error(f"创建字段失败: {response.message}")
+        return None
+
+    async def close(self):
+        """关闭会话"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
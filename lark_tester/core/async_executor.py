@@ -0,0 +1,298 @@
+"""
+异步测试执行器模块
+
+使用单个事件循环并发执行测试用例，用例校验和结果生成逻辑与TestExecutor共用
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlparse
+
+from .async_client import AsyncAPIClient, AsyncLarkClient
+from .dependency import AsyncDependencyScheduler, EXTRACT_FIELD, extract_variables
+from .test_executor import (
+    TestResults, RESULT_FIELD_TYPES, prepare_test_case, build_test_result, adapt_result_fields,
+    invalid_case_result, result_snapshot, select_changed_fields, RESULT_FIELDS
+)
+from ..utils.logger import get_logger
+from ..utils.formatter import format_test_result, format_url, replace_variables
+from ..utils.response_body import DEFAULT_PREVIEW_LENGTH
+
+logger = get_logger(__name__)
+
+
+class AsyncTestExecutor:
+    """
+    异步API测试执行器
+
+    与TestExecutor不同，执行前一次性读取整张用例表，用例不随分页到达即开始执行，
+    也不使用本地记录缓存（配置的record_cache_path会被忽略）。用例表很大或需要增量
+    同步时请使用TestExecutor。
+    """
+
+    def __init__(
+        self,
+        lark_client: AsyncLarkClient,
+        api_client: Optional[AsyncAPIClient] = None,
+        config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        初始化异步测试执行器
+
+        Args:
+            lark_client: 异步Lark客户端实例
+            api_client: 异步API客户端实例
+            config: 配置字典（concurrency为同时在途的请求数上限）
+        """
+        self.lark_client = lark_client
+        self.api_client = api_client or AsyncAPIClient()
+        self.config = config or {}
+        self.test_results = []
+        # 加载时读取的记录字段，回写时用于跳过未变化的字段
+        self._loaded_fields: Dict[str, Dict[str, Any]] = {}
+        # 最近一次回写的统计
+        self.write_stats: Dict[str, int] = {}
+        if self.config.get('record_cache_path'):
+            logger.warning("异步执行不使用本地记录缓存，record_cache_path将被忽略")
+
+    async def load_test_cases(self, table_id: str) -> List[Dict[str, Any]]:
+        """
+        从表格加载测试用例
+
+        Args:
+            table_id: 表格ID
+
+        Returns:
+            测试用例列表
+        """
+        logger.info(f"从表格 {table_id} 加载测试用例...")
+
+        try:
+            records = await self.lark_client.get_all_records(table_id)
+            logger.info(f"成功加载 {len(records)} 条记录")
+
+            valid_cases = []
+            for record in records:
+                test_case = prepare_test_case(record)
+                if test_case is not None:
+                    valid_cases.append(test_case)
+                    self._loaded_fields[test_case['_record_id']] = result_snapshot(test_case)
+
+            logger.info(f"测试用例: {len(valid_cases)} 条")
+            return valid_cases
+
+        except Exception as e:
+            logger.error(f"加载测试用例失败: {str(e)}")
+            return []
+
+    async def execute_single_test(
+        self,
+        test_case: Dict[str, Any],
+        variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        执行单个测试用例
+
+        Args:
+            test_case: 测试用例数据
+            variables: 代入请求字段的变量值（上游用例提取的变量）
+
+        Returns:
+            测试结果数据
+        """
+        test_id = test_case.get('接口编号', 'unknown')
+        invalid = invalid_case_result(test_case)
+        if invalid is not None:
+            logger.info(f"测试用例 {test_id} 验证失败，不执行: FAIL")
+            return invalid
+        logger.debug(f"执行测试用例: {test_id}")
+
+        try:
+            response = await self.api_client.execute_test_case_detailed(test_case, variables)
+            result = build_test_result(
+                test_case, response.status_code, response.response_body(), response.response_time, response.error,
+                body_info=response.body_info() if not response.error else None,
+                attempts=response.attempts,
+                max_length=int(self.config.get('max_response_length', DEFAULT_PREVIEW_LENGTH))
+            )
+            if not response.error and test_case.get(EXTRACT_FIELD):
+                result['_variables'] = extract_variables(test_case, response.response_body())
+
+            logger.info(f"测试用例 {test_id} 执行完成: {result.get('是否通过')}")
+            return result
+
+        except Exception as e:
+            error_msg = f"执行测试用例异常: {str(e)}"
+            logger.error(error_msg)
+
+            result = format_test_result(
+                status_code=0,
+                response_body="",
+                response_time=None,
+                is_passed=False,
+                error_message=error_msg
+            )
+            result['_record_id'] = test_case.get('_record_id')
+            return result
+
+    async def execute_all_tests(self, table_id: str) -> TestResults:
+        """
+        并发执行所有测试用例，引用其他用例提取变量的用例在其上游完成后执行
+
+        Args:
+            table_id: 表格ID
+
+        Returns:
+            测试结果统计
+        """
+        logger.info("开始执行所有测试用例...")
+        start_time = time.time()
+
+        test_cases = await self.load_test_cases(table_id)
+        if not test_cases:
+            logger.warning("没有找到有效的测试用例")
+            return TestResults([], 0, 0, 0, 0.0)
+
+        concurrency = max(1, int(self.config.get('concurrency', 100) or 1))
+        max_per_host = self.config.get('max_in_flight_per_host') or concurrency
+        request_delay = self.config.get('request_delay', 0)
+
+        limit = asyncio.Semaphore(concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        host_next_start: Dict[str, float] = {}
+
+        async def run(test_case: Dict[str, Any], variables: Dict[str, Any]) -> Dict[str, Any]:
+            host = self._get_target_host(test_case, variables)
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(max_per_host))
+
+            async with limit, host_limit:
+                if request_delay > 0:
+                    # 事件循环单线程执行，读写下次发起时间无需加锁
+                    now = time.monotonic()
+                    start_at = max(now, host_next_start.get(host, 0.0))
+                    host_next_start[host] = start_at + request_delay
+                    if start_at > now:
+                        await asyncio.sleep(start_at - now)
+                return await self.execute_single_test(test_case, variables)
+
+        logger.info(f"异步执行测试用例: {len(test_cases)} 条, 最大并发 {concurrency}")
+        # 结果顺序与表格一致
+        results = await AsyncDependencyScheduler(run).run(test_cases)
+
+        passed_count = sum(1 for result in results if result.get('是否通过') == 'PASS')
+        failed_count = len(results) - passed_count
+        total_time = time.time() - start_time
+
+        self.test_results = results
+
+        logger.info(f"所有测试执行完成: 总数{len(test_cases)}, 通过{passed_count}, 失败{failed_count}")
+        logger.info(f"总耗时: {total_time:.2f}秒")
+
+        return TestResults(results, len(test_cases), passed_count, failed_count, total_time)
+
+    def _get_target_host(self, test_case: Dict[str, Any], variables: Optional[Dict[str, Any]] = None) -> str:
+        """获取测试用例请求的目标主机"""
+        path = replace_variables(test_case.get('接口路径', ''), variables)
+        url = format_url(self.api_client.base_url, path) if self.api_client.base_url else path
+        return urlparse(url).netloc
+
+    async def write_results_to_table(self, table_id: str, results: List[Dict[str, Any]]) -> bool:
+        """
+        将测试结果批量回写到表格
+
+        Args:
+            table_id: 表格ID
+            results: 测试结果列表
+
+        Returns:
+            是否写入成功
+        """
+        logger.info(f"将测试结果回写到表格 {table_id}...")
+
+        try:
+            # 确保结果中用到的新增结果字段存在
+            field_infos = {}
+            for field_name, field_type in RESULT_FIELD_TYPES.items():
+                if any(field_name in result for result in results):
+                    field_infos[field_name] = await self.lark_client.ensure_field_exists(
+                        table_id, field_name, field_type
+                    )
+
+            updates = []
+            skip_unchanged = self.config.get('skip_unchanged_writes', True)
+            skipped_records = 0
+            skipped_fields = 0
+
+            for result in results:
+                record_id = result.get('_record_id')
+                if not record_id:
+                    logger.warning("结果缺少记录ID，跳过更新")
+                    continue
+
+                update_fields = adapt_result_fields(
+                    {k: v for k, v in result.items() if not k.startswith('_')}, field_infos
+                )
+
+                # 只回写与表格当前值不同的字段
+                if skip_unchanged:
+                    changed_fields = select_changed_fields(update_fields, self._loaded_fields.get(record_id))
+                    skipped_fields += len(update_fields) - len(changed_fields or {})
+                    if changed_fields is None:
+                        skipped_records += 1
+                        continue
+                    update_fields = changed_fields
+
+                updates.append({'record_id': record_id, 'fields': update_fields})
+
+            success_count = 0
+            if updates:
+                batch_result = await self.lark_client.batch_update_records(table_id, updates)
+                for record_id, error in batch_result.failed.items():
+                    logger.error(f"更新记录失败 {record_id}: {error}")
+
+                succeeded = set(batch_result.succeeded)
+                success_count = len(succeeded)
+                for update in updates:
+                    loaded = self._loaded_fields.get(update['record_id'])
+                    if update['record_id'] in succeeded and loaded is not None:
+                        loaded.update((k, v) for k, v in update['fields'].items() if k in RESULT_FIELDS)
+
+            self.write_stats = {
+                'written': success_count,
+                'skipped_records': skipped_records,
+                'skipped_fields': skipped_fields
+            }
+
+            if skip_unchanged:
+                logger.info(f"跳过未变化的回写: {skipped_records}条记录, {skipped_fields}个字段")
+            logger.info(f"结果回写完成: 成功{success_count}/{len(updates)}")
+            return success_count == len(updates)
+
+        except Exception as e:
+            logger.error(f"回写结果失败: {str(e)}")
+            return False
+
+    async def run_full_test_cycle(self, table_id: str) -> TestResults:
+        """
+        运行完整的测试周期：加载->执行->回写
+
+        Args:
+            table_id: 表格ID
+
+        Returns:
+            测试结果统计
+        """
+        logger.info("开始完整测试周期...")
+
+        results = await self.execute_all_tests(table_id)
+
+        if results.results:
+            success = await self.write_results_to_table(table_id, results.results)
+            results.writes_skipped = self.write_stats.get('skipped_records', 0)
+            if success:
+                logger.info("测试结果已成功回写到表格")
+            else:
+                logger.warning("部分测试结果回写失败")
+
+        return results
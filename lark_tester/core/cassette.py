@@ -0,0 +1,186 @@
+"""
+请求录制回放模块
+
+录制模式下把每个预编译请求的响应（状态码、响应头、响应体、耗时）追加写入磁盘上的录制文件；
+回放模式下按预编译请求从录制文件返回响应而不访问网络，可选按录制的耗时等待，
+用于无网络环境下的确定性执行和测量框架自身的开销
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Any, IO, Optional, Set
+
+from .prepared_request import PreparedCase
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 录制回放模式
+MODE_OFF = 'off'
+MODE_RECORD = 'record'
+MODE_REPLAY = 'replay'
+CASSETTE_MODES = (MODE_OFF, MODE_RECORD, MODE_REPLAY)
+
+
+def cassette_key(prepared: PreparedCase) -> str:
+    """
+    计算预编译请求的录制键
+
+    由请求方法、URL、请求头（名称不区分大小写，与顺序无关）、请求体和是否保留完整响应体决定。
+
+    Args:
+        prepared: 预编译请求
+
+    Returns:
+        十六进制摘要
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{prepared.method}\n{prepared.url}\n".encode('utf-8'))
+    for name, value in sorted((name.lower(), value) for name, value in prepared.headers):
+        digest.update(f"{name}: {value}\n".encode('utf-8'))
+    digest.update(b'\n' + (prepared.body or b''))
+    digest.update(b'\x01' if prepared.full_body else b'\x00')
+    return digest.hexdigest()[:32]
+
+
+class Cassette:
+    """
+    请求录制文件
+
+    文件为每行一条JSON记录的文本文件，路径以.gz结尾时使用gzip压缩。录制时每个请求只保留
+    本次运行中的第一次响应（压测重复发送同一请求时不会重复写入），逐条追加并立即刷新，
+    进程中断时已写入的记录仍然可用；读取时同一请求以后写入的记录为准。
+    """
+
+    def __init__(self, path: str, mode: str = MODE_REPLAY, simulate_latency: bool = False):
+        """
+        初始化录制文件
+
+        Args:
+            path: 录制文件路径
+            mode: record（访问网络并录制）或 replay（只从录制文件返回响应）
+            simulate_latency: 回放时是否按录制的响应时间等待
+        """
+        if mode not in (MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"无效的录制回放模式: {mode}")
+        if mode == MODE_REPLAY and not os.path.exists(path):
+            raise FileNotFoundError(f"录制文件不存在: {path}")
+
+        self.path = path
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._recorded: Set[str] = set()
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['Cassette']:
+        """
+        根据API配置创建录制文件
+
+        Args:
+            config: get_api_config返回的配置字典
+
+        Returns:
+            Cassette对象，cassette_mode为off时返回None
+        """
+        mode = config.get('cassette_mode') or MODE_OFF
+        if mode == MODE_OFF:
+            return None
+        path = config.get('cassette_path')
+        if not path:
+            raise ValueError("启用录制回放时需要配置 cassette_path")
+        return cls(path, mode, simulate_latency=bool(config.get('replay_latency', False)))
+
+    @property
+    def replaying(self) -> bool:
+        """是否为回放模式"""
+        return self.mode == MODE_REPLAY
+
+    def _open(self, mode: str) -> IO[str]:
+        """按扩展名打开录制文件"""
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, mode + 't', encoding='utf-8')
+        return open(self.path, mode, encoding='utf-8')
+
+    def _load(self) -> None:
+        """读取录制文件中的全部记录"""
+        count = 0
+        try:
+            with self._open('r') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry['key']] = entry
+                        count += 1
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning(f"跳过录制文件第{line_no}行的无效记录")
+        except (EOFError, OSError) as e:
+            # 录制中断时gzip文件缺少结尾，已读出的记录仍然有效
+            logger.warning(f"录制文件不完整，已读取{count}条记录: {str(e)}")
+        logger.info(f"加载录制文件 {self.path}: {len(self._entries)} 个请求")
+
+    def replay(self, prepared: PreparedCase) -> Optional[Dict[str, Any]]:
+        """
+        查找录制的响应
+
+        Args:
+            prepared: 预编译请求
+
+        Returns:
+            录制的响应记录（APIResponse.to_record格式），未录制时返回None
+        """
+        entry = self._entries.get(cassette_key(prepared))
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def record(self, prepared: PreparedCase, response: Dict[str, Any]) -> None:
+        """
+        录制一次请求的响应
+
+        Args:
+            prepared: 预编译请求
+            response: 最终请求结果的记录（APIResponse.to_record格式）
+        """
+        key = cassette_key(prepared)
+        entry = {'key': key, 'method': prepared.method, 'url': prepared.url, **response}
+
+        with self._lock:
+            if key in self._recorded:
+                return
+            self._recorded.add(key)
+            self._entries[key] = entry
+            try:
+                if self._file is None:
+                    self._file = self._open('a')
+                self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                self._file.flush()
+            except OSError as e:
+                logger.error(f"写入录制文件失败: {str(e)}")
+
+    def close(self) -> None:
+        """关闭录制文件"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self.replaying and self.misses:
+            logger.warning(f"回放命中{self.hits}次，{self.misses}个请求没有录制")
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -118,23 +118,25 @@ class ConfigManager:
             'LARK_APP_TOKEN': 'app_token',
             'LARK_TABLE_ID': 'table_id',
             'LARK_DOMAIN': 'domain',
+            'LARK_QPS': 'lark_qps',
             'API_BASE_URL': 'api_base_url',
             'REQUEST_TIMEOUT': 'request_timeout',
             'MAX_RETRIES': 'max_retries',
             'REQUEST_DELAY': 'request_delay',
+            'CONCURRENCY': 'concurrency',
         }
         
         for env_key, config_key in env_mappings.items():
             value = os.getenv(env_key)
             if value:
                 # 类型转换
-                if config_key in ['request_timeout', 'max_retries']:
+                if config_key in ['request_timeout', 'max_retries', 'concurrency']:
                     try:
                         value = int(value)
                     except ValueError:
                         logger.warning(f"环境变量 {env_key} 不是有效整数: {value}")
                         continue
-                elif config_key in ['request_delay']:
+                elif config_key in ['request_delay', 'lark_qps']:
                     try:
                         value = float(value)
                     except ValueError:
@@ -190,7 +192,10 @@ class ConfigManager:
             'app_token': config.get('app_token', ''),
             'table_id': config.get('table_id', ''),
             'config_table_id': config.get('config_table_id', ''),  # 新增配置表ID
-            'domain': config.get('domain', 'https://base-api.larksuite.com')
+            'domain': config.get('domain', 'https://base-api.larksuite.com'),
+            'qps': config.get('lark_qps', 10),
+            'prefetch_pages': config.get('lark_prefetch', False),
+            'field_cache_ttl': config.get('field_cache_ttl', 300)
         }
         
         return lark_config
@@ -212,7 +217,29 @@ class ConfigManager:
             'timeout': config.get('request_timeout', 30),
             'max_retries': config.get('max_retries', 3),
             'retry_delay': config.get('retry_delay', 1.0),
-            'request_delay': config.get('request_delay', 0)
+            'retry_max_delay': config.get('retry_max_delay', 30.0),
+            'retry_budget_ratio': config.get('retry_budget_ratio', 0.2),
+            'retry_non_idempotent': config.get('retry_non_idempotent', False),
+            'request_delay': config.get('request_delay', 0),
+            'max_body_bytes': config.get('max_body_bytes', 1048576),
+            'max_response_length': config.get('max_response_length', 2000),
+            'batch_write': config.get('batch_write', True),
+            'skip_unchanged_writes': config.get('skip_unchanged_writes', True),
+            'skip_unchanged_cached': config.get('skip_unchanged_cached', True),
+            'concurrency': config.get('concurrency', 1),
+            'max_in_flight_per_host': config.get('max_in_flight_per_host', 0),
+            'pool_connections': config.get('pool_connections', 10),
+            'pool_maxsize': config.get('pool_maxsize', 0),
+            'warm_up_connections': config.get('warm_up_connections', 0),
+            'cassette_mode': config.get('cassette_mode', 'off'),
+            'cassette_path': config.get('cassette_path', ''),
+            'replay_latency': config.get('replay_latency', False),
+            'record_cache_path': config.get('record_cache_path', ''),
+            'record_cache_field': config.get('record_cache_field', '更新时间'),
+            'load_duration': config.get('load_duration', 10),
+            'load_concurrency': config.get('load_concurrency', 10),
+            'load_rate': config.get('load_rate', 0),
+            'load_mode': config.get('load_mode', 'closed')
         }
         
         return api_config
@@ -230,13 +257,45 @@ class ConfigManager:
             'app_token': '',
             'table_id': '',
             'domain': 'https://base-api.larksuite.com',
+            'lark_qps': 10,
+            'lark_prefetch': False,
+            'field_cache_ttl': 300,
             
             # API测试配置
             'api_base_url': '',
             'request_timeout': 30,
             'max_retries': 3,
             'retry_delay': 1.0,
+            'retry_max_delay': 30.0,
+            'retry_budget_ratio': 0.2,
+            'retry_non_idempotent': False,
             'request_delay': 0,
+            'max_body_bytes': 1048576,
+            'concurrency': 1,
+            'max_in_flight_per_host': 0,
+            'pool_connections': 10,
+            'pool_maxsize': 0,
+            'warm_up_connections': 0,
+            
+            # 录制回放配置
+            'cassette_mode': 'off',
+            'cassette_path': '',
+            'replay_latency': False,
+            
+            # 结果回写配置
+            'batch_write': True,
+            'skip_unchanged_writes': True,
+            'skip_unchanged_cached': True,
+            
+            # 本地记录缓存配置
+            'record_cache_path': '',
+            'record_cache_field': '更新时间',
+            
+            # 压测配置
+            'load_duration': 10,
+            'load_concurrency': 10,
+            'load_rate': 0,
+            'load_mode': 'closed',
             
             # 日志配置
             'log_level': 'INFO',
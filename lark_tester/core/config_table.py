@@ -6,6 +6,7 @@
 
 from typing import Dict, Any, Optional
 from .lark_client import LarkClient
+from ..utils.rate_limiter import TokenBucket
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -92,7 +93,9 @@ class ConfigTableReader:
 def create_config_reader(
     personal_token: str, 
     app_token: str, 
-    config_table_id: str
+    config_table_id: str,
+    rate_limiter: Optional[TokenBucket] = None,
+    domain: Optional[str] = None
 ) -> ConfigTableReader:
     """
     创建配置表读取器
@@ -101,9 +104,11 @@ def create_config_reader(
         personal_token: 个人令牌
         app_token: 应用令牌
         config_table_id: 配置表ID
+        rate_limiter: 共享的限流器（与测试用例读写共用Lark请求配额）
+        domain: API域名，默认使用LarkClient的默认域名
         
     Returns:
         配置表读取器实例
     """
-    lark_client = LarkClient(personal_token, app_token)
+    lark_client = LarkClient(personal_token, app_token, domain=domain, rate_limiter=rate_limiter)
     return ConfigTableReader(lark_client, config_table_id)
\ No newline at end of file
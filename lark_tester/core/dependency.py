@@ -0,0 +1,399 @@
+"""
+用例依赖调度模块
+
+用例在"提取变量"字段中声明从响应中提取的变量（如 token = $.data.token），
+其他用例在接口路径、请求头、请求体中以 ${token} 引用。调度器按引用关系构建
+依赖图：没有依赖的用例到达即执行，依赖其他用例的用例在上游全部完成后立即开始，
+互不依赖的用例并行执行。
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from .prepared_request import TEMPLATE_FIELDS
+from ..utils.formatter import format_test_result, parse_extract_rules
+from ..utils.jsonpath import compile_path
+from ..utils.logger import get_logger
+from ..utils.response_body import ResponseBody
+from ..utils.template import compile_template
+
+logger = get_logger(__name__)
+
+# 提取变量字段
+EXTRACT_FIELD = '提取变量'
+
+
+def case_outputs(test_case: Dict[str, Any]) -> Dict[str, str]:
+    """
+    获取用例声明提取的变量
+
+    Args:
+        test_case: 测试用例数据
+
+    Returns:
+        {变量名: JSON路径}，规则无效时为空（加载用例时已校验）
+    """
+    try:
+        return parse_extract_rules(test_case.get(EXTRACT_FIELD))
+    except ValueError:
+        return {}
+
+
+def case_references(test_case: Dict[str, Any]) -> Set[str]:
+    """
+    获取用例请求字段中引用的变量
+
+    Args:
+        test_case: 测试用例数据
+
+    Returns:
+        变量名集合
+    """
+    names = set()
+    for field_name in TEMPLATE_FIELDS:
+        value = test_case.get(field_name)
+        if isinstance(value, str) and '${' in value:
+            names.update(compile_template(value).names)
+    return names
+
+
+def extract_variables(test_case: Dict[str, Any], response_body: ResponseBody) -> Dict[str, Any]:
+    """
+    按用例的提取变量规则从响应中提取变量
+
+    Args:
+        test_case: 测试用例数据
+        response_body: 响应体
+
+    Returns:
+        提取到的变量，路径不存在的变量不包含在内
+    """
+    variables = {}
+    for name, path in case_outputs(test_case).items():
+        value = compile_path(path).get(response_body.doc)
+        if value is None:
+            logger.warning(f"用例 {test_case.get('接口编号', 'unknown')} 的响应中没有 {path}，变量 {name} 未提取")
+            continue
+        variables[name] = value
+    return variables
+
+
+def blocked_result(test_case: Dict[str, Any], reason: str) -> Dict[str, Any]:
+    """
+    生成因依赖未满足而未执行的用例结果
+
+    Args:
+        test_case: 测试用例数据
+        reason: 未执行的原因
+
+    Returns:
+        测试结果数据
+    """
+    result = format_test_result(
+        status_code=0,
+        response_body="",
+        response_time=None,
+        is_passed=False,
+        error_message=reason
+    )
+    result['_record_id'] = test_case.get('_record_id')
+    return result
+
+
+class _Node:
+    """依赖图中的一个用例"""
+
+    __slots__ = ('index', 'case', 'outputs', 'unbound', 'sources', 'pending', 'dependents',
+                 'missing', 'result', 'submitted')
+
+    def __init__(self, index: int, case: Dict[str, Any]):
+        self.index = index
+        self.case = case
+        self.outputs = case_outputs(case)
+        # 尚未找到来源的变量（等待后续用例或输入结束）
+        self.unbound: Set[str] = set()
+        # 变量 -> 提供该变量的用例
+        self.sources: Dict[str, '_Node'] = {}
+        self.pending = 0
+        self.dependents: List['_Node'] = []
+        self.missing: List[str] = []
+        self.result: Optional[Dict[str, Any]] = None
+        self.submitted = False
+
+    @property
+    def name(self) -> str:
+        return str(self.case.get('接口编号', self.index + 1))
+
+
+class DependencyScheduler:
+    """
+    依赖感知的用例调度器
+
+    ${变量} 绑定到表格中在它之前、最近一个提取该变量的用例；之前没有时绑定到之后
+    第一个提取该变量的用例；没有任何用例提取的变量视为外部变量，原样保留。
+    用例逐条到达（可以是逐页产出的生成器），依赖满足即提交到线程池；
+    上游未提取到所需变量时下游用例不执行并记为失败，存在循环依赖的用例同样记为失败。
+    """
+
+    def __init__(self, run: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]], workers: int = 1):
+        """
+        初始化调度器
+
+        Args:
+            run: 以 (用例, 上游提供的变量值) 执行单个用例并返回测试结果的函数，
+                 结果的_variables中为提取到的变量
+            workers: 工作线程数
+        """
+        self._run = run
+        self.workers = max(1, workers)
+        self._nodes: List[_Node] = []
+        self._latest: Dict[str, _Node] = {}
+        self._waiting: Dict[str, List[_Node]] = {}
+        self._running = 0
+        self._completed = 0
+        self._input_done = False
+        self._lock = threading.Lock()
+        self._finished = threading.Condition(self._lock)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def run(self, test_cases: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        执行全部用例
+
+        Args:
+            test_cases: 测试用例（按表格顺序）
+
+        Returns:
+            按用例顺序排列的测试结果列表
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            self._pool = pool
+            for test_case in test_cases:
+                with self._lock:
+                    ready = self._add(test_case)
+                self._submit(ready)
+
+            with self._lock:
+                self._input_done = True
+                ready = self._release_external()
+            self._submit(ready)
+
+            with self._finished:
+                while self._completed < len(self._nodes) and self._running:
+                    self._finished.wait()
+                self._fail_cycles()
+
+        return [node.result for node in self._nodes]
+
+    def _add(self, test_case: Dict[str, Any]) -> List[_Node]:
+        """加入一个用例并绑定依赖，返回可以执行的用例"""
+        node = _Node(len(self._nodes), test_case)
+        self._nodes.append(node)
+
+        for name in case_references(test_case):
+            source = self._latest.get(name)
+            if source is not None:
+                self._bind(node, name, source)
+            else:
+                node.unbound.add(name)
+                self._waiting.setdefault(name, []).append(node)
+
+        # 之前到达、尚无来源的引用绑定到这个用例（用例引用自己提取的变量时不绑定）
+        ready = []
+        for name in node.outputs:
+            waiting = self._waiting.get(name, [])
+            for consumer in [waiting_node for waiting_node in waiting if waiting_node is not node]:
+                consumer.unbound.discard(name)
+                self._bind(consumer, name, node)
+                waiting.remove(consumer)
+                ready.extend(self._check_ready(consumer))
+            self._latest[name] = node
+
+        ready.extend(self._check_ready(node))
+        return ready
+
+    def _bind(self, consumer: _Node, name: str, source: _Node) -> None:
+        """将consumer引用的变量绑定到source"""
+        consumer.sources[name] = source
+        if source.result is not None:
+            if name not in source.result.get('_variables', {}):
+                consumer.missing.append(f"{name}(用例{source.name})")
+        elif consumer not in source.dependents:
+            source.dependents.append(consumer)
+            consumer.pending += 1
+
+    def _release_external(self) -> List[_Node]:
+        """输入结束后，没有任何用例提取的变量视为外部变量（编译请求时报告未定义）"""
+        ready = []
+        for name, waiting in self._waiting.items():
+            for node in waiting:
+                node.unbound.discard(name)
+                ready.extend(self._check_ready(node))
+        self._waiting.clear()
+        return ready
+
+    def _check_ready(self, node: _Node) -> List[_Node]:
+        """依赖满足时返回可执行的用例；依赖缺少变量时直接记为失败并级联到下游"""
+        if node.submitted or node.unbound or node.pending:
+            return []
+        node.submitted = True
+        if not node.missing:
+            self._running += 1
+            return [node]
+        return self._finish(node, blocked_result(node.case, f"依赖的变量未提取到: {', '.join(node.missing)}"))
+
+    def _finish(self, node: _Node, result: Dict[str, Any]) -> List[_Node]:
+        """记录用例结果并更新下游用例，返回因此可以执行的用例"""
+        node.result = result
+        self._completed += 1
+        variables = result.get('_variables', {})
+        ready = []
+        for dependent in node.dependents:
+            dependent.pending -= 1
+            dependent.missing.extend(
+                f"{name}(用例{node.name})" for name, source in dependent.sources.items()
+                if source is node and name not in variables
+            )
+            ready.extend(self._check_ready(dependent))
+        self._finished.notify_all()
+        return ready
+
+    def _submit(self, nodes: List[_Node]) -> None:
+        """提交可执行的用例"""
+        for node in nodes:
+            self._pool.submit(self._execute, node)
+
+    def _execute(self, node: _Node) -> None:
+        """在工作线程中执行用例"""
+        variables = {
+            name: source.result['_variables'][name] for name, source in node.sources.items()
+        }
+        try:
+            result = self._run(node.case, variables)
+        except Exception as e:
+            logger.error(f"执行测试用例 {node.name} 异常: {str(e)}")
+            result = blocked_result(node.case, f"执行测试用例异常: {str(e)}")
+
+        with self._lock:
+            self._running -= 1
+            ready = self._finish(node, result)
+        self._submit(ready)
+
+    def _fail_cycles(self) -> None:
+        """没有在执行的用例但仍有用例未完成时，剩余用例处于循环依赖中"""
+        remaining = [node for node in self._nodes if node.result is None]
+        if not remaining:
+            return
+        names = ', '.join(node.name for node in remaining)
+        logger.error(f"用例之间存在循环依赖: {names}")
+        for node in remaining:
+            node.submitted = True
+            node.result = blocked_result(node.case, f"用例之间存在循环依赖: {names}")
+            self._completed += 1
+
+
+class AsyncDependencyScheduler:
+    """
+    异步执行器使用的依赖调度器
+
+    变量绑定规则与DependencyScheduler相同。用例已全部加载，依赖图一次构建：
+    每个用例作为一个任务等待上游任务的结果，上游全部完成后立即执行，
+    并发数由run自行限制；存在循环依赖的用例（及其下游）不执行并记为失败。
+    """
+
+    def __init__(self, run: Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[Dict[str, Any]]]):
+        """
+        初始化调度器
+
+        Args:
+            run: 以 (用例, 上游提供的变量值) 执行单个用例并返回测试结果的协程函数，
+                 结果的_variables中为提取到的变量
+        """
+        self._run = run
+
+    async def run(self, test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        执行全部用例
+
+        Args:
+            test_cases: 测试用例（按表格顺序）
+
+        Returns:
+            按用例顺序排列的测试结果列表
+        """
+        sources = self._bind(test_cases)
+        cyclic = self._find_cycles(sources)
+        if cyclic:
+            names = ', '.join(self._name(test_cases, index) for index in sorted(cyclic))
+            logger.error(f"用例之间存在循环依赖: {names}")
+
+        loop = asyncio.get_running_loop()
+        finished = [loop.create_future() for _ in test_cases]
+
+        async def execute(index: int) -> Dict[str, Any]:
+            test_case = test_cases[index]
+            if index in cyclic:
+                result = blocked_result(test_case, f"用例之间存在循环依赖: {names}")
+            else:
+                variables, missing = {}, []
+                for name, source in sources[index].items():
+                    extracted = (await finished[source]).get('_variables', {})
+                    if name in extracted:
+                        variables[name] = extracted[name]
+                    else:
+                        missing.append(f"{name}(用例{self._name(test_cases, source)})")
+                if missing:
+                    result = blocked_result(test_case, f"依赖的变量未提取到: {', '.join(missing)}")
+                else:
+                    try:
+                        result = await self._run(test_case, variables)
+                    except Exception as e:
+                        logger.error(f"执行测试用例 {self._name(test_cases, index)} 异常: {str(e)}")
+                        result = blocked_result(test_case, f"执行测试用例异常: {str(e)}")
+            finished[index].set_result(result)
+            return result
+
+        return list(await asyncio.gather(*[execute(index) for index in range(len(test_cases))]))
+
+    @staticmethod
+    def _name(test_cases: List[Dict[str, Any]], index: int) -> str:
+        return str(test_cases[index].get('接口编号', index + 1))
+
+    @staticmethod
+    def _bind(test_cases: List[Dict[str, Any]]) -> List[Dict[str, int]]:
+        """绑定每个用例引用的变量，返回 {变量名: 提供该变量的用例下标}，外部变量不包含在内"""
+        producers: Dict[str, List[int]] = {}
+        for index, test_case in enumerate(test_cases):
+            for name in case_outputs(test_case):
+                producers.setdefault(name, []).append(index)
+
+        bindings = []
+        for index, test_case in enumerate(test_cases):
+            sources = {}
+            for name in case_references(test_case):
+                candidates = producers.get(name, [])
+                earlier = [candidate for candidate in candidates if candidate < index]
+                later = [candidate for candidate in candidates if candidate > index]
+                if earlier or later:
+                    sources[name] = earlier[-1] if earlier else later[0]
+            bindings.append(sources)
+        return bindings
+
+    @staticmethod
+    def _find_cycles(sources: List[Dict[str, int]]) -> Set[int]:
+        """按拓扑排序找出无法执行的用例（循环依赖及其下游）"""
+        pending = [len(set(bound.values())) for bound in sources]
+        dependents: List[List[int]] = [[] for _ in sources]
+        for index, bound in enumerate(sources):
+            for source in set(bound.values()):
+                dependents[source].append(index)
+
+        ready = [index for index, count in enumerate(pending) if count == 0]
+        while ready:
+            for dependent in dependents[ready.pop()]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        return {index for index, count in enumerate(pending) if count > 0}
@@ -0,0 +1,128 @@
+"""
+HTTP分阶段计时模块
+
+为requests会话挂载带计时功能的连接适配器，记录每次请求的
+DNS解析、TCP连接和TLS握手耗时（复用的长连接这三项为0）
+"""
+
+import socket
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterator, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
+
+# 计时阶段（单位：秒）
+TIMING_PHASES = ('dns', 'connect', 'tls', 'ttfb', 'download', 'total')
+
+_local = threading.local()
+
+
+def new_timings() -> Dict[str, float]:
+    """创建各阶段均为0的计时字典"""
+    return {phase: 0.0 for phase in TIMING_PHASES}
+
+
+@contextmanager
+def collect_timings(timings: Dict[str, float]) -> Iterator[Dict[str, float]]:
+    """
+    在当前线程内收集连接阶段计时
+
+    Args:
+        timings: 接收计时结果的字典
+
+    Yields:
+        传入的计时字典
+    """
+    previous = getattr(_local, 'timings', None)
+    _local.timings = timings
+    try:
+        yield timings
+    finally:
+        _local.timings = previous
+
+
+def _current_timings() -> Optional[Dict[str, float]]:
+    """获取当前线程正在收集的计时字典"""
+    return getattr(_local, 'timings', None)
+
+
+class _TimedConnectionMixin:
+    """分别计时DNS解析和TCP连接的连接类混入"""
+
+    def _new_conn(self) -> socket.socket:
+        timings = _current_timings()
+        if timings is None:
+            return super()._new_conn()
+
+        start = perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            # 交给urllib3抛出统一的解析异常
+            return super()._new_conn()
+        resolved = perf_counter()
+        timings['dns'] += resolved - start
+
+        # 依次连接解析出的地址，避免urllib3重复解析
+        dns_host = self._dns_host
+        error: Optional[Exception] = None
+        try:
+            for address in dict.fromkeys(info[4][0] for info in addresses):
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+            else:
+                raise error or NewConnectionError(self, f"无法连接到 {dns_host}")
+        finally:
+            self._dns_host = dns_host
+            timings['connect'] += perf_counter() - resolved
+
+        return sock
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """记录DNS和连接耗时的HTTP连接"""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """记录DNS、连接和TLS握手耗时的HTTPS连接"""
+
+    def connect(self) -> None:
+        timings = _current_timings()
+        if timings is None:
+            return super().connect()
+
+        before = timings['dns'] + timings['connect']
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            elapsed = perf_counter() - start
+            timings['tls'] += max(0.0, elapsed - (timings['dns'] + timings['connect'] - before))
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """使用计时连接池的requests适配器"""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
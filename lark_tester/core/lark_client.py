@@ -15,10 +15,15 @@ import requests
 import json
 import time
 import logging
-from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+import threading
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from urllib.parse import urljoin
 
+from ..utils.rate_limiter import TokenBucket
+
 
 @dataclass
 class LarkResponse:
@@ -39,6 +44,192 @@ class LarkResponse:
         )
 
 
+@dataclass
+class BatchResult:
+    """批量操作结果封装"""
+    succeeded: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        """是否全部成功"""
+        return not self.failed
+
+    def add_chunk(self, record_ids: List[str], response: LarkResponse) -> None:
+        """
+        根据分块响应统计每条记录的成功/失败情况
+
+        Args:
+            record_ids: 本分块请求的记录ID
+            response: 本分块的响应
+        """
+        if not response.success:
+            for record_id in record_ids:
+                self.failed[record_id] = response.message
+            return
+
+        returned = (response.data or {}).get('records', [])
+        confirmed = {
+            record.get('record_id') for record in returned
+            if record.get('deleted', True)
+        }
+
+        for record_id in record_ids:
+            if record_id in confirmed:
+                self.succeeded.append(record_id)
+            else:
+                self.failed[record_id] = "响应中未包含该记录"
+
+
+class FieldSchemaCache:
+    """
+    字段结构缓存
+
+    按表格缓存字段列表并维护字段名和字段ID索引，超过TTL后视为过期。
+    查找过但不存在的字段名也会记录下来，直到缓存过期或表格字段有新增/修改。
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        """
+        初始化字段结构缓存
+
+        Args:
+            ttl: 缓存有效期(秒)，小于等于0表示不缓存
+        """
+        self.ttl = ttl
+        self._tables: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_fresh(self, table_id: str) -> Optional[Dict[str, Any]]:
+        """获取未过期的表格缓存项（调用方需持有锁）"""
+        entry = self._tables.get(table_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry['loaded_at'] > self.ttl:
+            del self._tables[table_id]
+            return None
+        return entry
+
+    def get_fields(self, table_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        获取缓存的字段列表
+
+        Args:
+            table_id: 表格ID
+
+        Returns:
+            字段列表（副本），未缓存或已过期时返回None
+        """
+        with self._lock:
+            entry = self._get_fresh(table_id)
+            return [dict(f) for f in entry['by_id'].values()] if entry else None
+
+    def get_by_name(self, table_id: str, field_name: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        按字段名查找缓存的字段
+
+        Args:
+            table_id: 表格ID
+            field_name: 字段名称
+
+        Returns:
+            (缓存是否命中, 字段信息副本或None)；已记录为不存在的字段名返回(True, None)
+        """
+        with self._lock:
+            entry = self._get_fresh(table_id)
+            if entry is None:
+                return False, None
+            field_info = entry['by_name'].get(field_name)
+            if field_info is not None:
+                return True, dict(field_info)
+            return field_name in entry['missing'], None
+
+    def add_missing(self, table_id: str, field_name: str) -> None:
+        """
+        记录表格中不存在的字段名（表格未缓存时忽略）
+
+        Args:
+            table_id: 表格ID
+            field_name: 字段名称
+        """
+        with self._lock:
+            entry = self._get_fresh(table_id)
+            if entry is not None:
+                entry['missing'].add(field_name)
+
+    def set_fields(self, table_id: str, fields: List[Dict[str, Any]]) -> None:
+        """
+        写入表格的完整字段列表
+
+        Args:
+            table_id: 表格ID
+            fields: 字段列表
+        """
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            self._tables[table_id] = {
+                'loaded_at': time.monotonic(),
+                'by_id': {f.get('field_id'): f for f in fields},
+                'by_name': {f.get('field_name'): f for f in fields},
+                'missing': set()
+            }
+
+    def upsert(self, table_id: str, field_info: Dict[str, Any]) -> None:
+        """
+        新增或更新缓存中的单个字段（表格未缓存时忽略），并清除不存在字段名的记录
+
+        Args:
+            table_id: 表格ID
+            field_info: 字段信息，需包含field_id
+        """
+        with self._lock:
+            entry = self._get_fresh(table_id)
+            if entry is None:
+                return
+
+            field_id = field_info.get('field_id')
+            old = entry['by_id'].get(field_id)
+            if old is not None:
+                entry['by_name'].pop(old.get('field_name'), None)
+                field_info = {**old, **field_info}
+
+            entry['by_id'][field_id] = field_info
+            entry['by_name'][field_info.get('field_name')] = field_info
+            entry['missing'].clear()
+
+    def remove(self, table_id: str, field_id: str) -> None:
+        """
+        从缓存中移除字段
+
+        Args:
+            table_id: 表格ID
+            field_id: 字段ID
+        """
+        with self._lock:
+            entry = self._tables.get(table_id)
+            if entry is None:
+                return
+
+            old = entry['by_id'].pop(field_id, None)
+            if old is not None:
+                entry['by_name'].pop(old.get('field_name'), None)
+
+    def invalidate(self, table_id: Optional[str] = None) -> None:
+        """
+        使缓存失效
+
+        Args:
+            table_id: 表格ID，为None时清空所有表格的缓存
+        """
+        with self._lock:
+            if table_id is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(table_id, None)
+
+
 class LarkError(Exception):
     """Lark API错误异常"""
     def __init__(self, code: int, message: str):
@@ -59,8 +250,18 @@ class LarkClient:
     LARK_DOMAIN = "https://base-api.larksuite.com"
     # 支持国际版域名（根据规范要求）
     INTERNATIONAL_DOMAIN = "https://open.larksuite.com"
+    # 批量记录接口单次最多处理500条
+    BATCH_LIMIT = 500
+    # 默认请求频率上限（次/秒）
+    DEFAULT_QPS = 10.0
+    # 表示触发频率限制的Lark错误码
+    RATE_LIMIT_CODES = {99991400, 1254290}
+    # 触发频率限制后的最大重试次数
+    MAX_RATE_LIMIT_RETRIES = 5
 
-    def __init__(self, personal_token: str, app_token: str, domain: str = None, use_international: bool = False):
+    def __init__(self, personal_token: str, app_token: str, domain: str = None, use_international: bool = False,
+                 qps: float = DEFAULT_QPS, rate_limiter: Optional[TokenBucket] = None,
+                 prefetch_pages: bool = False, field_cache_ttl: float = 300.0):
         """
         初始化Lark客户端
 
@@ -69,6 +270,10 @@ class LarkClient:
             app_token: 应用Token（从URL中的base/后获取）
             domain: API域名，默认使用原始baseopensdk域名
             use_international: 是否使用国际版域名
+            qps: 请求频率上限（次/秒），小于等于0表示不限流
+            rate_limiter: 共享的限流器（多个客户端共用同一配额时传入），优先于qps
+            prefetch_pages: 分页读取时是否在后台预取下一页
+            field_cache_ttl: 字段结构缓存有效期(秒)，小于等于0表示不缓存
         """
         self.personal_token = personal_token.strip()
         self.app_token = app_token.strip()
@@ -92,6 +297,13 @@ class LarkClient:
             'User-Agent': 'base-open-sdk-python/v1.0.0'  # 与原始SDK一致
         })
         
+        # 所有请求共用的限流器
+        self.rate_limiter = rate_limiter or TokenBucket(qps)
+        self.prefetch_pages = prefetch_pages
+        
+        # 字段结构缓存（字段增删改时就地更新）
+        self.field_cache = FieldSchemaCache(field_cache_ttl)
+        
         # 日志配置
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"✅ Lark客户端初始化成功（完全兼容原始baseopensdk）")
@@ -107,6 +319,9 @@ class LarkClient:
         """
         统一的HTTP请求处理方法
         
+        所有请求先经过限流器；遇到HTTP 429或频率限制错误码时，
+        暂停限流器（影响所有共用该限流器的请求）并退避重试。
+        
         Args:
             method: HTTP方法
             endpoint: API端点路径
@@ -115,6 +330,36 @@ class LarkClient:
         Returns:
             LarkResponse对象
         """
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.acquire()
+            lark_resp, retry_after = self._send_once(method, endpoint, **kwargs)
+            
+            if retry_after is None:
+                return lark_resp
+            if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                self.logger.error(f"频率限制重试次数已用尽: {method} {endpoint} "
+                                  f"(attempts {attempt + 1}/{self.MAX_RATE_LIMIT_RETRIES + 1})")
+                return lark_resp
+            
+            backoff = retry_after if retry_after > 0 else min(2 ** attempt, 30)
+            self.logger.warning(f"触发频率限制，{backoff:.1f}秒后重试 "
+                                f"(attempt {attempt + 1}/{self.MAX_RATE_LIMIT_RETRIES + 1})")
+            self.rate_limiter.pause(backoff)
+        
+        return lark_resp
+
+    def _send_once(self, method: str, endpoint: str, **kwargs) -> Tuple[LarkResponse, Optional[float]]:
+        """
+        发送单次请求
+        
+        Args:
+            method: HTTP方法
+            endpoint: API端点路径
+            **kwargs: 传递给requests的额外参数
+            
+        Returns:
+            (LarkResponse对象, 限流时建议的等待秒数；未限流为None，未给出等待时间为0)
+        """
         url = self._build_url(endpoint)
         
         try:
@@ -125,24 +370,30 @@ class LarkClient:
             # 检查HTTP状态码
             if response.status_code != 200:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
-                self.logger.error(error_msg)
-                return LarkResponse(
+                lark_resp = LarkResponse(
                     code=response.status_code,
                     message=error_msg,
                     success=False
                 )
+                if response.status_code == 429:
+                    return lark_resp, self._get_retry_after(response)
+                self.logger.error(error_msg)
+                return lark_resp, None
             
             # 解析JSON响应
             try:
                 response_data = response.json()
                 lark_resp = LarkResponse.from_dict(response_data)
                 
+                if lark_resp.code in self.RATE_LIMIT_CODES:
+                    return lark_resp, self._get_retry_after(response)
+                
                 if not lark_resp.success:
                     self.logger.warning(f"API错误: {lark_resp.code} - {lark_resp.message}")
                 else:
                     self.logger.debug("请求成功")
                     
-                return lark_resp
+                return lark_resp, None
                 
             except json.JSONDecodeError as e:
                 error_msg = f"JSON解析失败: {str(e)}"
@@ -151,69 +402,153 @@ class LarkClient:
                     code=-1,
                     message=error_msg,
                     success=False
-                )
+                ), None
                 
         except requests.exceptions.Timeout:
             error_msg = "请求超时"
             self.logger.error(error_msg)
-            return LarkResponse(code=-1, message=error_msg, success=False)
+            return LarkResponse(code=-1, message=error_msg, success=False), None
             
         except requests.exceptions.RequestException as e:
             error_msg = f"请求异常: {str(e)}"
             self.logger.error(error_msg)
-            return LarkResponse(code=-1, message=error_msg, success=False)
+            return LarkResponse(code=-1, message=error_msg, success=False), None
 
-    def get_all_records(self, table_id: str, page_size: int = 100) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> float:
         """
-        获取表格所有记录（自动处理分页）
+        从限流响应头中读取建议的等待秒数
+        
+        Args:
+            response: HTTP响应
+            
+        Returns:
+            等待秒数，响应头未提供时返回0
+        """
+        for header in ('Retry-After', 'x-ogw-ratelimit-reset'):
+            value = response.headers.get(header)
+            if value:
+                try:
+                    return max(0.0, float(value))
+                except ValueError:
+                    continue
+        return 0.0
+
+    def _fetch_records_page(self, table_id: str, page_size: int, page_token: str = "",
+                            field_names: Optional[List[str]] = None,
+                            strict: bool = False) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        """
+        获取一页记录
 
         Args:
             table_id: 表格ID
-            page_size: 每页记录数（最大200，默认100）
+            page_size: 每页记录数
+            page_token: 分页标记，首页为空
+            field_names: 只返回这些字段（为None时返回全部字段）
+            strict: 请求失败时是否抛出LarkError
 
         Returns:
-            包含所有记录的列表
+            (本页记录列表，请求失败时为None, 下一页的page_token，没有下一页时为空)
         """
-        all_records = []
-        page_token = ""
-        page_size = min(page_size, 200)
+        # 构建查询参数
+        params = {'page_size': page_size}
+        if page_token:
+            params['page_token'] = page_token
+        if field_names is not None:
+            params['field_names'] = json.dumps(field_names, ensure_ascii=False)
 
-        while True:
-            # 构建查询参数
-            params = {'page_size': page_size}
-            if page_token:
-                params['page_token'] = page_token
+        # 使用原始baseopensdk的API路径结构
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records"
+        response = self._make_request('GET', endpoint, params=params)
 
-            # 使用原始baseopensdk的API路径结构
-            endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records"
-            response = self._make_request('GET', endpoint, params=params)
+        if not response.success:
+            self.logger.error(f"获取记录失败: {response.message}")
+            if strict:
+                raise LarkError(response.code, response.message)
+            return None, ""
 
-            if not response.success:
-                self.logger.error(f"获取记录失败: {response.message}")
-                break
+        # 解析记录
+        records = [
+            {
+                'record_id': record.get('record_id', ''),
+                'fields': record.get('fields', {})
+            }
+            for record in (response.data or {}).get('items') or []
+        ]
 
-            # 解析记录
-            if response.data and 'items' in response.data:
-                records = response.data['items']
-                for record in records:
-                    all_records.append({
-                        'record_id': record.get('record_id', ''),
-                        'fields': record.get('fields', {})
-                    })
+        # 检查是否有下一页
+        if not response.data or not response.data.get('has_more', False):
+            return records, ""
 
-            # 检查是否有下一页
-            if not response.data or not response.data.get('has_more', False):
-                break
+        return records, response.data.get('page_token', '')
 
-            page_token = response.data.get('page_token', '')
-            if not page_token:
-                break
+    def iter_records(self, table_id: str, page_size: int = 100, prefetch: Optional[bool] = None,
+                     field_names: Optional[List[str]] = None, strict: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        逐页迭代表格记录（生成器，按页请求，边取边产出）
 
-            # 防止请求过于频繁
-            time.sleep(0.5)
+        开启预取时，拿到当前页的page_token后立即在后台线程请求下一页，
+        调用方处理当前页的同时下一页已在网络传输中。
 
-        self.logger.info(f"成功获取 {len(all_records)} 条记录")
-        return all_records
+        Args:
+            table_id: 表格ID
+            page_size: 每页记录数（最大200，默认100）
+            prefetch: 是否预取下一页，默认使用客户端的prefetch_pages设置
+            field_names: 只返回这些字段（为None时返回全部字段）
+            strict: 请求失败时抛出LarkError，而不是记录日志后结束迭代
+
+        Yields:
+            记录字典，格式为 {'record_id': ..., 'fields': {...}}
+        """
+        page_size = min(page_size, 200)
+        if prefetch is None:
+            prefetch = self.prefetch_pages
+        fetch_page = partial(self._fetch_records_page, table_id, page_size,
+                             field_names=field_names, strict=strict)
+        total = 0
+
+        if not prefetch:
+            page_token = ""
+            while True:
+                records, page_token = fetch_page(page_token)
+                if records is None:
+                    break
+                total += len(records)
+                yield from records
+                if not page_token:
+                    break
+        else:
+            pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='lark-prefetch')
+            try:
+                future = pool.submit(fetch_page, "")
+                while future is not None:
+                    records, page_token = future.result()
+                    if records is None:
+                        break
+                    # 先发出下一页请求，再把当前页交给调用方处理
+                    future = pool.submit(fetch_page, page_token) if page_token else None
+                    total += len(records)
+                    yield from records
+            finally:
+                # 调用方提前结束迭代时不等待尚未返回的预取请求
+                pool.shutdown(wait=False)
+
+        self.logger.info(f"成功获取 {total} 条记录")
+
+    def get_all_records(self, table_id: str, page_size: int = 100,
+                        prefetch: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        获取表格所有记录（自动处理分页）
+
+        Args:
+            table_id: 表格ID
+            page_size: 每页记录数（最大200，默认100）
+            prefetch: 是否预取下一页，默认使用客户端的prefetch_pages设置
+
+        Returns:
+            包含所有记录的列表
+        """
+        return list(self.iter_records(table_id, page_size, prefetch))
 
     def create_record(self, table_id: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -289,6 +624,98 @@ class LarkClient:
             self.logger.error(f"删除记录失败: {response.message}")
             return False
 
+    def batch_create_records(self, table_id: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        批量创建记录（按500条自动分块）
+
+        API路径: /open-apis/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_create
+
+        Args:
+            table_id: 表格ID
+            records: 新记录的字段字典列表
+
+        Returns:
+            成功创建的记录列表
+        """
+        created = []
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records/batch_create"
+
+        for start in range(0, len(records), self.BATCH_LIMIT):
+            chunk = records[start:start + self.BATCH_LIMIT]
+            request_body = {'records': [{'fields': fields} for fields in chunk]}
+            response = self._make_request('POST', endpoint, json=request_body)
+
+            if not response.success:
+                self.logger.error(f"批量创建记录失败 ({len(chunk)} 条): {response.message}")
+                continue
+
+            for record in (response.data or {}).get('records', []):
+                created.append({
+                    'record_id': record.get('record_id', ''),
+                    'fields': record.get('fields', {})
+                })
+
+        self.logger.info(f"批量创建记录完成: 成功{len(created)}/{len(records)}")
+        return created
+
+    def batch_update_records(self, table_id: str, updates: List[Dict[str, Any]]) -> BatchResult:
+        """
+        批量更新记录（按500条自动分块）
+
+        API路径: /open-apis/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_update
+
+        Args:
+            table_id: 表格ID
+            updates: 更新列表，每项格式为 {'record_id': ..., 'fields': {...}}
+
+        Returns:
+            BatchResult，包含成功的记录ID和失败记录ID到错误信息的映射
+        """
+        result = BatchResult()
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records/batch_update"
+
+        for start in range(0, len(updates), self.BATCH_LIMIT):
+            chunk = updates[start:start + self.BATCH_LIMIT]
+            request_body = {
+                'records': [
+                    {'record_id': update['record_id'], 'fields': update['fields']}
+                    for update in chunk
+                ]
+            }
+            response = self._make_request('POST', endpoint, json=request_body)
+            if not response.success:
+                self.logger.error(f"批量更新记录分块失败 ({len(chunk)} 条): {response.message}")
+            result.add_chunk([u['record_id'] for u in chunk], response)
+
+        self.logger.info(f"批量更新记录完成: 成功{len(result.succeeded)}/{len(updates)}")
+        return result
+
+    def batch_delete_records(self, table_id: str, record_ids: List[str]) -> BatchResult:
+        """
+        批量删除记录（按500条自动分块）
+
+        API路径: /open-apis/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_delete
+
+        Args:
+            table_id: 表格ID
+            record_ids: 要删除的记录ID列表
+
+        Returns:
+            BatchResult，包含成功的记录ID和失败记录ID到错误信息的映射
+        """
+        result = BatchResult()
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records/batch_delete"
+
+        for start in range(0, len(record_ids), self.BATCH_LIMIT):
+            chunk = record_ids[start:start + self.BATCH_LIMIT]
+            response = self._make_request('POST', endpoint, json={'records': chunk})
+            if not response.success:
+                self.logger.error(f"批量删除记录分块失败 ({len(chunk)} 条): {response.message}")
+            result.add_chunk(chunk, response)
+
+        self.logger.info(f"批量删除记录完成: 成功{len(result.succeeded)}/{len(record_ids)}")
+        return result
+
     def get_record_by_id(self, table_id: str, record_id: str) -> Optional[Dict[str, Any]]:
         """
         根据记录ID获取单条记录
@@ -312,31 +739,136 @@ class LarkClient:
 
         return None
 
-    def find_records_by_field(self, table_id: str, field_name: str, field_value: Any) -> List[Dict[str, Any]]:
+    def iter_search_records(self, table_id: str, record_filter: Optional[Dict[str, Any]] = None,
+                            field_names: Optional[List[str]] = None, page_size: int = 500,
+                            automatic_fields: bool = False, strict: bool = False) -> Iterator[Dict[str, Any]]:
         """
-        根据字段值查找记录
+        使用服务端筛选查询记录（生成器，自动处理分页）
+
+        API路径: /open-apis/bitable/v1/apps/{app_token}/tables/{table_id}/records/search
 
         Args:
             table_id: 表格ID
-            field_name: 字段名
-            field_value: 要查找的字段值
+            record_filter: 筛选条件，格式为 {'conjunction': 'and', 'conditions': [...]}
+            field_names: 只返回这些字段（为None时返回全部字段）
+            page_size: 每页记录数（最大500，默认500）
+            automatic_fields: 是否返回创建/修改时间等自动字段
+            strict: 请求失败时抛出LarkError，而不是记录日志后结束迭代
+
+        Yields:
+            记录字典，格式为 {'record_id': ..., 'fields': {...}}
+        """
+        endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/records/search"
+        request_body: Dict[str, Any] = {}
+        if record_filter:
+            request_body['filter'] = record_filter
+        if field_names is not None:
+            request_body['field_names'] = field_names
+        if automatic_fields:
+            request_body['automatic_fields'] = True
+
+        page_token = ""
+        while True:
+            params = {'page_size': min(page_size, 500)}
+            if page_token:
+                params['page_token'] = page_token
+
+            response = self._make_request('POST', endpoint, params=params, json=request_body)
+
+            if not response.success:
+                self.logger.error(f"查询记录失败: {response.message}")
+                if strict:
+                    raise LarkError(response.code, response.message)
+                break
+
+            for record in (response.data or {}).get('items') or []:
+                result = {
+                    'record_id': record.get('record_id', ''),
+                    'fields': self._normalize_search_fields(record.get('fields', {}))
+                }
+                if automatic_fields:
+                    for key in ('created_time', 'last_modified_time'):
+                        if key in record:
+                            result[key] = record[key]
+                yield result
+
+            if not response.data or not response.data.get('has_more', False):
+                break
+
+            page_token = response.data.get('page_token', '')
+            if not page_token:
+                break
+
+    def search_records(self, table_id: str, record_filter: Optional[Dict[str, Any]] = None,
+                       field_names: Optional[List[str]] = None,
+                       automatic_fields: bool = False) -> List[Dict[str, Any]]:
+        """
+        使用服务端筛选查询记录
+
+        Args:
+            table_id: 表格ID
+            record_filter: 筛选条件，格式为 {'conjunction': 'and', 'conditions': [...]}
+            field_names: 只返回这些字段（为None时返回全部字段）
+            automatic_fields: 是否返回创建/修改时间等自动字段
 
         Returns:
             匹配的记录列表
         """
-        all_records = self.get_all_records(table_id)
-        matching_records = []
+        records = list(self.iter_search_records(
+            table_id, record_filter=record_filter, field_names=field_names, automatic_fields=automatic_fields
+        ))
+        self.logger.info(f"查询到 {len(records)} 条记录")
+        return records
+
+    @staticmethod
+    def _normalize_search_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        将查询接口返回的文本分段数组还原为字符串，与记录列表接口的返回格式保持一致
+
+        Args:
+            fields: 查询接口返回的字段字典
+
+        Returns:
+            规范化后的字段字典
+        """
+        normalized = {}
+        for name, value in fields.items():
+            if (isinstance(value, list) and value
+                    and all(isinstance(item, dict) and item.get('type') in ('text', 'mention') and 'text' in item
+                            for item in value)):
+                value = ''.join(item['text'] for item in value)
+            normalized[name] = value
+        return normalized
+
+    def find_records_by_field(self, table_id: str, field_name: str, field_value: Any,
+                              field_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        根据字段值查找记录（服务端筛选，只传输匹配的记录）
+
+        Args:
+            table_id: 表格ID
+            field_name: 字段名
+            field_value: 要查找的字段值，为None或空字符串时查找该字段为空的记录
+            field_names: 只返回这些字段（为None时返回全部字段）
 
-        for record in all_records:
-            if record['fields'].get(field_name) == field_value:
-                matching_records.append(record)
+        Returns:
+            匹配的记录列表
+        """
+        if field_value is None or field_value == '':
+            condition = {'field_name': field_name, 'operator': 'isEmpty', 'value': []}
+        else:
+            condition = {'field_name': field_name, 'operator': 'is', 'value': [str(field_value)]}
 
-        return matching_records
+        return self.search_records(
+            table_id,
+            record_filter={'conjunction': 'and', 'conditions': [condition]},
+            field_names=field_names
+        )
 
     # ==================== 字段管理功能 ====================
     # 基于原始baseopensdk中的AppTableField API实现
     
-    def list_fields(self, table_id: str) -> List[Dict[str, Any]]:
+    def list_fields(self, table_id: str, use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         获取表格所有字段信息
         
@@ -345,20 +877,41 @@ class LarkClient:
         
         Args:
             table_id: 表格ID
+            use_cache: 是否优先使用字段结构缓存
             
         Returns:
             字段信息列表
         """
+        if use_cache:
+            cached = self.field_cache.get_fields(table_id)
+            if cached is not None:
+                self.logger.debug(f"使用缓存的字段列表: {table_id}")
+                return cached
+        
         endpoint = f"/open-apis/bitable/v1/apps/{self.app_token}/tables/{table_id}/fields"
-        response = self._make_request('GET', endpoint)
+        fields = []
+        page_token = ""
         
-        if response.success and response.data and 'items' in response.data:
-            fields = response.data['items']
-            self.logger.info(f"成功获取 {len(fields)} 个字段")
-            return fields
-        else:
-            self.logger.error(f"获取字段列表失败: {response.message}")
-            return []
+        while True:
+            params = {'page_size': 100}
+            if page_token:
+                params['page_token'] = page_token
+            
+            response = self._make_request('GET', endpoint, params=params)
+            
+            if not (response.success and response.data and 'items' in response.data):
+                self.logger.error(f"获取字段列表失败: {response.message}")
+                return []
+            
+            fields.extend(response.data['items'] or [])
+            
+            page_token = response.data.get('page_token', '') if response.data.get('has_more') else ''
+            if not page_token:
+                break
+        
+        self.field_cache.set_fields(table_id, fields)
+        self.logger.info(f"成功获取 {len(fields)} 个字段")
+        return [dict(f) for f in fields]
     
     def create_field(self, table_id: str, field_name: str, field_type: int, 
                     field_property: Optional[Dict[str, Any]] = None,
@@ -409,6 +962,7 @@ class LarkClient:
         
         if response.success and response.data and 'field' in response.data:
             field_data = response.data['field']
+            self.field_cache.upsert(table_id, field_data)
             self.logger.info(f"成功创建字段: {field_name} (ID: {field_data.get('field_id', 'N/A')})")
             return field_data
         else:
@@ -454,6 +1008,18 @@ class LarkClient:
         response = self._make_request('PUT', endpoint, json=request_body)
         
         if response.success:
+            updated = (response.data or {}).get('field')
+            if updated:
+                self.field_cache.upsert(table_id, updated)
+            else:
+                patch = {'field_id': field_id}
+                if field_name:
+                    patch['field_name'] = field_name
+                if field_property:
+                    patch['property'] = field_property
+                if description:
+                    patch['description'] = {"text": description}
+                self.field_cache.upsert(table_id, patch)
             self.logger.info(f"成功更新字段: {field_id}")
             return True
         else:
@@ -478,6 +1044,7 @@ class LarkClient:
         response = self._make_request('DELETE', endpoint)
         
         if response.success:
+            self.field_cache.remove(table_id, field_id)
             self.logger.info(f"成功删除字段: {field_id}")
             return True
         else:
@@ -495,12 +1062,29 @@ class LarkClient:
         Returns:
             字段信息或None
         """
-        fields = self.list_fields(table_id)
-        for field in fields:
-            if field.get('field_name') == field_name:
-                return field
+        # 缓存中没有该字段名时重新拉取一次，字段可能是在其他地方新建或改名的，
+        # 否则ensure_field_exists会尝试创建重复的字段；拉取后仍不存在的字段名
+        # 记录下来，缓存过期或新建字段前不再重复拉取
+        hit, field_info = self.field_cache.get_by_name(table_id, field_name)
+        if hit:
+            return field_info
+        
+        for field_info in self.list_fields(table_id, use_cache=False):
+            if field_info.get('field_name') == field_name:
+                return field_info
+        
+        self.field_cache.add_missing(table_id, field_name)
         return None
     
+    def invalidate_field_cache(self, table_id: Optional[str] = None) -> None:
+        """
+        使字段结构缓存失效（表格字段在其他地方被修改后调用）
+        
+        Args:
+            table_id: 表格ID，为None时清空所有表格的缓存
+        """
+        self.field_cache.invalidate(table_id)
+    
     def ensure_field_exists(self, table_id: str, field_name: str, field_type: int,
                            field_property: Optional[Dict[str, Any]] = None,
                            description: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,259 @@
+"""
+压测执行模块
+
+在指定时长内以固定并发或目标速率重复执行单个测试用例，
+用延迟直方图统计百分位延迟。支持闭环（工作线程循环发送）和
+开环（按固定到达速率发送）两种模式
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Any, Optional
+
+from .api_client import APIClient
+from ..utils.histogram import LatencyHistogram
+from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
+
+logger = get_logger(__name__)
+
+# 压测结果回写的表格字段（均为数字类型）
+LOAD_RESULT_FIELDS = (
+    '压测请求数',
+    '压测错误数',
+    '压测吞吐(rps)',
+    '压测P50(ms)',
+    '压测P90(ms)',
+    '压测P99(ms)',
+    '压测最大(ms)',
+    '压测丢失发送数',
+)
+
+
+@dataclass
+class LoadResult:
+    """单个测试用例的压测结果"""
+    test_id: str
+    record_id: Optional[str]
+    duration: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    # 开环模式下因在途请求已满而放弃的发送时隙数
+    missed: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def throughput(self) -> float:
+        """实际吞吐量(请求/秒)"""
+        return self.requests / self.duration if self.duration > 0 else 0.0
+
+    def to_fields(self) -> Dict[str, Any]:
+        """转换为回写表格的字段字典"""
+        return {
+            '压测请求数': self.requests,
+            '压测错误数': self.errors,
+            '压测吞吐(rps)': round(self.throughput, 2),
+            '压测P50(ms)': round(self.histogram.percentile(50), 2),
+            '压测P90(ms)': round(self.histogram.percentile(90), 2),
+            '压测P99(ms)': round(self.histogram.percentile(99), 2),
+            '压测最大(ms)': round(self.histogram.max_ms, 2),
+            '压测丢失发送数': self.missed,
+        }
+
+    def summary(self) -> str:
+        """生成单行压测摘要"""
+        text = (
+            f"{self.test_id}: 请求{self.requests}, 错误{self.errors}, {self.throughput:.1f} rps, "
+            f"P50 {self.histogram.percentile(50):.1f}ms / P90 {self.histogram.percentile(90):.1f}ms / "
+            f"P99 {self.histogram.percentile(99):.1f}ms / 最大 {self.histogram.max_ms:.1f}ms"
+        )
+        if self.missed:
+            text += f", 丢失发送{self.missed}"
+        return text
+
+
+def is_failed_request(test_case: Dict[str, Any], status_code: int, error: Optional[str]) -> bool:
+    """
+    判断一次压测请求是否计为错误
+
+    请求异常、与预期状态码不符，或未配置预期状态码时返回4xx/5xx都计为错误。
+
+    Args:
+        test_case: 测试用例数据
+        status_code: 响应状态码
+        error: 请求错误信息
+
+    Returns:
+        是否为错误请求
+    """
+    if error:
+        return True
+
+    expected_status = test_case.get('预期状态码')
+    if expected_status not in (None, ''):
+        try:
+            return status_code != int(expected_status)
+        except (TypeError, ValueError):
+            pass
+    return status_code >= 400
+
+
+class LoadTestRunner:
+    """
+    闭环压测执行器
+
+    concurrency个工作线程在压测时长内循环发送请求；设置rate时所有线程
+    共享一个令牌桶，总发送速率不超过rate。请求通过APIClient.execute_test_case
+    发送，与功能测试的请求构造完全一致。
+    """
+
+    def __init__(self, api_client: APIClient, duration: float, concurrency: int = 1, rate: float = 0):
+        """
+        初始化压测执行器
+
+        Args:
+            api_client: API客户端实例
+            duration: 每个用例的压测时长(秒)
+            concurrency: 并发工作线程数
+            rate: 目标速率(请求/秒)，0表示不限速
+        """
+        self.api_client = api_client
+        self.duration = duration
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+
+    def run(self, test_case: Dict[str, Any]) -> LoadResult:
+        """
+        压测单个测试用例
+
+        Args:
+            test_case: 测试用例数据
+
+        Returns:
+            压测结果
+        """
+        result = LoadResult(test_case.get('接口编号', 'unknown'), test_case.get('_record_id'))
+        limiter = TokenBucket(self.rate, capacity=1) if self.rate > 0 else None
+        counter_lock = threading.Lock()
+
+        logger.info(f"压测用例 {result.test_id}: {self.duration}秒, 并发{self.concurrency}"
+                    + (f", 目标速率{self.rate} rps" if limiter else ""))
+
+        start = time.monotonic()
+        deadline = start + self.duration
+
+        def worker() -> None:
+            while True:
+                if limiter:
+                    wait = limiter.reserve()
+                    if time.monotonic() + wait >= deadline:
+                        break
+                    if wait > 0:
+                        time.sleep(wait)
+                elif time.monotonic() >= deadline:
+                    break
+
+                # 以调用耗时计延迟，包含APIClient内部的重试
+                sent_at = perf_counter()
+                status_code, _, _, error = self.api_client.execute_test_case(test_case)
+                result.histogram.record(perf_counter() - sent_at)
+
+                failed = is_failed_request(test_case, status_code, error)
+                with counter_lock:
+                    result.requests += 1
+                    if failed:
+                        result.errors += 1
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for future in [pool.submit(worker) for _ in range(self.concurrency)]:
+                future.result()
+
+        result.duration = time.monotonic() - start
+        logger.info(f"压测完成 {result.summary()}")
+        return result
+
+
+class ConstantRateRunner:
+    """
+    开环压测执行器
+
+    按固定到达速率安排发送时刻（第i个请求在 start + i/rate 发出），不因服务端
+    变慢而减少发送量。延迟从计划发送时刻开始计算，调度落后的等待时间也计入延迟，
+    避免协调遗漏(coordinated omission)。在途请求达到max_in_flight时该时隙记为丢失。
+    """
+
+    def __init__(self, api_client: APIClient, rate: float, duration: float, max_in_flight: int = 100):
+        """
+        初始化开环压测执行器
+
+        Args:
+            api_client: API客户端实例
+            rate: 到达速率(请求/秒)
+            duration: 每个用例的压测时长(秒)
+            max_in_flight: 同时在途请求数上限（即发送线程数）
+        """
+        if rate <= 0:
+            raise ValueError("开环压测需要指定大于0的速率")
+
+        self.api_client = api_client
+        self.rate = rate
+        self.duration = duration
+        self.max_in_flight = max(1, max_in_flight)
+
+    def run(self, test_case: Dict[str, Any]) -> LoadResult:
+        """
+        压测单个测试用例
+
+        Args:
+            test_case: 测试用例数据
+
+        Returns:
+            压测结果
+        """
+        result = LoadResult(test_case.get('接口编号', 'unknown'), test_case.get('_record_id'))
+        total_slots = int(self.rate * self.duration)
+        interval = 1.0 / self.rate
+        in_flight = 0
+        lock = threading.Lock()
+
+        logger.info(f"开环压测用例 {result.test_id}: {self.rate} rps × {self.duration}秒, "
+                    f"在途上限{self.max_in_flight}")
+
+        def send(intended_at: float) -> None:
+            nonlocal in_flight
+            try:
+                status_code, _, _, error = self.api_client.execute_test_case(test_case)
+                result.histogram.record(perf_counter() - intended_at)
+                failed = is_failed_request(test_case, status_code, error)
+            except Exception as e:
+                logger.error(f"压测请求异常: {str(e)}")
+                failed = True
+            with lock:
+                in_flight -= 1
+                result.requests += 1
+                if failed:
+                    result.errors += 1
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            for slot in range(total_slots):
+                intended_at = start + slot * interval
+                wait = intended_at - perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+
+                with lock:
+                    if in_flight >= self.max_in_flight:
+                        result.missed += 1
+                        continue
+                    in_flight += 1
+                pool.submit(send, intended_at)
+
+        result.duration = perf_counter() - start
+        if result.missed:
+            logger.warning(f"用例 {result.test_id} 有 {result.missed}/{total_slots} 个发送时隙因在途请求已满被丢弃")
+        logger.info(f"压测完成 {result.summary()}")
+        return result
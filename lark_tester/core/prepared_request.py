@@ -0,0 +1,217 @@
+"""
+预编译请求模块
+
+将测试用例的请求方法、URL、请求头和请求体一次性解析为不可变的请求对象，
+按记录ID和字段摘要缓存，重复执行（压测、多轮执行）时不再重复解析
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+from ..utils.formatter import parse_headers, parse_request_body, format_url
+from ..utils.logger import get_logger
+from ..utils.template import compile_template
+
+logger = get_logger(__name__)
+
+DEFAULT_USER_AGENT = 'lark-api-tester/1.0.0'
+
+# 需要完整响应体的用例勾选此字段（复选框）
+FULL_BODY_FIELD = '完整响应体'
+
+# 决定请求内容的用例字段
+REQUEST_FIELDS = ('请求方法', '接口路径', '请求头', '请求体', FULL_BODY_FIELD)
+# 可以引用 ${变量} 的用例字段
+TEMPLATE_FIELDS = ('接口路径', '请求头', '请求体')
+
+
+@dataclass(frozen=True)
+class PreparedCase:
+    """预编译的不可变请求"""
+    method: str
+    url: str
+    headers: Tuple[Tuple[str, str], ...]
+    body: Optional[bytes] = None
+    full_body: bool = False
+
+    def header_dict(self) -> Dict[str, str]:
+        """请求头字典（每次返回新字典，调用方可以修改）"""
+        return dict(self.headers)
+
+
+def compile_request(
+    method: str,
+    url: str,
+    base_url: str = "",
+    headers: Optional[Dict[str, Any]] = None,
+    data: Any = None,
+    params: Optional[Dict[str, Any]] = None,
+    full_body: bool = False
+) -> PreparedCase:
+    """
+    将请求参数编译为PreparedCase
+
+    字典或列表请求体按JSON编码（与requests的json参数一致，未指定时补充
+    Content-Type），字符串请求体按UTF-8编码。
+
+    Args:
+        method: HTTP方法
+        url: 请求URL或接口路径
+        base_url: 基础URL
+        headers: 请求头
+        data: 请求体数据
+        params: URL参数
+        full_body: 是否保留完整响应体
+
+    Returns:
+        PreparedCase对象
+    """
+    # 格式化URL
+    if base_url and not url.startswith('http'):
+        url = format_url(base_url, url)
+    if params:
+        url += ('&' if '?' in url else '?') + urlencode(params)
+
+    headers = dict(headers or {})
+    if 'User-Agent' not in headers:
+        headers['User-Agent'] = DEFAULT_USER_AGENT
+
+    if isinstance(data, (dict, list)):
+        body = json.dumps(data, allow_nan=False).encode('utf-8')
+        if not any(key.lower() == 'content-type' for key in headers):
+            headers['Content-Type'] = 'application/json'
+    elif isinstance(data, bytes):
+        body = data or None
+    elif data:
+        body = str(data).encode('utf-8')
+    else:
+        body = None
+
+    return PreparedCase(
+        method=method.upper(),
+        url=url,
+        headers=tuple((str(key), str(value)) for key, value in headers.items()),
+        body=body,
+        full_body=full_body
+    )
+
+
+def compile_test_case(
+    test_case: Dict[str, Any],
+    base_url: str = "",
+    variables: Optional[Mapping[str, Any]] = None
+) -> PreparedCase:
+    """
+    将测试用例编译为PreparedCase
+
+    接口路径、请求头、请求体中的 ${变量} 在解析前代入，未定义的变量在此报告并保留原文。
+
+    Args:
+        test_case: 测试用例数据
+        base_url: 基础URL
+        variables: 变量值
+
+    Returns:
+        PreparedCase对象
+    """
+    fields = {name: test_case.get(name, '') for name in TEMPLATE_FIELDS}
+    unresolved = []
+    for name, value in fields.items():
+        if isinstance(value, str) and '${' in value:
+            template = compile_template(value)
+            unresolved.extend(var for var in template.unresolved(variables) if var not in unresolved)
+            fields[name] = template.render(variables)
+    if unresolved:
+        logger.warning(f"用例 {test_case.get('接口编号', 'unknown')} 引用了未定义的变量: {', '.join(unresolved)}")
+
+    return compile_request(
+        method=test_case.get('请求方法', 'GET'),
+        url=fields['接口路径'],
+        base_url=base_url,
+        headers=parse_headers(fields['请求头']),
+        data=parse_request_body(fields['请求体']),
+        full_body=bool(test_case.get(FULL_BODY_FIELD))
+    )
+
+
+class PreparedCaseCache:
+    """
+    预编译请求的LRU缓存
+
+    以 (记录ID, 请求字段摘要) 为键，用例内容或基础URL变化后摘要随之变化，
+    旧条目自然被淘汰。线程安全。
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        初始化缓存
+
+        Args:
+            max_size: 最多缓存的请求数，0表示不缓存
+        """
+        self.max_size = max_size
+        self._items: 'OrderedDict[Tuple[Any, ...], PreparedCase]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(
+        test_case: Dict[str, Any],
+        base_url: str = "",
+        variables: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[Any, ...]:
+        """生成用例请求字段、基础URL和变量值的可哈希摘要（列表等不可哈希的值取repr）"""
+        values = [test_case.get(name) for name in REQUEST_FIELDS]
+        if variables:
+            values.append(sorted(variables.items()))
+        return (base_url,) + tuple(
+            value if value is None or isinstance(value, (str, int, float, bool)) else repr(value)
+            for value in values
+        )
+
+    def get(
+        self,
+        test_case: Dict[str, Any],
+        base_url: str = "",
+        variables: Optional[Mapping[str, Any]] = None
+    ) -> PreparedCase:
+        """
+        获取用例的预编译请求，未命中时编译并缓存
+
+        Args:
+            test_case: 测试用例数据
+            base_url: 基础URL
+            variables: 代入请求字段的变量值
+
+        Returns:
+            PreparedCase对象
+        """
+        if not self.max_size:
+            return compile_test_case(test_case, base_url, variables)
+
+        key = (str(test_case.get('_record_id', '')),) + self.fingerprint(test_case, base_url, variables)
+        with self._lock:
+            prepared = self._items.get(key)
+            if prepared is not None:
+                self._items.move_to_end(key)
+                return prepared
+
+        prepared = compile_test_case(test_case, base_url, variables)
+
+        with self._lock:
+            self._items[key] = prepared
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        return prepared
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,309 @@
+"""
+记录缓存模块
+
+使用本地SQLite文件缓存多维表格记录，按修改时间增量同步，
+避免每次执行都重新下载整张测试用例表
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set
+
+from .lark_client import LarkClient, LarkError
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Lark日期筛选按天比较，增量查询向前多取一天
+_DAY_MS = 24 * 60 * 60 * 1000
+# 水位线回退量，容忍本地与服务端的时钟偏差
+_CLOCK_SKEW_MS = 5 * 60 * 1000
+# 修改时间字段类型：1002=修改时间，5=日期
+_MODIFIED_FIELD_TYPES = {1002, 5}
+# 每个写入事务包含的记录数
+_WRITE_BATCH_SIZE = 500
+
+
+class RecordCache:
+    """
+    多维表格记录的本地缓存
+
+    以app_token/table_id为键保存记录和同步水位线。首次同步全量下载；
+    之后只通过查询接口拉取修改时间字段晚于水位线的记录并合并到本地，
+    再用只返回记录ID的分页请求清理已在表格中删除的记录。
+
+    下载过程中不持有锁和事务，记录按批在各自的短事务中写入，中途失败时已写入的批次保留，
+    水位线不前进，下次同步重新拉取（写入是幂等的）。
+
+    回写测试结果同样会更新记录的修改时间，回写过的记录在下次同步时会重新下载。
+    修改时间字段应设置为只跟踪用例字段（接口路径、请求体、断言规则等），
+    不跟踪结果字段，这样只有用例本身的修改才会触发重新下载；回写成功的结果字段
+    通过update_fields写入缓存，缓存中的结果与表格保持一致。
+    """
+
+    def __init__(self, db_path: str):
+        """
+        初始化记录缓存
+
+        Args:
+            db_path: SQLite数据库文件路径
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                app_token TEXT NOT NULL,
+                table_id TEXT NOT NULL,
+                record_id TEXT NOT NULL,
+                fields TEXT NOT NULL,
+                position INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (app_token, table_id, record_id)
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                app_token TEXT NOT NULL,
+                table_id TEXT NOT NULL,
+                watermark INTEGER NOT NULL,
+                PRIMARY KEY (app_token, table_id)
+            );
+        """)
+        self._conn.commit()
+
+    def get_watermark(self, app_token: str, table_id: str) -> Optional[int]:
+        """
+        获取表格的同步水位线
+
+        Args:
+            app_token: 应用Token
+            table_id: 表格ID
+
+        Returns:
+            毫秒时间戳，从未同步过时返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM sync_state WHERE app_token = ? AND table_id = ?",
+                (app_token, table_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def iter_records(self, app_token: str, table_id: str,
+                     downloaded: Optional[Set[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        迭代缓存中的记录
+
+        Args:
+            app_token: 应用Token
+            table_id: 表格ID
+            downloaded: 本次同步下载的记录ID，传入时其余记录标记为 'cached': True
+
+        Yields:
+            记录字典，格式为 {'record_id': ..., 'fields': {...}}
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT record_id, fields FROM records WHERE app_token = ? AND table_id = ? ORDER BY position",
+                (app_token, table_id)
+            ).fetchall()
+
+        for record_id, fields in rows:
+            record = {'record_id': record_id, 'fields': json.loads(fields)}
+            if downloaded is not None and record_id not in downloaded:
+                record['cached'] = True
+            yield record
+
+    def update_fields(self, app_token: str, table_id: str, record_id: str, fields: Dict[str, Any]) -> bool:
+        """
+        将已写入表格的字段合并到缓存的记录中
+
+        回写结果不一定会触发重新下载（修改时间字段只跟踪用例字段时），
+        缓存中的结果字段需要随回写更新，否则下次对比回写时基于过期的值。
+
+        Args:
+            app_token: 应用Token
+            table_id: 表格ID
+            record_id: 记录ID
+            fields: 已写入的字段，值为None表示清空
+
+        Returns:
+            缓存中是否有该记录
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT fields FROM records WHERE app_token = ? AND table_id = ? AND record_id = ?",
+                (app_token, table_id, record_id)
+            ).fetchone()
+            if row is None:
+                return False
+            cached = json.loads(row[0])
+            for name, value in fields.items():
+                if value is None:
+                    cached.pop(name, None)
+                else:
+                    cached[name] = value
+            self._conn.execute(
+                "UPDATE records SET fields = ? WHERE app_token = ? AND table_id = ? AND record_id = ?",
+                (json.dumps(cached, ensure_ascii=False), app_token, table_id, record_id)
+            )
+        return True
+
+    def clear(self, app_token: str, table_id: str) -> None:
+        """
+        清空表格的缓存和水位线，下次同步将全量下载
+
+        Args:
+            app_token: 应用Token
+            table_id: 表格ID
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM records WHERE app_token = ? AND table_id = ?", (app_token, table_id))
+            self._conn.execute("DELETE FROM sync_state WHERE app_token = ? AND table_id = ?", (app_token, table_id))
+
+    def sync(self, lark_client: LarkClient, table_id: str, modified_field: str) -> Iterator[Dict[str, Any]]:
+        """
+        与表格同步并迭代最新的记录
+
+        同步失败时保留原有缓存和水位线，直接返回表格的实时记录。
+
+        Args:
+            lark_client: Lark客户端实例
+            table_id: 表格ID
+            modified_field: 记录修改时间字段名（修改时间或日期类型）
+
+        Returns:
+            记录迭代器，格式为 {'record_id': ..., 'fields': {...}}；本次同步没有重新下载、
+            字段值来自本地缓存的记录带有 'cached': True
+        """
+        app_token = lark_client.app_token
+        watermark = self.get_watermark(app_token, table_id)
+        started_at = int(time.time() * 1000)
+
+        try:
+            field_info = lark_client.get_field_by_name(table_id, modified_field)
+            if not field_info or field_info.get('type') not in _MODIFIED_FIELD_TYPES:
+                logger.warning(f"表格缺少修改时间字段 {modified_field}，无法增量同步，使用全量读取")
+                return lark_client.iter_records(table_id)
+
+            if watermark is None:
+                downloaded = self._full_sync(lark_client, table_id)
+            else:
+                downloaded = self._incremental_sync(lark_client, table_id, modified_field, watermark)
+
+        except LarkError as e:
+            logger.error(f"同步记录缓存失败，使用全量读取: {str(e)}")
+            return lark_client.iter_records(table_id)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (app_token, table_id, watermark) VALUES (?, ?, ?)",
+                (app_token, table_id, started_at - _CLOCK_SKEW_MS)
+            )
+
+        return self.iter_records(app_token, table_id, downloaded)
+
+    def _full_sync(self, lark_client: LarkClient, table_id: str) -> Set[str]:
+        """全量下载表格记录并替换缓存，返回下载的记录ID"""
+        logger.info(f"记录缓存首次同步，全量下载表格 {table_id}")
+        app_token = lark_client.app_token
+        records = lark_client.iter_records(table_id, strict=True)
+
+        live_ids = []
+        for batch in _batches(records, _WRITE_BATCH_SIZE):
+            with self._lock, self._conn:
+                self._upsert(app_token, table_id, batch)
+            live_ids.extend(record['record_id'] for record in batch)
+
+        with self._lock, self._conn:
+            self._apply_live_ids(app_token, table_id, live_ids)
+
+        logger.info(f"记录缓存已写入 {len(live_ids)} 条记录")
+        return set(live_ids)
+
+    def _incremental_sync(self, lark_client: LarkClient, table_id: str,
+                          modified_field: str, watermark: int) -> Set[str]:
+        """拉取水位线之后修改的记录，并清理已删除的记录，返回下载的记录ID"""
+        app_token = lark_client.app_token
+        record_filter = {
+            'conjunction': 'and',
+            'conditions': [{
+                'field_name': modified_field,
+                'operator': 'isGreater',
+                'value': ['ExactDate', str(watermark - _DAY_MS)]
+            }]
+        }
+        changed = lark_client.iter_search_records(table_id, record_filter=record_filter, strict=True)
+
+        changed_ids = set()
+        for batch in _batches(changed, _WRITE_BATCH_SIZE):
+            with self._lock, self._conn:
+                self._upsert(app_token, table_id, batch)
+            changed_ids.update(record['record_id'] for record in batch)
+
+        # 只取修改时间字段，用于对比记录ID和记录顺序
+        live_ids = [
+            record['record_id']
+            for record in lark_client.iter_records(table_id, page_size=200, field_names=[modified_field], strict=True)
+        ]
+
+        with self._lock, self._conn:
+            deleted_count = self._apply_live_ids(app_token, table_id, live_ids)
+
+        logger.info(f"记录缓存增量同步完成: 更新{len(changed_ids)}条, 删除{deleted_count}条")
+        return changed_ids
+
+    def _apply_live_ids(self, app_token: str, table_id: str, live_ids: List[str]) -> int:
+        """删除表格中已不存在的记录并按表格顺序更新位置，返回删除的记录数（调用方需持有锁并处于事务中）"""
+        cached_ids = {
+            row[0] for row in self._conn.execute(
+                "SELECT record_id FROM records WHERE app_token = ? AND table_id = ?",
+                (app_token, table_id)
+            )
+        }
+        deleted_ids = cached_ids - set(live_ids)
+        self._conn.executemany(
+            "DELETE FROM records WHERE app_token = ? AND table_id = ? AND record_id = ?",
+            [(app_token, table_id, record_id) for record_id in deleted_ids]
+        )
+        self._conn.executemany(
+            "UPDATE records SET position = ? WHERE app_token = ? AND table_id = ? AND record_id = ?",
+            [(position, app_token, table_id, record_id) for position, record_id in enumerate(live_ids)]
+        )
+        return len(deleted_ids)
+
+    def _upsert(self, app_token: str, table_id: str, records: Iterable[Dict[str, Any]]) -> int:
+        """写入或更新记录，新记录按到达顺序排在末尾（调用方需持有锁并处于事务中）"""
+        next_position = self._conn.execute(
+            "SELECT COALESCE(MAX(position) + 1, 0) FROM records WHERE app_token = ? AND table_id = ?",
+            (app_token, table_id)
+        ).fetchone()[0]
+
+        count = 0
+        for record in records:
+            self._conn.execute(
+                "INSERT INTO records (app_token, table_id, record_id, fields, position) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (app_token, table_id, record_id) DO UPDATE SET fields = excluded.fields",
+                (app_token, table_id, record['record_id'],
+                 json.dumps(record['fields'], ensure_ascii=False), next_position + count)
+            )
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+
+def _batches(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """按批取出记录，每批在网络读取完成后再写入"""
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,215 @@
+"""
+重试策略模块
+
+提供可替换的HTTP重试策略：指数退避+全抖动、按状态码重试、遵守Retry-After、
+区分幂等请求，以及限制整体重试比例的全局重试预算
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, FrozenSet, Optional
+
+from .prepared_request import PreparedCase
+
+# 可重试的响应状态码
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+# 幂等的HTTP方法
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'})
+# 携带该请求头的非幂等请求视为可安全重试
+IDEMPOTENCY_KEY_HEADER = 'idempotency-key'
+
+# 失败类型：connect=连接未建立（请求未发出），timeout=读取超时，connection=连接中断
+FAILURE_CONNECT = 'connect'
+FAILURE_TIMEOUT = 'timeout'
+FAILURE_CONNECTION = 'connection'
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析Retry-After响应头
+
+    Args:
+        value: 秒数或HTTP日期
+
+    Returns:
+        需要等待的秒数，无法解析时返回None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class RetryBudget:
+    """
+    全局重试预算
+
+    每个请求存入ratio个令牌，每次重试消耗一个令牌，令牌不足时不再重试。
+    目标服务整体异常时重试量被限制在请求量的ratio比例内，避免重试风暴。
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, capacity: Optional[float] = None):
+        """
+        初始化重试预算
+
+        Args:
+            ratio: 允许的重试请求比例
+            min_retries: 初始令牌数，保证请求量较少时也能重试
+            capacity: 令牌上限，默认为 min_retries + 100 * ratio
+        """
+        self.ratio = ratio
+        self.capacity = capacity if capacity is not None else min_retries + 100 * ratio
+        self._tokens = float(min_retries)
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """记录一次新请求（不含重试）"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        尝试消耗一次重试额度
+
+        Returns:
+            是否允许重试
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    HTTP重试策略
+
+    退避时间在 [0, min(max_delay, base_delay * 2^attempt)] 内均匀随机（全抖动），
+    避免并发工作线程同步重试；响应带Retry-After时以其为准。非幂等请求（POST、PATCH）
+    只在确定未被服务端处理时重试：连接未建立或429，除非请求带有Idempotency-Key。
+    可继承并重写 is_retryable / backoff 定制策略。
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES,
+        retry_non_idempotent: bool = False,
+        budget: Optional[RetryBudget] = None
+    ):
+        """
+        初始化重试策略
+
+        Args:
+            max_retries: 最大重试次数
+            base_delay: 退避基准时间(秒)
+            max_delay: 单次退避上限(秒)，同时限制Retry-After
+            retry_statuses: 需要重试的响应状态码
+            retry_non_idempotent: 是否像幂等请求一样重试POST等非幂等请求
+            budget: 全局重试预算，None表示不限制
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.budget = budget
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'RetryPolicy':
+        """
+        根据API配置创建重试策略
+
+        Args:
+            config: get_api_config返回的配置字典
+
+        Returns:
+            RetryPolicy对象
+        """
+        ratio = config.get('retry_budget_ratio', 0.2)
+        return cls(
+            max_retries=config.get('max_retries', 3),
+            base_delay=config.get('retry_delay', 1.0),
+            max_delay=config.get('retry_max_delay', 30.0),
+            retry_non_idempotent=config.get('retry_non_idempotent', False),
+            budget=RetryBudget(ratio) if ratio and ratio > 0 else None
+        )
+
+    def record_request(self) -> None:
+        """记录一次新请求，为重试预算存入额度"""
+        if self.budget:
+            self.budget.record_request()
+
+    def is_idempotent(self, prepared: PreparedCase) -> bool:
+        """判断请求是否可以安全重复发送"""
+        if self.retry_non_idempotent or prepared.method in IDEMPOTENT_METHODS:
+            return True
+        return any(key.lower() == IDEMPOTENCY_KEY_HEADER for key, _ in prepared.headers)
+
+    def is_retryable(self, prepared: PreparedCase, status_code: Optional[int] = None,
+                     failure: Optional[str] = None) -> bool:
+        """
+        判断一次失败是否值得重试（不考虑次数和预算）
+
+        Args:
+            prepared: 预编译请求
+            status_code: 响应状态码（请求异常时为None）
+            failure: 请求异常类型（FAILURE_*）
+
+        Returns:
+            是否可重试
+        """
+        if failure == FAILURE_CONNECT:
+            return True
+        if failure is not None:
+            return self.is_idempotent(prepared)
+        if status_code not in self.retry_statuses:
+            return False
+        # 429表示请求被限流而未处理
+        return status_code == 429 or self.is_idempotent(prepared)
+
+    def should_retry(self, prepared: PreparedCase, attempt: int, status_code: Optional[int] = None,
+                     failure: Optional[str] = None) -> bool:
+        """
+        判断是否进行下一次重试
+
+        Args:
+            prepared: 预编译请求
+            attempt: 已完成的尝试序号（从0开始）
+            status_code: 响应状态码
+            failure: 请求异常类型
+
+        Returns:
+            是否重试
+        """
+        if attempt >= self.max_retries or not self.is_retryable(prepared, status_code, failure):
+            return False
+        if self.budget and not self.budget.try_spend():
+            return False
+        return True
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        计算重试前的等待时间
+
+        Args:
+            attempt: 已完成的尝试序号（从0开始）
+            retry_after: 响应要求的等待秒数
+
+        Returns:
+            等待秒数
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
@@ -5,17 +5,293 @@
 """
 
 import time
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Set, Tuple, Union
 from datetime import datetime
+from urllib.parse import urlparse
 
 from .lark_client import LarkClient
-from .api_client import APIClient, AssertionValidator
+from .record_cache import RecordCache
+from .dependency import DependencyScheduler, EXTRACT_FIELD, blocked_result, extract_variables
+from .api_client import APIClient, AssertionValidator, LATENCY_BUDGET_FIELD, FULL_BODY_FIELD
+from .http_timing import TIMING_PHASES
+from .load_runner import LoadResult, LoadTestRunner, ConstantRateRunner, LOAD_RESULT_FIELDS
 from ..utils.logger import get_logger
-from ..utils.formatter import format_test_result
+from ..utils.formatter import format_test_result, format_url, normalize_field_value, replace_variables
+from ..utils.response_body import ResponseBody, DEFAULT_PREVIEW_LENGTH
 from ..utils.validator import validate_test_case
 
 logger = get_logger(__name__)
 
+# 结果中按需创建的字段及其类型（2=数字，1=多行文本）
+RESULT_FIELD_TYPES = {
+    '响应时间': 2,
+    '性能断言': 1,
+}
+
+# 回写的结果字段，加载时只保留这些字段的当前值用于回写对比
+RESULT_FIELDS = ('响应状态码', '响应体', '响应时间', '是否通过', '性能断言')
+
+# 验证失败的用例中保存错误信息的内部字段
+CASE_ERRORS_FIELD = '_errors'
+
+# 每次执行都会变化的测量值，不作为记录是否变化的依据，只随其他结果字段一起回写
+VOLATILE_RESULT_FIELDS = ('响应时间',)
+
+
+def prepare_test_case(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    将表格记录转换为测试用例，缺少接口路径或请求方法的记录返回None
+    
+    验证失败的用例（如断言规则语法错误）仍然返回，错误信息保存在_errors中，
+    执行时不发送请求，直接记为失败并回写原因，避免表格保留上次的结果。
+    
+    Args:
+        record: 表格记录（包含record_id和fields）
+        
+    Returns:
+        带有_record_id的测试用例字段字典或None
+    """
+    fields = record.get('fields', {})
+    
+    # 基本字段检查
+    if not fields.get('接口路径') or not fields.get('请求方法'):
+        logger.warning(f"跳过无效记录: {record.get('record_id', 'unknown')}")
+        return None
+    
+    # 验证测试用例
+    is_valid, errors = validate_test_case(fields)
+    if not is_valid:
+        logger.warning(f"测试用例验证失败: {errors}")
+        fields[CASE_ERRORS_FIELD] = errors
+    
+    # 添加记录ID到字段中
+    fields['_record_id'] = record['record_id']
+    return fields
+
+
+def invalid_case_result(test_case: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    生成验证失败用例的失败结果
+    
+    Args:
+        test_case: 测试用例数据
+        
+    Returns:
+        用例验证失败时返回测试结果，否则返回None
+    """
+    errors = test_case.get(CASE_ERRORS_FIELD)
+    if not errors:
+        return None
+    return blocked_result(test_case, f"测试用例验证失败: {'; '.join(errors)}")
+
+
+def build_test_result(
+    test_case: Dict[str, Any],
+    status_code: int,
+    response_body: Union[str, ResponseBody],
+    response_time: float,
+    error: Optional[str],
+    timings: Optional[Dict[str, float]] = None,
+    body_info: Optional[Dict[str, Any]] = None,
+    attempts: Optional[List[Dict[str, Any]]] = None,
+    max_length: int = DEFAULT_PREVIEW_LENGTH
+) -> Dict[str, Any]:
+    """
+    根据请求结果验证断言并生成测试结果
+    
+    Args:
+        test_case: 测试用例数据
+        status_code: 响应状态码
+        response_body: 响应体或ResponseBody（断言和格式化共用其解析结果）
+        response_time: 响应时间(秒)
+        error: 请求错误信息
+        timings: 分阶段耗时(秒)，保存到结果的_timings中(毫秒)，不回写表格
+        body_info: 响应体大小、SHA-256和截断信息，保存到结果的_body中
+        attempts: 每次尝试的记录（含分阶段耗时），保存到结果的_attempts中
+        max_length: 回写的响应体最大长度
+        
+    Returns:
+        测试结果数据
+    """
+    # 如果请求失败，直接返回失败结果
+    if error:
+        result = format_test_result(
+            status_code=0,
+            response_body="",
+            response_time=None,
+            is_passed=False,
+            error_message=error
+        )
+        result['_record_id'] = test_case.get('_record_id')
+        if attempts:
+            result['_attempts'] = attempts
+        return result
+    
+    # 验证响应结果，响应时间断言与功能断言分开判定
+    expected_status = test_case.get('预期状态码')
+    assertion_rules, latency_budgets = AssertionValidator.extract_latency_budgets(
+        test_case.get('断言规则'), test_case.get(LATENCY_BUDGET_FIELD)
+    )
+    
+    # 断言和响应体格式化共用同一个响应体对象，JSON只解析一次
+    if not isinstance(response_body, ResponseBody):
+        response_body = ResponseBody.from_text(response_body)
+    truncated = bool(body_info and body_info.get('truncated'))
+    if truncated and assertion_rules:
+        # 截断的响应体上执行断言结果不可靠，需要用例显式勾选完整响应体
+        is_passed, validation_error = False, (
+            f"响应体共{body_info['size']}字节已被截断，断言需要完整响应体时请勾选\"{FULL_BODY_FIELD}\""
+        )
+    else:
+        is_passed, validation_error = AssertionValidator.validate_response(
+            response_status=status_code,
+            response_body=response_body,
+            expected_status=expected_status,
+            assertion_rules=assertion_rules
+        )
+    
+    sla_passed, sla_error = None, ""
+    if latency_budgets:
+        sla_passed, sla_error = AssertionValidator.validate_response_time(response_time, latency_budgets)
+    
+    # 格式化测试结果
+    result = format_test_result(
+        status_code=status_code,
+        response_body=response_body,
+        response_time=response_time,
+        is_passed=is_passed,
+        error_message=validation_error if not is_passed else "",
+        sla_passed=sla_passed,
+        sla_message=sla_error,
+        max_length=max_length
+    )
+    
+    if truncated:
+        result['响应体'] += f"\n\n[响应体已截断: 共{body_info['size']}字节, sha256={body_info['sha256']}]"
+    
+    result['_record_id'] = test_case.get('_record_id')
+    if body_info:
+        result['_body'] = body_info
+    if attempts:
+        result['_attempts'] = attempts
+    if timings:
+        result['_timings'] = {phase: round(value * 1000, 2) for phase, value in timings.items()}
+    return result
+
+
+def adapt_result_fields(
+    fields: Dict[str, Any],
+    field_infos: Dict[str, Optional[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    按表格中结果字段的实际情况调整回写字段
+    
+    无法创建的结果字段不回写；已存在的响应时间字段如果是文本类型，按文本写入。
+    
+    Args:
+        fields: 待回写的字段
+        field_infos: RESULT_FIELD_TYPES中各字段的表格字段信息（不存在为None）
+        
+    Returns:
+        调整后的字段字典
+    """
+    adapted = dict(fields)
+    for field_name, field_info in field_infos.items():
+        if field_name not in adapted:
+            continue
+        if not field_info:
+            adapted.pop(field_name)
+        elif (field_info.get('type') != RESULT_FIELD_TYPES[field_name] and field_info.get('type') == 1
+              and adapted[field_name] is not None):
+            adapted[field_name] = str(adapted[field_name])
+    return adapted
+
+
+def result_snapshot(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    取出记录中结果字段的当前值，回写时与新结果对比（不保留请求体等用例字段）
+    
+    Args:
+        fields: 记录字段或测试用例
+        
+    Returns:
+        结果字段的值
+    """
+    return {k: fields.get(k) for k in RESULT_FIELDS}
+
+
+def select_changed_fields(
+    update_fields: Dict[str, Any],
+    loaded: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    选出与表格当前值不同、需要回写的字段
+    
+    只有响应时间等测量值（VOLATILE_RESULT_FIELDS）变化时视为记录未变化。
+    
+    Args:
+        update_fields: 待回写的字段
+        loaded: 加载用例时读取的记录字段，为None时全部回写
+        
+    Returns:
+        需要回写的字段，记录未变化时返回None
+    """
+    if loaded is None:
+        return update_fields
+    changed_fields = {
+        k: v for k, v in update_fields.items()
+        if normalize_field_value(loaded.get(k)) != normalize_field_value(v)
+    }
+    if all(k in VOLATILE_RESULT_FIELDS for k in changed_fields):
+        return None
+    return changed_fields
+
+
+class HostThrottle:
+    """
+    按目标主机限制并发请求
+
+    每个主机同时在途的请求数不超过 max_in_flight，且相邻两次请求的
+    发起间隔不小于 request_delay，保证并发执行时仍遵守请求间隔配置。
+    """
+    
+    def __init__(self, max_in_flight: int, request_delay: float = 0):
+        """
+        初始化主机限流器
+        
+        Args:
+            max_in_flight: 每个主机最大在途请求数
+            request_delay: 同一主机相邻请求的最小间隔(秒)
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.request_delay = request_delay
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._pacing_locks: Dict[str, threading.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+    
+    def acquire(self, host: str) -> None:
+        """占用主机的一个在途名额，必要时等待请求间隔"""
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.Semaphore(self.max_in_flight)
+                self._pacing_locks[host] = threading.Lock()
+                self._next_start[host] = 0.0
+        
+        self._semaphores[host].acquire()
+        
+        if self.request_delay > 0:
+            with self._pacing_locks[host]:
+                wait = self._next_start[host] - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                self._next_start[host] = time.monotonic() + self.request_delay
+    
+    def release(self, host: str) -> None:
+        """释放主机的在途名额"""
+        self._semaphores[host].release()
+
 
 class TestExecutor:
     """API测试执行器"""
@@ -38,100 +314,106 @@ class TestExecutor:
         self.api_client = api_client or APIClient()
         self.config = config or {}
         self.test_results = []
+        
+        # 加载时各记录结果字段的值（按记录ID，不保留用例字段），用于回写前对比，跳过未变化的字段
+        self._loaded_fields: Dict[str, Dict[str, Any]] = {}
+        # 对比基准取自本地记录缓存（本次未从表格下载）的记录ID，缓存可能落后于表格
+        self._cached_baseline: Set[str] = set()
+        # 最近一次回写的统计
+        self.write_stats: Dict[str, int] = {}
+        
+        # 可选的本地记录缓存（增量同步测试用例表）
+        cache_path = self.config.get('record_cache_path')
+        self.record_cache = RecordCache(cache_path) if cache_path else None
     
-    def load_test_cases(self, table_id: str) -> List[Dict[str, Any]]:
+    def iter_test_cases(self, table_id: str) -> Iterator[Dict[str, Any]]:
         """
-        从表格加载测试用例
+        逐页读取并校验测试用例（生成器），用例随表格分页到达即可分发执行
         
         Args:
             table_id: 表格ID
             
-        Returns:
-            测试用例列表
+        Yields:
+            测试用例（验证失败的用例带有_errors）
         """
         logger.info(f"从表格 {table_id} 加载测试用例...")
         
+        valid_count = 0
+        invalid_count = 0
         try:
-            records = self.lark_client.get_all_records(table_id)
-            logger.info(f"成功加载 {len(records)} 条记录")
+            if self.record_cache:
+                records = self.record_cache.sync(
+                    self.lark_client, table_id, self.config.get('record_cache_field', '更新时间')
+                )
+            else:
+                records = self.lark_client.iter_records(table_id)
             
-            # 过滤和验证测试用例
-            valid_cases = []
             for record in records:
-                fields = record.get('fields', {})
-                
-                # 基本字段检查
-                if not fields.get('接口路径') or not fields.get('请求方法'):
-                    logger.warning(f"跳过无效记录: {record.get('record_id', 'unknown')}")
-                    continue
-                
-                # 验证测试用例
-                is_valid, errors = validate_test_case(fields)
-                if not is_valid:
-                    logger.warning(f"测试用例验证失败: {errors}")
-                    continue
-                
-                # 添加记录ID到字段中
-                fields['_record_id'] = record['record_id']
-                valid_cases.append(fields)
-            
-            logger.info(f"有效测试用例: {len(valid_cases)} 条")
-            return valid_cases
-            
+                test_case = prepare_test_case(record)
+                if test_case is not None:
+                    if test_case.get(CASE_ERRORS_FIELD):
+                        invalid_count += 1
+                    else:
+                        valid_count += 1
+                    self._loaded_fields[test_case['_record_id']] = result_snapshot(test_case)
+                    if record.get('cached'):
+                        self._cached_baseline.add(test_case['_record_id'])
+                    else:
+                        self._cached_baseline.discard(test_case['_record_id'])
+                    yield test_case
         except Exception as e:
             logger.error(f"加载测试用例失败: {str(e)}")
-            return []
+        
+        logger.info(f"有效测试用例: {valid_count} 条" + (f"，验证失败: {invalid_count} 条" if invalid_count else ""))
+    
+    def load_test_cases(self, table_id: str) -> List[Dict[str, Any]]:
+        """
+        从表格加载测试用例
+        
+        Args:
+            table_id: 表格ID
+            
+        Returns:
+            测试用例列表
+        """
+        return list(self.iter_test_cases(table_id))
     
-    def execute_single_test(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+    def execute_single_test(
+        self,
+        test_case: Dict[str, Any],
+        variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         执行单个测试用例
         
         Args:
             test_case: 测试用例数据
+            variables: 代入请求字段的变量值（上游用例提取的变量）
             
         Returns:
             测试结果数据
         """
         test_id = test_case.get('接口编号', 'unknown')
+        invalid = invalid_case_result(test_case)
+        if invalid is not None:
+            logger.info(f"测试用例 {test_id} 验证失败，不执行: FAIL")
+            return invalid
         logger.info(f"执行测试用例: {test_id}")
         
         try:
             # 发送API请求
-            status_code, response_body, response_time, error = self.api_client.execute_test_case(test_case)
-            
-            # 如果请求失败，直接返回失败结果
-            if error:
-                result = format_test_result(
-                    status_code=0,
-                    response_body="",
-                    response_time=0.0,
-                    is_passed=False,
-                    error_message=error
-                )
-                result['_record_id'] = test_case.get('_record_id')
-                return result
+            response = self.api_client.execute_test_case_detailed(test_case, variables)
             
-            # 验证响应结果
-            expected_status = test_case.get('预期状态码')
-            assertion_rules = test_case.get('断言规则')
-            
-            is_passed, validation_error = AssertionValidator.validate_response(
-                response_status=status_code,
-                response_body=response_body,
-                expected_status=expected_status,
-                assertion_rules=assertion_rules
-            )
-            
-            # 格式化测试结果
-            result = format_test_result(
-                status_code=status_code,
-                response_body=response_body,
-                response_time=response_time,
-                is_passed=is_passed,
-                error_message=validation_error if not is_passed else ""
+            result = build_test_result(
+                test_case, response.status_code, response.response_body(),
+                response.response_time, response.error, response.timings,
+                body_info=response.body_info() if not response.error else None,
+                attempts=response.attempts,
+                max_length=int(self.config.get('max_response_length', DEFAULT_PREVIEW_LENGTH))
             )
-            
-            result['_record_id'] = test_case.get('_record_id')
+            if not response.error and test_case.get(EXTRACT_FIELD):
+                result['_variables'] = extract_variables(test_case, response.response_body())
+            is_passed = result.get('是否通过') == 'PASS'
             
             logger.info(f"测试用例 {test_id} 执行完成: {'PASS' if is_passed else 'FAIL'}")
             return result
@@ -143,7 +425,7 @@ class TestExecutor:
             result = format_test_result(
                 status_code=0,
                 response_body="",
-                response_time=0.0,
+                response_time=None,
                 is_passed=False,
                 error_message=error_msg
             )
@@ -161,44 +443,121 @@ class TestExecutor:
             测试结果统计
         """
         logger.info("开始执行所有测试用例...")
+        self._warm_up()
         start_time = time.time()
         
-        # 加载测试用例
-        test_cases = self.load_test_cases(table_id)
-        if not test_cases:
+        # 边加载边执行测试用例
+        test_cases = self.iter_test_cases(table_id)
+        workers = self._get_worker_count()
+        if workers > 1:
+            results = self._execute_concurrently(test_cases, workers)
+        else:
+            results = self._execute_sequentially(test_cases)
+        
+        if not results:
             logger.warning("没有找到有效的测试用例")
             return TestResults([], 0, 0, 0, 0.0)
         
-        # 执行测试
-        results = []
-        passed_count = 0
-        failed_count = 0
+        passed_count = sum(1 for result in results if result.get('是否通过') == 'PASS')
+        failed_count = len(results) - passed_count
+        
+        total_time = time.time() - start_time
+        
+        # 保存结果
+        self.test_results = results
         
-        for i, test_case in enumerate(test_cases, 1):
-            logger.info(f"执行进度: {i}/{len(test_cases)}")
+        logger.info(f"所有测试执行完成: 总数{len(results)}, 通过{passed_count}, 失败{failed_count}")
+        logger.info(f"总耗时: {total_time:.2f}秒")
+        
+        return TestResults(results, len(results), passed_count, failed_count, total_time)
+    
+    def _warm_up(self) -> None:
+        """按warm_up_connections配置预先建立到API基础URL的长连接，使计时不包含建连耗时"""
+        try:
+            connections = int(self.config.get('warm_up_connections', 0) or 0)
+        except (TypeError, ValueError):
+            logger.warning(f"无效的预热连接数配置: {self.config.get('warm_up_connections')}")
+            return
+        if connections > 0:
+            self.api_client.warm_up(connections)
+    
+    def _get_worker_count(self) -> int:
+        """获取配置的并发数"""
+        try:
+            return max(1, int(self.config.get('concurrency', 1) or 1))
+        except (TypeError, ValueError):
+            logger.warning(f"无效的并发配置: {self.config.get('concurrency')}，使用串行执行")
+            return 1
+    
+    def _execute_sequentially(self, test_cases: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        串行执行测试用例，引用其他用例提取变量的用例在其上游完成后执行
+        
+        Args:
+            test_cases: 测试用例（可以是逐页产出的生成器）
             
-            result = self.execute_single_test(test_case)
-            results.append(result)
+        Returns:
+            按用例顺序排列的测试结果列表
+        """
+        executed = 0
+        
+        def run(test_case: Dict[str, Any], variables: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal executed
+            executed += 1
+            logger.info(f"执行进度: 第{executed}条")
             
-            if result.get('是否通过') == 'PASS':
-                passed_count += 1
-            else:
-                failed_count += 1
+            result = self.execute_single_test(test_case, variables)
             
             # 可选的延迟，避免请求过于频繁
             delay = self.config.get('request_delay', 0)
             if delay > 0:
                 time.sleep(delay)
+            return result
         
-        total_time = time.time() - start_time
+        return DependencyScheduler(run, workers=1).run(test_cases)
+    
+    def _execute_concurrently(self, test_cases: Iterable[Dict[str, Any]], workers: int) -> List[Dict[str, Any]]:
+        """
+        使用有界线程池并发执行测试用例，用例到达且依赖的用例完成后即提交
         
-        # 保存结果
-        self.test_results = results
+        Args:
+            test_cases: 测试用例（可以是逐页产出的生成器）
+            workers: 工作线程数
+            
+        Returns:
+            按用例顺序排列的测试结果列表
+        """
+        logger.info(f"并发执行测试用例: {workers} 个工作线程")
         
-        logger.info(f"所有测试执行完成: 总数{len(test_cases)}, 通过{passed_count}, 失败{failed_count}")
-        logger.info(f"总耗时: {total_time:.2f}秒")
+        throttle = HostThrottle(
+            max_in_flight=self.config.get('max_in_flight_per_host') or workers,
+            request_delay=self.config.get('request_delay', 0)
+        )
+        completed = 0
+        progress_lock = threading.Lock()
         
-        return TestResults(results, len(test_cases), passed_count, failed_count, total_time)
+        def run(test_case: Dict[str, Any], variables: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal completed
+            host = self._get_target_host(test_case, variables)
+            throttle.acquire(host)
+            try:
+                result = self.execute_single_test(test_case, variables)
+            finally:
+                throttle.release(host)
+            
+            with progress_lock:
+                completed += 1
+                logger.info(f"执行进度: 已完成{completed}条")
+            return result
+        
+        # 结果顺序与表格一致
+        return DependencyScheduler(run, workers=workers).run(test_cases)
+    
+    def _get_target_host(self, test_case: Dict[str, Any], variables: Optional[Dict[str, Any]] = None) -> str:
+        """获取测试用例请求的目标主机"""
+        path = replace_variables(test_case.get('接口路径', ''), variables)
+        url = format_url(self.api_client.base_url, path) if self.api_client.base_url else path
+        return urlparse(url).netloc
     
     def write_results_to_table(self, table_id: str, results: List[Dict[str, Any]]) -> bool:
         """
@@ -214,7 +573,14 @@ class TestExecutor:
         logger.info(f"将测试结果回写到表格 {table_id}...")
         
         try:
-            success_count = 0
+            updates = []
+            skip_unchanged = self.config.get('skip_unchanged_writes', True)
+            skip_cached = self.config.get('skip_unchanged_cached', True)
+            skipped_records = 0
+            skipped_fields = 0
+            skipped_cached = 0
+            
+            field_infos = self._ensure_result_fields(table_id, results)
             
             for result in results:
                 record_id = result.get('_record_id')
@@ -224,22 +590,129 @@ class TestExecutor:
                 
                 # 移除内部字段
                 update_fields = {k: v for k, v in result.items() if not k.startswith('_')}
+                update_fields = adapt_result_fields(update_fields, field_infos)
                 
-                try:
-                    self.lark_client.update_record(table_id, record_id, update_fields)
-                    success_count += 1
-                    logger.debug(f"更新记录成功: {record_id}")
-                except Exception as e:
-                    logger.error(f"更新记录失败 {record_id}: {str(e)}")
-                    continue
+                # 只回写与表格当前值不同的字段；基准来自本地缓存时按配置决定是否信任
+                cached = record_id in self._cached_baseline
+                if skip_unchanged and (skip_cached or not cached):
+                    changed_fields = select_changed_fields(update_fields, self._loaded_fields.get(record_id))
+                    skipped_fields += len(update_fields) - len(changed_fields or {})
+                    if changed_fields is None:
+                        skipped_records += 1
+                        skipped_cached += cached
+                        continue
+                    update_fields = changed_fields
+                
+                updates.append({'record_id': record_id, 'fields': update_fields})
             
-            logger.info(f"结果回写完成: 成功{success_count}/{len(results)}")
-            return success_count == len(results)
+            if not updates:
+                success_count = 0
+            elif self.config.get('batch_write', True):
+                success_count = self._write_updates_in_batch(table_id, updates)
+            else:
+                success_count = self._write_updates_one_by_one(table_id, updates)
+            
+            self.write_stats = {
+                'written': success_count,
+                'skipped_records': skipped_records,
+                'skipped_fields': skipped_fields,
+                'skipped_cached': skipped_cached
+            }
+            
+            if skip_unchanged:
+                logger.info(
+                    f"跳过未变化的回写: {skipped_records}条记录, {skipped_fields}个字段"
+                    + (f"（其中{skipped_cached}条记录按本地缓存对比）" if skipped_cached else "")
+                )
+            logger.info(f"结果回写完成: 成功{success_count}/{len(updates)}")
+            return success_count == len(updates)
             
         except Exception as e:
             logger.error(f"回写结果失败: {str(e)}")
             return False
     
+    def _ensure_result_fields(self, table_id: str, results: List[Dict[str, Any]]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        确保结果中用到的新增结果字段在表格中存在
+        
+        Args:
+            table_id: 表格ID
+            results: 测试结果列表
+            
+        Returns:
+            字段名到表格字段信息的映射，创建失败的字段为None
+        """
+        field_infos = {}
+        for field_name, field_type in RESULT_FIELD_TYPES.items():
+            if any(field_name in result for result in results):
+                field_infos[field_name] = self.lark_client.ensure_field_exists(table_id, field_name, field_type)
+                if not field_infos[field_name]:
+                    logger.warning(f"结果字段 {field_name} 不存在且创建失败，跳过回写该字段")
+        return field_infos
+    
+    def _write_updates_in_batch(self, table_id: str, updates: List[Dict[str, Any]]) -> int:
+        """
+        通过批量接口回写结果
+        
+        Args:
+            table_id: 表格ID
+            updates: 更新列表
+            
+        Returns:
+            成功更新的记录数
+        """
+        batch_result = self.lark_client.batch_update_records(table_id, updates)
+        
+        for record_id, error in batch_result.failed.items():
+            logger.error(f"更新记录失败 {record_id}: {error}")
+        
+        succeeded = set(batch_result.succeeded)
+        for update in updates:
+            if update['record_id'] in succeeded:
+                self._remember_written(table_id, update)
+        
+        return len(batch_result.succeeded)
+    
+    def _write_updates_one_by_one(self, table_id: str, updates: List[Dict[str, Any]]) -> int:
+        """
+        逐条回写结果
+        
+        Args:
+            table_id: 表格ID
+            updates: 更新列表
+            
+        Returns:
+            成功更新的记录数
+        """
+        success_count = 0
+        
+        for update in updates:
+            record_id = update['record_id']
+            try:
+                if self.lark_client.update_record(table_id, record_id, update['fields']):
+                    self._remember_written(table_id, update)
+                    success_count += 1
+                    logger.debug(f"更新记录成功: {record_id}")
+            except Exception as e:
+                logger.error(f"更新记录失败 {record_id}: {str(e)}")
+                continue
+        
+        return success_count
+    
+    def _remember_written(self, table_id: str, update: Dict[str, Any]) -> None:
+        """记录已写入表格的字段值，同步到本地记录缓存，供下一次回写对比"""
+        loaded = self._loaded_fields.get(update['record_id'])
+        if loaded is not None:
+            loaded.update((k, v) for k, v in update['fields'].items() if k in RESULT_FIELDS)
+        self._cached_baseline.discard(update['record_id'])
+        if self.record_cache:
+            try:
+                self.record_cache.update_fields(
+                    self.lark_client.app_token, table_id, update['record_id'], update['fields']
+                )
+            except Exception as e:
+                logger.warning(f"更新记录缓存失败 {update['record_id']}: {str(e)}")
+    
     def run_full_test_cycle(self, table_id: str) -> 'TestResults':
         """
         运行完整的测试周期：加载->执行->回写
@@ -258,12 +731,99 @@ class TestExecutor:
         # 回写结果到表格
         if results.results:
             success = self.write_results_to_table(table_id, results.results)
+            results.writes_skipped = self.write_stats.get('skipped_records', 0)
+            results.writes_skipped_cached = self.write_stats.get('skipped_cached', 0)
             if success:
                 logger.info("测试结果已成功回写到表格")
             else:
                 logger.warning("部分测试结果回写失败")
         
         return results
+    
+    def run_load_test(
+        self,
+        table_id: str,
+        test_ids: Optional[List[str]] = None,
+        write_back: bool = True
+    ) -> List[LoadResult]:
+        """
+        逐个压测表格中的测试用例，并将百分位延迟回写到压测字段
+        
+        压测参数取自配置：load_duration(秒)、load_concurrency、load_rate(请求/秒，0为不限速)、
+        load_mode（closed为闭环，open为按load_rate固定到达速率发送，此时load_concurrency为在途上限）。
+        
+        Args:
+            table_id: 表格ID
+            test_ids: 只压测指定接口编号的用例（可选）
+            write_back: 是否回写压测结果
+            
+        Returns:
+            各用例的压测结果列表
+        """
+        duration = float(self.config.get('load_duration', 10))
+        concurrency = int(self.config.get('load_concurrency', 10) or 1)
+        rate = float(self.config.get('load_rate', 0) or 0)
+        
+        if self.config.get('load_mode', 'closed') == 'open':
+            runner = ConstantRateRunner(self.api_client, rate=rate, duration=duration, max_in_flight=concurrency)
+        else:
+            runner = LoadTestRunner(self.api_client, duration=duration, concurrency=concurrency, rate=rate)
+        
+        self._warm_up()
+        results = []
+        for test_case in self.iter_test_cases(table_id):
+            if test_ids and str(test_case.get('接口编号')) not in test_ids:
+                continue
+            if test_case.get(CASE_ERRORS_FIELD):
+                logger.warning(f"跳过验证失败的用例 {test_case.get('接口编号')}: {test_case[CASE_ERRORS_FIELD]}")
+                continue
+            results.append(runner.run(test_case))
+        
+        if not results:
+            logger.warning("没有找到需要压测的测试用例")
+        elif write_back:
+            self.write_load_results(table_id, results)
+        
+        return results
+    
+    def write_load_results(self, table_id: str, results: List[LoadResult]) -> bool:
+        """
+        将压测结果回写到表格的压测字段，字段不存在时自动创建
+        
+        Args:
+            table_id: 表格ID
+            results: 压测结果列表
+            
+        Returns:
+            是否写入成功
+        """
+        logger.info(f"将压测结果回写到表格 {table_id}...")
+        
+        try:
+            for field_name in LOAD_RESULT_FIELDS:
+                # 2=数字类型
+                if not self.lark_client.ensure_field_exists(table_id, field_name, 2):
+                    logger.error(f"创建压测字段失败: {field_name}")
+                    return False
+            
+            updates = [
+                {'record_id': result.record_id, 'fields': result.to_fields()}
+                for result in results if result.record_id
+            ]
+            
+            if not updates:
+                success_count = 0
+            elif self.config.get('batch_write', True):
+                success_count = self._write_updates_in_batch(table_id, updates)
+            else:
+                success_count = self._write_updates_one_by_one(table_id, updates)
+            
+            logger.info(f"压测结果回写完成: 成功{success_count}/{len(updates)}")
+            return success_count == len(updates)
+            
+        except Exception as e:
+            logger.error(f"回写压测结果失败: {str(e)}")
+            return False
 
 
 class TestResults:
@@ -283,10 +843,31 @@ class TestResults:
         self.failed = failed
         self.duration = duration
         self.pass_rate = (passed / total * 100) if total > 0 else 0.0
+        # 因结果未变化而跳过回写的记录数
+        self.writes_skipped = 0
+        # 其中对比基准来自本地记录缓存的记录数
+        self.writes_skipped_cached = 0
+        # 各阶段平均耗时(毫秒)
+        self.timing_breakdown = self._average_timings(results)
+        # 请求重试总次数
+        self.retries = sum(max(0, len(result.get('_attempts', [])) - 1) for result in results)
+        # 响应时间断言失败数（与功能失败分开统计）
+        self.sla_failed = sum(1 for result in results if str(result.get('性能断言', '')).startswith('FAIL'))
+    
+    @staticmethod
+    def _average_timings(results: List[Dict[str, Any]]) -> Dict[str, float]:
+        """计算带有分阶段耗时的结果的各阶段平均值"""
+        timed = [result['_timings'] for result in results if result.get('_timings')]
+        if not timed:
+            return {}
+        return {
+            phase: round(sum(timings.get(phase, 0.0) for timings in timed) / len(timed), 2)
+            for phase in TIMING_PHASES
+        }
     
     def summary(self) -> str:
         """生成测试结果摘要"""
-        return (
+        text = (
             f"测试摘要:\n"
             f"  总数: {self.total}\n"
             f"  通过: {self.passed}\n"
@@ -294,6 +875,21 @@ class TestResults:
             f"  通过率: {self.pass_rate:.1f}%\n"
             f"  耗时: {self.duration:.2f}秒"
         )
+        if self.retries:
+            text += f"\n  重试: {self.retries}次"
+        if self.sla_failed:
+            text += f"\n  性能断言失败: {self.sla_failed}"
+        if self.writes_skipped:
+            text += f"\n  跳过回写: {self.writes_skipped}条（结果未变化）"
+            if self.writes_skipped_cached:
+                text += f"，其中{self.writes_skipped_cached}条按本地缓存对比"
+        if self.timing_breakdown:
+            t = self.timing_breakdown
+            text += (
+                f"\n  平均耗时(ms): DNS {t['dns']:.1f} / 连接 {t['connect']:.1f} / TLS {t['tls']:.1f}"
+                f" / 首字节 {t['ttfb']:.1f} / 下载 {t['download']:.1f} / 总计 {t['total']:.1f}"
+            )
+        return text
     
     def __str__(self):
         return self.summary()
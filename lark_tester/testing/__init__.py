@@ -0,0 +1,11 @@
+"""
+测试辅助模块
+
+提供本地模拟服务，用于在不访问飞书的情况下测试和压测客户端
+"""
+
+from .mock_bitable import MockBitableServer
+
+__all__ = [
+    "MockBitableServer",
+]
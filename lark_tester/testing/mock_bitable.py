@@ -0,0 +1,631 @@
+"""
+模拟多维表格服务模块
+
+在当前进程内启动HTTP服务，实现LarkClient使用的多维表格记录接口（列表分页、单条增删改查、
+批量增删改、筛选查询）和字段接口，可配置响应延迟和限流，用于不访问飞书的测试和可复现的吞吐量测量。
+
+用法:
+    with MockBitableServer(latency=0.02) as server:
+        server.add_table('tblCases', [{'接口编号': 'T1', '接口路径': '/ping'}])
+        client = LarkClient('pt-mock', server.app_token, domain=server.url)
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit, parse_qs
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 错误码（取值参照飞书开放平台）
+CODE_OK = 0
+CODE_INVALID_REQUEST = 1254000
+CODE_TABLE_NOT_FOUND = 1254004
+CODE_FIELD_NAME_DUPLICATED = 1254014
+CODE_APP_NOT_FOUND = 1254040
+CODE_RECORD_NOT_FOUND = 1254043
+CODE_FIELD_NOT_FOUND = 1254045
+CODE_BATCH_TOO_LARGE = 1254104
+CODE_RATE_LIMITED = 99991400
+CODE_MISSING_TOKEN = 99991661
+
+# 字段类型
+FIELD_TEXT = 1
+FIELD_NUMBER = 2
+FIELD_CHECKBOX = 7
+FIELD_CREATED_TIME = 1001
+FIELD_MODIFIED_TIME = 1002
+# 由服务端维护、不能写入的字段类型
+_AUTO_FIELD_TYPES = (FIELD_CREATED_TIME, FIELD_MODIFIED_TIME)
+
+# 分页和批量限制
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 500
+MAX_FIELD_PAGE_SIZE = 100
+MAX_BATCH_SIZE = 500
+
+_ROUTE = re.compile(
+    r'^/open-apis/bitable/v1/apps/(?P<app>[^/]+)/tables/(?P<table>[^/]+)/(?P<kind>records|fields)(?:/(?P<item>[^/]+))?$'
+)
+_BATCH_ACTIONS = ('batch_create', 'batch_update', 'batch_delete', 'search')
+
+
+class MockError(Exception):
+    """模拟服务返回的业务错误"""
+
+    def __init__(self, code: int, message: str, status: int = 200):
+        self.code = code
+        self.message = message
+        self.status = status
+        super().__init__(message)
+
+
+class _Table:
+    """单个数据表的字段和记录"""
+
+    def __init__(self):
+        self.fields: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.records: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
+    def field_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        for field_info in self.fields.values():
+            if field_info['field_name'] == name:
+                return field_info
+        return None
+
+
+def _infer_field_type(value: Any) -> int:
+    """根据初始数据推断字段类型"""
+    if isinstance(value, bool):
+        return FIELD_CHECKBOX
+    if isinstance(value, (int, float)):
+        return FIELD_NUMBER
+    return FIELD_TEXT
+
+
+def _as_text(value: Any) -> str:
+    """筛选比较时使用的字段文本"""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, list):
+        return ','.join(_as_text(item.get('text', '') if isinstance(item, dict) else item) for item in value)
+    return str(value)
+
+
+def _as_number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class MockBitableServer:
+    """
+    进程内的模拟多维表格服务
+
+    数据保存在内存中，所有接口线程安全。latency为每个请求的固定延迟(秒)，latency_jitter为
+    额外的随机延迟上限；rate_limit_qps大于0时按令牌桶限流，超出的请求返回限流错误
+    （rate_limit_status为429时返回HTTP 429和Retry-After，为200时返回错误码99991400）。
+    requests按接口统计请求次数，便于验证批量、缓存等优化是否生效。
+    """
+
+    def __init__(
+        self,
+        app_token: str = 'appMockBitable',
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        rate_limit_qps: float = 0.0,
+        rate_limit_status: int = 429
+    ):
+        """
+        初始化模拟服务
+
+        Args:
+            app_token: 多维表格应用Token
+            host: 监听地址
+            port: 监听端口，0表示随机端口
+            latency: 每个请求的固定延迟(秒)
+            latency_jitter: 额外随机延迟的上限(秒)
+            rate_limit_qps: 限流速率(次/秒)，0表示不限流
+            rate_limit_status: 限流时的HTTP状态码（429或200）
+        """
+        self.app_token = app_token
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.rate_limit_qps = rate_limit_qps
+        self.rate_limit_status = rate_limit_status
+
+        self.requests: Counter = Counter()
+        self.rate_limited = 0
+
+        self._tables: Dict[str, _Table] = {}
+        self._ids = count(1)
+        self._lock = threading.Lock()
+        self._forced_rate_limits = 0
+        self._tokens = max(1.0, rate_limit_qps)
+        self._refilled_at = time.monotonic()
+
+        self._httpd = ThreadingHTTPServer((host, port), _MockHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """服务地址，作为LarkClient的domain参数"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockBitableServer':
+        """在后台线程启动服务"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name='mock-bitable', daemon=True)
+            self._thread.start()
+            logger.info(f"模拟多维表格服务已启动: {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """停止服务"""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'MockBitableServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    # ==================== 数据准备 ====================
+
+    def add_table(self, table_id: str, records: Optional[List[Dict[str, Any]]] = None,
+                  fields: Optional[Dict[str, int]] = None) -> List[str]:
+        """
+        创建数据表并写入初始记录
+
+        Args:
+            table_id: 表格ID
+            records: 初始记录的字段字典列表，未声明的字段按值推断类型后自动创建
+            fields: 需要预先创建的字段 {字段名: 字段类型}
+
+        Returns:
+            初始记录的record_id列表
+        """
+        with self._lock:
+            table = self._tables.setdefault(table_id, _Table())
+            for name, field_type in (fields or {}).items():
+                if table.field_by_name(name) is None:
+                    self._new_field(table, {'field_name': name, 'type': field_type})
+            for record_fields in records or []:
+                for name, value in record_fields.items():
+                    if table.field_by_name(name) is None:
+                        self._new_field(table, {'field_name': name, 'type': _infer_field_type(value)})
+            return [self._new_record(table, record_fields)['record_id'] for record_fields in records or []]
+
+    def get_records(self, table_id: str) -> List[Dict[str, Any]]:
+        """
+        获取数据表的全部记录（副本）
+
+        Args:
+            table_id: 表格ID
+
+        Returns:
+            记录列表，格式为 {'record_id': ..., 'fields': {...}}
+        """
+        with self._lock:
+            table = self._tables.get(table_id)
+            if table is None:
+                return []
+            return [self._record_view(record) for record in table.records.values()]
+
+    def inject_rate_limit(self, times: int = 1) -> None:
+        """让接下来的times个请求返回限流错误"""
+        with self._lock:
+            self._forced_rate_limits += times
+
+    def reset_stats(self) -> None:
+        """清空请求统计"""
+        with self._lock:
+            self.requests.clear()
+            self.rate_limited = 0
+
+    # ==================== 请求处理 ====================
+
+    def delay(self) -> float:
+        """本次请求的模拟延迟(秒)"""
+        if self.latency_jitter > 0:
+            return self.latency + random.uniform(0, self.latency_jitter)
+        return self.latency
+
+    def check_rate_limit(self) -> bool:
+        """
+        消耗一个限流令牌
+
+        Returns:
+            是否触发限流
+        """
+        with self._lock:
+            if self._forced_rate_limits > 0:
+                self._forced_rate_limits -= 1
+                self.rate_limited += 1
+                return True
+            if self.rate_limit_qps <= 0:
+                return False
+
+            now = time.monotonic()
+            self._tokens = min(max(1.0, self.rate_limit_qps),
+                               self._tokens + (now - self._refilled_at) * self.rate_limit_qps)
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return False
+            self.rate_limited += 1
+            return True
+
+    def dispatch(self, method: str, path: str, query: Dict[str, str], body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        处理一个接口请求
+
+        Args:
+            method: HTTP方法
+            path: 请求路径
+            query: 查询参数
+            body: JSON请求体
+
+        Returns:
+            响应的data部分
+
+        Raises:
+            MockError: 业务错误
+        """
+        match = _ROUTE.match(path)
+        if not match:
+            raise MockError(404, f"接口不存在: {method} {path}", status=404)
+        if match['app'] != self.app_token:
+            raise MockError(CODE_APP_NOT_FOUND, f"app_token不存在: {match['app']}")
+
+        kind, item = match['kind'], match['item']
+        route = f"{method} {kind}" + (f"/{item}" if item in _BATCH_ACTIONS else ("/:id" if item else ""))
+
+        with self._lock:
+            self.requests[route] += 1
+            table = self._tables.get(match['table'])
+            if table is None:
+                raise MockError(CODE_TABLE_NOT_FOUND, f"数据表不存在: {match['table']}")
+
+            handler = _ROUTES.get(route)
+            if handler is None:
+                raise MockError(404, f"接口不存在: {method} {path}", status=404)
+            return handler(self, table, item, query, body)
+
+    # ---------- 记录 ----------
+
+    def _list_records(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        field_names = json.loads(query['field_names']) if 'field_names' in query else None
+        if field_names is not None:
+            self._check_field_names(table, field_names)
+        records = [self._record_view(record, field_names) for record in table.records.values()]
+        return self._page(records, query, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+    def _create_record(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        fields = body.get('fields') or {}
+        self._check_writable(table, fields)
+        return {'record': self._record_view(self._new_record(table, fields))}
+
+    def _get_record(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        return {'record': self._record_view(self._find_record(table, item))}
+
+    def _update_record(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        record = self._find_record(table, item)
+        fields = body.get('fields') or {}
+        self._check_writable(table, fields)
+        self._write_fields(table, record, fields)
+        return {'record': self._record_view(record)}
+
+    def _delete_record(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        self._find_record(table, item)
+        del table.records[item]
+        return {'deleted': True, 'record_id': item}
+
+    def _batch_create(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        records = self._batch(body)
+        for record in records:
+            self._check_writable(table, record.get('fields') or {})
+        return {'records': [self._record_view(self._new_record(table, record.get('fields') or {}))
+                            for record in records]}
+
+    def _batch_update(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        records = self._batch(body)
+        # 先整体校验，任一记录无效时整批失败
+        targets = []
+        for record in records:
+            self._check_writable(table, record.get('fields') or {})
+            targets.append((self._find_record(table, record.get('record_id')), record.get('fields') or {}))
+        for target, fields in targets:
+            self._write_fields(table, target, fields)
+        return {'records': [self._record_view(target) for target, _ in targets]}
+
+    def _batch_delete(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        record_ids = self._batch(body)
+        for record_id in record_ids:
+            self._find_record(table, record_id)
+        for record_id in record_ids:
+            del table.records[record_id]
+        return {'records': [{'deleted': True, 'record_id': record_id} for record_id in record_ids]}
+
+    def _search(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        record_filter = body.get('filter') or {}
+        conditions = record_filter.get('conditions') or []
+        for condition in conditions:
+            self._check_field_names(table, [condition.get('field_name')])
+        combine = any if record_filter.get('conjunction') == 'or' else all
+
+        field_names = body.get('field_names')
+        if field_names is not None:
+            self._check_field_names(table, field_names)
+        automatic = bool(body.get('automatic_fields'))
+
+        items = []
+        for record in table.records.values():
+            if conditions and not combine(self._match(record['fields'], condition) for condition in conditions):
+                continue
+            view = self._record_view(record, field_names)
+            # 查询接口以文本分段数组返回文本字段
+            for name, value in view['fields'].items():
+                field_info = table.field_by_name(name)
+                if field_info and field_info['type'] == FIELD_TEXT and isinstance(value, str):
+                    view['fields'][name] = [{'type': 'text', 'text': value}]
+            if automatic:
+                view['created_time'] = record['created_time']
+                view['last_modified_time'] = record['last_modified_time']
+            items.append(view)
+        return self._page(items, query, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+    # ---------- 字段 ----------
+
+    def _list_fields(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        fields = [dict(field_info) for field_info in table.fields.values()]
+        return self._page(fields, query, DEFAULT_PAGE_SIZE, MAX_FIELD_PAGE_SIZE)
+
+    def _create_field(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        name = body.get('field_name')
+        if not name or 'type' not in body:
+            raise MockError(CODE_INVALID_REQUEST, "缺少field_name或type")
+        if table.field_by_name(name) is not None:
+            raise MockError(CODE_FIELD_NAME_DUPLICATED, f"字段名重复: {name}")
+        return {'field': dict(self._new_field(table, body))}
+
+    def _update_field(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        field_info = table.fields.get(item)
+        if field_info is None:
+            raise MockError(CODE_FIELD_NOT_FOUND, f"字段不存在: {item}")
+        new_name = body.get('field_name')
+        if new_name and new_name != field_info['field_name']:
+            if table.field_by_name(new_name) is not None:
+                raise MockError(CODE_FIELD_NAME_DUPLICATED, f"字段名重复: {new_name}")
+            for record in table.records.values():
+                if field_info['field_name'] in record['fields']:
+                    record['fields'][new_name] = record['fields'].pop(field_info['field_name'])
+            field_info['field_name'] = new_name
+        for key in ('type', 'property', 'description'):
+            if key in body:
+                field_info[key] = body[key]
+        return {'field': dict(field_info)}
+
+    def _delete_field(self, table: _Table, item, query, body) -> Dict[str, Any]:
+        field_info = table.fields.pop(item, None)
+        if field_info is None:
+            raise MockError(CODE_FIELD_NOT_FOUND, f"字段不存在: {item}")
+        for record in table.records.values():
+            record['fields'].pop(field_info['field_name'], None)
+        return {'field_id': item, 'deleted': True}
+
+    # ---------- 辅助方法（调用方持有锁） ----------
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}{next(self._ids):010d}"
+
+    def _new_field(self, table: _Table, spec: Dict[str, Any]) -> Dict[str, Any]:
+        field_info = {
+            'field_id': self._next_id('fld'),
+            'field_name': spec['field_name'],
+            'type': spec['type'],
+            'property': spec.get('property'),
+        }
+        if spec.get('description'):
+            field_info['description'] = spec['description']
+        table.fields[field_info['field_id']] = field_info
+        return field_info
+
+    def _new_record(self, table: _Table, fields: Dict[str, Any]) -> Dict[str, Any]:
+        now = int(time.time() * 1000)
+        record = {'record_id': self._next_id('rec'), 'fields': {}, 'created_time': now, 'last_modified_time': now}
+        for field_info in table.fields.values():
+            if field_info['type'] == FIELD_CREATED_TIME:
+                record['fields'][field_info['field_name']] = now
+        self._write_fields(table, record, fields, now)
+        table.records[record['record_id']] = record
+        return record
+
+    def _write_fields(self, table: _Table, record: Dict[str, Any], fields: Dict[str, Any],
+                      now: Optional[int] = None) -> None:
+        now = now or int(time.time() * 1000)
+        for name, value in fields.items():
+            if value is None:
+                record['fields'].pop(name, None)
+            else:
+                record['fields'][name] = value
+        record['last_modified_time'] = now
+        for field_info in table.fields.values():
+            if field_info['type'] == FIELD_MODIFIED_TIME:
+                record['fields'][field_info['field_name']] = now
+
+    def _find_record(self, table: _Table, record_id: Optional[str]) -> Dict[str, Any]:
+        record = table.records.get(record_id or '')
+        if record is None:
+            raise MockError(CODE_RECORD_NOT_FOUND, f"记录不存在: {record_id}")
+        return record
+
+    @staticmethod
+    def _record_view(record: Dict[str, Any], field_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        fields = record['fields']
+        if field_names is not None:
+            fields = {name: fields[name] for name in field_names if name in fields}
+        return {'record_id': record['record_id'], 'fields': dict(fields)}
+
+    @staticmethod
+    def _check_field_names(table: _Table, names: List[Any]) -> None:
+        for name in names:
+            if table.field_by_name(name) is None:
+                raise MockError(CODE_FIELD_NOT_FOUND, f"字段不存在: {name}")
+
+    def _check_writable(self, table: _Table, fields: Dict[str, Any]) -> None:
+        for name in fields:
+            field_info = table.field_by_name(name)
+            if field_info is None:
+                raise MockError(CODE_FIELD_NOT_FOUND, f"字段不存在: {name}")
+            if field_info['type'] in _AUTO_FIELD_TYPES:
+                raise MockError(CODE_INVALID_REQUEST, f"字段不可写入: {name}")
+
+    @staticmethod
+    def _batch(body: Dict[str, Any]) -> List[Any]:
+        records = body.get('records') or []
+        if len(records) > MAX_BATCH_SIZE:
+            raise MockError(CODE_BATCH_TOO_LARGE, f"单次最多操作{MAX_BATCH_SIZE}条记录")
+        return records
+
+    @staticmethod
+    def _page(items: List[Any], query: Dict[str, str], default_size: int, max_size: int) -> Dict[str, Any]:
+        """按page_size和page_token分页（page_token为不透明的偏移量）"""
+        try:
+            page_size = min(max(1, int(query.get('page_size', default_size))), max_size)
+            offset = int(query['page_token'][2:]) if query.get('page_token') else 0
+        except ValueError:
+            raise MockError(CODE_INVALID_REQUEST, "无效的page_size或page_token")
+
+        end = offset + page_size
+        data = {'items': items[offset:end], 'has_more': end < len(items), 'total': len(items)}
+        if data['has_more']:
+            data['page_token'] = f"pt{end}"
+        return data
+
+    @staticmethod
+    def _match(fields: Dict[str, Any], condition: Dict[str, Any]) -> bool:
+        """判断记录是否满足单个筛选条件"""
+        value = fields.get(condition.get('field_name'))
+        operator = condition.get('operator')
+        expected = condition.get('value') or []
+
+        if operator == 'isEmpty':
+            return value in (None, '', [])
+        if operator == 'isNotEmpty':
+            return value not in (None, '', [])
+
+        text = _as_text(value)
+        if operator == 'is':
+            return bool(expected) and text == str(expected[-1])
+        if operator == 'isNot':
+            return not expected or text != str(expected[-1])
+        if operator == 'contains':
+            return any(str(item) in text for item in expected)
+        if operator == 'doesNotContain':
+            return not any(str(item) in text for item in expected)
+        if operator in ('isGreater', 'isGreaterEqual', 'isLess', 'isLessEqual'):
+            # 日期条件的取值为 ['ExactDate', 毫秒时间戳]
+            actual = _as_number(value)
+            target = _as_number(expected[-1]) if expected else None
+            if actual is None or target is None:
+                return False
+            return {
+                'isGreater': actual > target,
+                'isGreaterEqual': actual >= target,
+                'isLess': actual < target,
+                'isLessEqual': actual <= target,
+            }[operator]
+        raise MockError(CODE_INVALID_REQUEST, f"不支持的筛选条件: {operator}")
+
+
+_ROUTES = {
+    'GET records': MockBitableServer._list_records,
+    'POST records': MockBitableServer._create_record,
+    'GET records/:id': MockBitableServer._get_record,
+    'PUT records/:id': MockBitableServer._update_record,
+    'DELETE records/:id': MockBitableServer._delete_record,
+    'POST records/batch_create': MockBitableServer._batch_create,
+    'POST records/batch_update': MockBitableServer._batch_update,
+    'POST records/batch_delete': MockBitableServer._batch_delete,
+    'POST records/search': MockBitableServer._search,
+    'GET fields': MockBitableServer._list_fields,
+    'POST fields': MockBitableServer._create_field,
+    'PUT fields/:id': MockBitableServer._update_field,
+    'DELETE fields/:id': MockBitableServer._delete_field,
+}
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """将HTTP请求转交给MockBitableServer处理"""
+
+    protocol_version = 'HTTP/1.1'
+    # 响应头和响应体分两次写入，关闭Nagle算法避免与客户端延迟确认叠加出约40ms的额外延迟
+    disable_nagle_algorithm = True
+
+    def _handle(self) -> None:
+        mock: MockBitableServer = self.server.mock
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+
+        delay = mock.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        if not self.headers.get('Authorization', '').startswith('Bearer '):
+            self._reply(401, {'code': CODE_MISSING_TOKEN, 'msg': 'missing access token'})
+            return
+
+        if mock.check_rate_limit():
+            headers = {'x-ogw-ratelimit-reset': '1'}
+            if mock.rate_limit_status == 429:
+                headers['Retry-After'] = '1'
+            self._reply(mock.rate_limit_status, {'code': CODE_RATE_LIMITED, 'msg': 'request trigger frequency limit'},
+                        headers)
+            return
+
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+            data = mock.dispatch(self.command, parts.path, query, body)
+            self._reply(200, {'code': CODE_OK, 'msg': 'success', 'data': data})
+        except MockError as e:
+            self._reply(e.status, {'code': e.code, 'msg': e.message})
+        except (ValueError, TypeError, AttributeError) as e:
+            self._reply(200, {'code': CODE_INVALID_REQUEST, 'msg': f"invalid request: {e}"})
+
+    def _reply(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
@@ -5,6 +5,10 @@
 """
 
 from .logger import setup_logging, get_logger
+from .assertion import compile_assertion, AssertionSyntaxError
+from .jsonpath import compile_path, parse_json, JSONPath
+from .response_body import ResponseBody
+from .template import Template, compile_template
 from .validator import validate_test_case, validate_config, validate_assertion_rule
 from .formatter import (
     format_test_result, 
@@ -21,6 +25,14 @@ __all__ = [
     "validate_test_case",
     "validate_config", 
     "validate_assertion_rule",
+    "compile_assertion",
+    "AssertionSyntaxError",
+    "compile_path",
+    "parse_json",
+    "JSONPath",
+    "ResponseBody",
+    "Template",
+    "compile_template",
     "format_test_result",
     "format_response_body",
     "parse_headers",
@@ -0,0 +1,483 @@
+"""
+断言规则编译模块
+
+将断言规则编译为可重复执行的闭包，按规则文本缓存，执行时每个响应只解析一次JSON。
+
+文本形式:
+    status_code == 200 and $.code == 0
+    $.data.items[0].name contains '张' or body contains "success"
+    data.code == 0 and $.data.items[*].id contains 3
+    not ($.data.total < 1) and length($.data.list) >= 1
+    status_code in [200, 201] and $.message not contains 'error'
+
+兼容旧写法: 左侧的顶层字段可以省略 $.（code == 0），省略左侧时 contains 检查响应体
+（contains 'success' 等同于 body contains 'success'），右侧不加引号的单词按字符串处理
+（message == ok 等同于 $.message == 'ok'）。
+
+JSON形式:
+    {"status_code": "== 200", "response_json": {"$.code": "== 0", "$.data.list": "length > 0"}}
+
+响应时间断言（response_time < 300ms）编译时收集为响应时间预算，由性能断言单独判定，
+功能断言执行时视为成立；响应时间断言只能用and连接，不能出现在or、not之下。
+"""
+
+import ast
+import json
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from .jsonpath import compile_path
+from .response_body import ResponseBody
+
+# 支持的比较运算符
+OPERATORS = ('==', '!=', '>', '<', '>=', '<=', 'in', 'not in', 'contains', 'not contains')
+
+_TOKEN_PATTERN = re.compile(r'''
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d+)?(?:ms|s)?)(?![\w.])
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<path>(?:\$|(?!(?:and|or|not|in|contains|length)\b)[^\W\d]\w*(?=[.\[]))(?:\.[^\s.\[\]()=!<>,'"]+|\[\s*(?:-?\d+|\*|'[^']*'|"[^"]*")\s*\])*)
+      | (?P<op>==|!=|>=|<=|>|<)
+      | (?P<punct>[()\[\],])
+      | (?P<name>[A-Za-z_]\w*)
+    )''', re.VERBOSE)
+
+_LITERALS = {'true': True, 'false': False, 'null': None, 'none': None}
+# 不区分大小写的关键字
+_KEYWORDS = {'and', 'or', 'not', 'in', 'contains', 'length'} | set(_LITERALS)
+
+Token = Tuple[str, Any, int, int]
+Getter = Callable[['_Context'], Any]
+Node = Callable[['_Context'], Tuple[bool, str]]
+
+
+class AssertionSyntaxError(ValueError):
+    """断言规则语法错误"""
+
+
+class _Context:
+    """单次执行的响应上下文，响应体的文本和JSON解析结果由ResponseBody缓存"""
+
+    __slots__ = ('status_code', 'response')
+
+    def __init__(self, status_code: Optional[int], response: ResponseBody):
+        self.status_code = status_code
+        self.response = response
+
+    @property
+    def body(self) -> str:
+        return self.response.text
+
+    @property
+    def doc(self) -> Any:
+        return self.response.doc
+
+
+class CompiledAssertion:
+    """编译后的断言规则"""
+
+    __slots__ = ('source', '_node', 'latency_budgets', 'has_checks')
+
+    def __init__(self, source: str, node: Node,
+                 latency_budgets: Tuple[Tuple[str, float], ...] = (), has_checks: bool = True):
+        """
+        Args:
+            source: 规则原文
+            node: 编译后的根节点
+            latency_budgets: 规则中的响应时间断言 ((运算符, 毫秒), ...)
+            has_checks: 规则中是否有响应时间以外的断言
+        """
+        self.source = source
+        self._node = node
+        self.latency_budgets = latency_budgets
+        self.has_checks = has_checks
+
+    def evaluate(self, status_code: Optional[int], body: Union[str, ResponseBody, None],
+                 doc: Any = None) -> Tuple[bool, str]:
+        """
+        对一次响应执行断言
+
+        Args:
+            status_code: 响应状态码
+            body: 响应体文本或ResponseBody（与格式化共用解析结果）
+            doc: 文本响应体的parse_json结果，为None时按需解析
+
+        Returns:
+            (是否通过, 未通过的子规则及实际值)
+        """
+        if not isinstance(body, ResponseBody):
+            body = ResponseBody.from_text(body, doc)
+        return self._node(_Context(status_code, body))
+
+
+@lru_cache(maxsize=1024)
+def compile_assertion(rule: str) -> CompiledAssertion:
+    """
+    编译断言规则，相同文本只编译一次
+
+    Args:
+        rule: 文本形式或JSON形式的断言规则
+
+    Returns:
+        CompiledAssertion对象
+
+    Raises:
+        AssertionSyntaxError: 规则语法错误
+    """
+    text = (rule or '').strip()
+    if not text:
+        raise AssertionSyntaxError("断言规则不能为空")
+    if text.startswith('{'):
+        text = _json_rule_to_text(text)
+    parser = _Parser(text)
+    node = parser.parse()
+    return CompiledAssertion(rule, node, tuple(parser.latency_budgets), parser.checks > 0)
+
+
+def _json_rule_to_text(rule: str) -> str:
+    """将JSON形式的断言规则转换为等价的文本形式（各项之间为and）"""
+    try:
+        rules = json.loads(rule)
+    except ValueError as e:
+        raise AssertionSyntaxError(f"JSON格式错误: {str(e)}")
+    if not isinstance(rules, dict):
+        raise AssertionSyntaxError("JSON形式的断言规则必须是对象")
+
+    clauses = []
+    for key, value in rules.items():
+        if key == 'response_json' and isinstance(value, dict):
+            clauses.extend(_json_clause(path, expected) for path, expected in value.items())
+        elif key in ('status_code', 'body', 'response_time') or key.startswith('$'):
+            clauses.append(_json_clause(key, value))
+        else:
+            raise AssertionSyntaxError(f"未知的断言项: {key}")
+    if not clauses:
+        raise AssertionSyntaxError("断言规则不能为空")
+    return ' and '.join(f"({clause})" for clause in clauses)
+
+
+def _json_clause(subject: str, expected: Any) -> str:
+    """生成单个JSON断言项对应的文本，值不带运算符时视为相等比较（响应时间视为上限）"""
+    if subject == 'response_time':
+        return _json_latency_clause(expected)
+    if not isinstance(expected, str):
+        return f"{subject} == {json.dumps(expected, ensure_ascii=False)}"
+    expected = expected.strip()
+    if expected.startswith('length'):
+        return f"length({subject}) {expected[len('length'):]}"
+    if not re.match(r'(==|!=|>=|<=|>|<|in\b|not\b|contains\b)', expected):
+        return f"{subject} == {json.dumps(expected, ensure_ascii=False)}"
+    return f"{subject} {expected}"
+
+
+def _json_latency_clause(expected: Any) -> str:
+    """生成JSON响应时间断言对应的文本，数字或不带运算符的 "300ms" 视为 "<= 上限"（默认毫秒）"""
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool):
+        return f"response_time <= {expected}"
+    if isinstance(expected, str):
+        expected = expected.strip()
+        if re.fullmatch(r'\d+(?:\.\d+)?(?:ms|s)?', expected):
+            return f"response_time <= {expected}"
+        if re.match(r'(==|!=|>=|<=|>|<)', expected):
+            return f"response_time {expected}"
+    raise AssertionSyntaxError(f"响应时间断言的值应为毫秒数或 \"< 1000\" 形式，实际为: {json.dumps(expected, ensure_ascii=False)}")
+
+
+def _tokenize(text: str) -> List[Token]:
+    """切分断言规则"""
+    tokens = []
+    pos = 0
+    end = len(text.rstrip())
+    while pos < end:
+        match = _TOKEN_PATTERN.match(text, pos)
+        if not match or match.end() == pos:
+            raise AssertionSyntaxError(f"无法识别的内容: {text[pos:].strip()[:20]}")
+        kind = match.lastgroup
+        start = match.start(kind)
+        value = match.group(kind)
+        if kind == 'name' and value.lower() in _KEYWORDS:
+            value = value.lower()
+        tokens.append((kind, value, start, match.end(kind)))
+        pos = match.end()
+    return tokens
+
+
+def _parse_number(token: str) -> Union[int, float]:
+    """解析数字字面量，带ms/s单位时换算为毫秒"""
+    scale = 1
+    if token.endswith('ms'):
+        token = token[:-2]
+    elif token.endswith('s'):
+        token, scale = token[:-1], 1000
+    value = float(token) * scale
+    return int(value) if value.is_integer() and '.' not in token else value
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """转换为数字用于大小比较，布尔值和无法转换的值返回None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _equals(actual: Any, expected: Any) -> bool:
+    """相等比较：数字与数字字符串按数值比较，布尔值只与布尔值相等"""
+    if isinstance(actual, bool) or isinstance(expected, bool):
+        return isinstance(actual, bool) and isinstance(expected, bool) and actual == expected
+    if isinstance(actual, str) != isinstance(expected, str) and actual is not None and expected is not None:
+        left, right = _to_number(actual), _to_number(expected)
+        return left is not None and left == right
+    return actual == expected
+
+
+def _contains(container: Any, item: Any) -> bool:
+    """包含判断：字符串按子串，列表按元素，对象按键"""
+    if isinstance(container, str):
+        return (item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)) in container
+    if isinstance(container, (list, tuple)):
+        return any(_equals(element, item) for element in container)
+    if isinstance(container, dict):
+        return item in container
+    return False
+
+
+def _ordered(compare: Callable[[float, float], bool]) -> Callable[[Any, Any], bool]:
+    def check(actual: Any, expected: Any) -> bool:
+        left, right = _to_number(actual), _to_number(expected)
+        return left is not None and right is not None and compare(left, right)
+    return check
+
+
+_COMPARATORS = {
+    '==': _equals,
+    '!=': lambda actual, expected: not _equals(actual, expected),
+    '>': _ordered(lambda a, b: a > b),
+    '<': _ordered(lambda a, b: a < b),
+    '>=': _ordered(lambda a, b: a >= b),
+    '<=': _ordered(lambda a, b: a <= b),
+    'in': lambda actual, expected: _contains(expected, actual),
+    'not in': lambda actual, expected: not _contains(expected, actual),
+    'contains': _contains,
+    'not contains': lambda actual, expected: not _contains(actual, expected),
+}
+
+
+def _describe(value: Any) -> str:
+    """生成失败信息中的实际值描述"""
+    text = json.dumps(value, ensure_ascii=False) if not isinstance(value, str) else repr(value)
+    return text if len(text) <= 100 else text[:100] + '...'
+
+
+class _Parser:
+    """
+    递归下降解析器
+
+    expr       := and_expr ('or' and_expr)*
+    and_expr   := not_expr ('and' not_expr)*
+    not_expr   := 'not' not_expr | '(' expr ')' | comparison
+    comparison := subject OPERATOR operand | response_time OPERATOR 数字 | contains operand
+    subject    := 顶层字段名 | operand
+    operand    := status_code | body | JSON路径 | length(subject) | 字面量 | [字面量, ...]
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        # 响应时间断言 (运算符, 毫秒)
+        self.latency_budgets: List[Tuple[str, float]] = []
+        # 响应时间以外的比较数量
+        self.checks = 0
+
+    def parse(self) -> Node:
+        node = self._expr()
+        if self.pos < len(self.tokens):
+            raise AssertionSyntaxError(f"多余的内容: {self.text[self.tokens[self.pos][2]:]}")
+        return node
+
+    def _peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _next(self) -> Token:
+        token = self._peek()
+        if token is None:
+            raise AssertionSyntaxError(f"规则不完整: {self.text}")
+        self.pos += 1
+        return token
+
+    def _accept(self, kind: str, value: Optional[str] = None) -> Optional[Token]:
+        token = self._peek()
+        if token and token[0] == kind and (value is None or token[1] == value):
+            self.pos += 1
+            return token
+        return None
+
+    def _expect(self, kind: str, value: str) -> Token:
+        token = self._accept(kind, value)
+        if token is None:
+            found = self._peek()
+            raise AssertionSyntaxError(f"缺少 '{value}'" + (f"，遇到 '{found[1]}'" if found else ''))
+        return token
+
+    def _expr(self) -> Node:
+        budgets = len(self.latency_budgets)
+        nodes = [self._and_expr()]
+        while self._accept('name', 'or'):
+            nodes.append(self._and_expr())
+        if len(nodes) == 1:
+            return nodes[0]
+        if len(self.latency_budgets) > budgets:
+            raise AssertionSyntaxError("响应时间断言不能用or连接，请用and与其他断言组合")
+
+        def any_of(ctx: _Context) -> Tuple[bool, str]:
+            errors = []
+            for node in nodes:
+                passed, error = node(ctx)
+                if passed:
+                    return True, ""
+                errors.append(error)
+            return False, ' 且 '.join(errors)
+        return any_of
+
+    def _and_expr(self) -> Node:
+        nodes = [self._not_expr()]
+        while self._accept('name', 'and'):
+            nodes.append(self._not_expr())
+        if len(nodes) == 1:
+            return nodes[0]
+
+        def all_of(ctx: _Context) -> Tuple[bool, str]:
+            for node in nodes:
+                passed, error = node(ctx)
+                if not passed:
+                    return False, error
+            return True, ""
+        return all_of
+
+    def _not_expr(self) -> Node:
+        start = self._peek()
+        if self._accept('name', 'not'):
+            budgets = len(self.latency_budgets)
+            node = self._not_expr()
+            if len(self.latency_budgets) > budgets:
+                raise AssertionSyntaxError("响应时间断言不能放在not之后，请直接写反向比较")
+            source = self.text[start[2]:self.tokens[self.pos - 1][3]]
+
+            def negate(ctx: _Context) -> Tuple[bool, str]:
+                passed, _ = node(ctx)
+                return (False, f"{source} 不成立") if passed else (True, "")
+            return negate
+        if self._accept('punct', '('):
+            node = self._expr()
+            self._expect('punct', ')')
+            return node
+        return self._comparison()
+
+    def _comparison(self) -> Node:
+        start = self._peek()
+        if start and start[0] == 'name' and start[1] == 'response_time':
+            return self._latency()
+
+        if start and start[0] == 'name' and start[1] == 'contains':
+            # 旧写法 contains 'success' 检查响应体
+            left, op = (lambda ctx: ctx.body), self._operator()
+        else:
+            left, op = self._operand(subject=True), self._operator()
+        right = self._operand()
+        source = self.text[start[2]:self.tokens[self.pos - 1][3]]
+        compare = _COMPARATORS[op]
+        self.checks += 1
+
+        def check(ctx: _Context) -> Tuple[bool, str]:
+            actual = left(ctx)
+            if compare(actual, right(ctx)):
+                return True, ""
+            return False, f"{source}（实际值: {_describe(actual)}）"
+        return check
+
+    def _latency(self) -> Node:
+        """响应时间断言收集为预算（不带单位按毫秒），由性能断言单独判定，执行时视为成立"""
+        self._next()
+        op = self._operator()
+        token = self._next()
+        if op not in ('==', '!=', '>', '<', '>=', '<=') or token[0] != 'number':
+            raise AssertionSyntaxError("响应时间断言格式应为: response_time < 300ms")
+        self.latency_budgets.append((op, float(_parse_number(token[1]))))
+        return lambda ctx: (True, "")
+
+    def _operator(self) -> str:
+        token = self._next()
+        if token[0] == 'op':
+            return token[1]
+        if token[0] == 'name' and token[1] in ('in', 'contains'):
+            return token[1]
+        if token[0] == 'name' and token[1] == 'not':
+            following = self._next()
+            if following[0] == 'name' and following[1] in ('in', 'contains'):
+                return f"not {following[1]}"
+        raise AssertionSyntaxError(f"缺少比较运算符，遇到 '{token[1]}'，支持: {', '.join(OPERATORS)}")
+
+    def _operand(self, subject: bool = False) -> Getter:
+        kind, value, _, _ = self._next()
+        if subject and kind == 'name' and value not in _KEYWORDS and value not in ('status_code', 'body'):
+            # 比较左侧的裸字段名视为顶层字段（code == 0 等同于 $.code == 0）
+            kind, value = 'path', f"$.{value}"
+        if kind == 'path':
+            try:
+                path = compile_path(value)
+            except ValueError as e:
+                raise AssertionSyntaxError(str(e))
+            return lambda ctx: path.get(ctx.doc)
+        if kind == 'name' and value == 'status_code':
+            return lambda ctx: ctx.status_code
+        if kind == 'name' and value == 'body':
+            return lambda ctx: ctx.body
+        if kind == 'name' and value == 'length':
+            parenthesized = self._accept('punct', '(') is not None
+            inner = self._operand(subject=True)
+            if parenthesized:
+                self._expect('punct', ')')
+
+            def length(ctx: _Context) -> Optional[int]:
+                target = inner(ctx)
+                return len(target) if isinstance(target, (str, list, dict)) else None
+            return length
+        if kind == 'punct' and value == '[':
+            constant = self._list_literal()
+            return lambda ctx: constant
+        constant = self._literal(kind, value)
+        return lambda ctx: constant
+
+    def _list_literal(self) -> list:
+        items = []
+        if self._accept('punct', ']'):
+            return items
+        while True:
+            items.append(self._literal(*self._next()[:2]))
+            if self._accept('punct', ']'):
+                return items
+            self._expect('punct', ',')
+
+    @staticmethod
+    def _literal(kind: str, value: str) -> Any:
+        if kind == 'number':
+            if value.endswith('s'):
+                raise AssertionSyntaxError(f"时间单位只能用于response_time: {value}")
+            return _parse_number(value)
+        if kind == 'string':
+            return ast.literal_eval(value)
+        if kind == 'name' and value in _LITERALS:
+            return _LITERALS[value]
+        if kind == 'name' and value not in _KEYWORDS:
+            # 旧写法: 不加引号的单词按字符串处理（message == ok）
+            return value
+        raise AssertionSyntaxError(f"无效的操作数: {value}")
@@ -8,23 +8,35 @@ import json
 import re
 from typing import Dict, Any, Optional, Union
 
+from .jsonpath import compile_path
+from .template import compile_template
+from .response_body import ResponseBody, DEFAULT_PREVIEW_LENGTH
+
 
 def format_test_result(
     status_code: int,
-    response_body: str,
-    response_time: float,
+    response_body: Union[str, ResponseBody],
+    response_time: Optional[float],
     is_passed: bool,
-    error_message: str = ""
-) -> Dict[str, str]:
+    error_message: str = "",
+    sla_passed: Optional[bool] = None,
+    sla_message: str = "",
+    response_doc: Any = None,
+    max_length: int = DEFAULT_PREVIEW_LENGTH
+) -> Dict[str, Any]:
     """
     格式化测试结果为表格字段格式
     
     Args:
         status_code: 响应状态码
-        response_body: 响应体内容
-        response_time: 响应时间(秒)
+        response_body: 响应体内容或ResponseBody
+        response_time: 响应时间(秒)，None表示请求未完成，回写时清空响应时间字段
         is_passed: 是否通过测试
         error_message: 错误信息
+        sla_passed: 是否满足响应时间断言，None表示未设置
+        sla_message: 响应时间断言失败信息
+        response_doc: 文本响应体的parse_json结果，为None时按需解析
+        max_length: 响应体字段的最大长度
         
     Returns:
         格式化后的测试结果字典
@@ -32,8 +44,8 @@ def format_test_result(
     # 使用表格中实际存在的字段名
     result = {
         '响应状态码': str(status_code),  # 使用表格中的字段名
-        '响应体': format_response_body(response_body),
-        # '响应时间': str(int(response_time * 1000)),  # 暂时跳过，避免数字字段错误
+        '响应体': format_response_body(response_body, max_length, response_doc),
+        '响应时间': round(response_time * 1000, 2) if response_time is not None else None,  # 毫秒，数字字段
         '是否通过': 'PASS' if is_passed else 'FAIL'
     }
     
@@ -41,38 +53,36 @@ def format_test_result(
     if error_message and not is_passed:
         result['响应体'] = f"错误: {error_message}\n\n原响应: {result['响应体']}"
     
+    # 响应时间断言单独记录，不影响功能测试结果
+    if sla_passed is not None:
+        result['性能断言'] = 'PASS' if sla_passed else f"FAIL: {sla_message}"
+    
     return result
 
 
-def format_response_body(response_body: str, max_length: int = 2000) -> str:
+def format_response_body(
+    response_body: Union[str, ResponseBody],
+    max_length: int = DEFAULT_PREVIEW_LENGTH,
+    response_doc: Any = None
+) -> str:
     """
     格式化响应体内容，确保适合表格显示
     
+    JSON响应体缩进格式化，超过长度时截断；格式化达到长度上限即停止。
+    
     Args:
-        response_body: 响应体内容
+        response_body: 响应体内容或ResponseBody（复用其解析和预览结果）
         max_length: 最大长度限制
+        response_doc: 文本响应体的parse_json结果，为None时按需解析
         
     Returns:
         格式化后的响应体
     """
-    if not response_body:
-        return ""
-    
-    # 尝试格式化JSON
-    try:
-        parsed = json.loads(response_body)
-        formatted = json.dumps(parsed, ensure_ascii=False, indent=2)
-        
-        # 如果太长，截断并添加提示
-        if len(formatted) > max_length:
-            formatted = formatted[:max_length] + "\n...(内容被截断)"
-        
-        return formatted
-    except json.JSONDecodeError:
-        # 不是JSON，直接处理字符串
-        if len(response_body) > max_length:
-            return response_body[:max_length] + "...(内容被截断)"
-        return response_body
+    if not isinstance(response_body, ResponseBody):
+        if not response_body:
+            return ""
+        response_body = ResponseBody.from_text(response_body, response_doc)
+    return response_body.preview(max_length)
 
 
 def parse_headers(headers_str: str) -> Dict[str, str]:
@@ -196,18 +206,65 @@ def extract_variables_from_text(text: str) -> list:
     if not text:
         return []
     
-    pattern = r'\$\{([^}]+)\}'
-    matches = re.findall(pattern, text)
-    return list(set(matches))  # 去重
+    return list(compile_template(text).names)
+
+
+def parse_extract_rules(rules: Any) -> Dict[str, str]:
+    """
+    解析提取变量规则
+    
+    支持JSON格式 {"token": "$.data.token"} 和每行一条的 token = $.data.token
+    （也可以用冒号分隔）。
+    
+    Args:
+        rules: 提取变量字段的值
+        
+    Returns:
+        {变量名: JSON路径}
+        
+    Raises:
+        ValueError: 规则格式错误或JSON路径无效
+    """
+    if isinstance(rules, str) and rules.strip().startswith('{'):
+        try:
+            rules = json.loads(rules)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"提取变量JSON格式错误: {str(e)}")
+    
+    if isinstance(rules, dict):
+        pairs = [(str(name).strip(), str(path).strip()) for name, path in rules.items()]
+    elif isinstance(rules, str):
+        pairs = []
+        for line in rules.strip().splitlines():
+            if not line.strip():
+                continue
+            match = re.match(r'^\s*([^=:\s]+)\s*[=:]\s*(.+?)\s*$', line)
+            if not match:
+                raise ValueError(f"提取变量格式应为 变量名 = JSON路径: {line.strip()}")
+            pairs.append(match.groups())
+    elif not rules:
+        return {}
+    else:
+        raise ValueError(f"无效的提取变量规则: {rules}")
+    
+    extract_rules = {}
+    for name, path in pairs:
+        if not re.match(r'^[\w.\-]+$', name):
+            raise ValueError(f"无效的变量名: {name}")
+        compile_path(path)
+        extract_rules[name] = path
+    return extract_rules
 
 
 def replace_variables(text: str, variables: Dict[str, str]) -> str:
     """
     替换文本中的变量
     
+    文本按内容编译一次（缓存），替换时只查找文本中引用的变量，与变量总数无关。
+    
     Args:
         text: 包含变量的文本
-        variables: 变量字典
+        variables: 变量字典，非字符串的值按JSON写入，未定义的变量保留原文
         
     Returns:
         替换后的文本
@@ -215,11 +272,40 @@ def replace_variables(text: str, variables: Dict[str, str]) -> str:
     if not text or not variables:
         return text
     
-    for var_name, var_value in variables.items():
-        pattern = f"${{{var_name}}}"
-        text = text.replace(pattern, str(var_value))
+    return compile_template(text).render(variables)
+
+
+def normalize_field_value(value: Any) -> Any:
+    """
+    规范化表格字段值，便于比较回写前后的值
+    
+    文本分段数组合并为字符串，数字统一为float，其他值转换为字符串。
+    
+    Args:
+        value: 表格字段值或待写入的值
+        
+    Returns:
+        规范化后的值
+    """
+    if value is None:
+        return ""
+    
+    if isinstance(value, list) and all(isinstance(item, dict) and 'text' in item for item in value):
+        return ''.join(str(item['text']) for item in value)
+    
+    if isinstance(value, bool):
+        return value
+    
+    if isinstance(value, (int, float)):
+        return float(value)
+    
+    if isinstance(value, str):
+        try:
+            return float(value) if value.strip() else ""
+        except ValueError:
+            return value
     
-    return text
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
 
 
 def sanitize_field_name(name: str) -> str:
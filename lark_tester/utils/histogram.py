@@ -0,0 +1,137 @@
+"""
+延迟直方图模块
+
+提供HDR风格的对数-线性分桶直方图，用固定的相对精度记录大量延迟样本，
+内存占用与样本数无关
+"""
+
+import math
+import threading
+from typing import Dict, Optional
+
+
+class LatencyHistogram:
+    """
+    HDR风格的延迟直方图
+
+    以微秒为单位记录样本。小于sub_bucket_count的值精确记录，更大的值按2的幂
+    分段，每段内再线性细分，保证任意值的相对误差不超过10^-significant_digits。
+    """
+
+    def __init__(self, significant_digits: int = 3):
+        """
+        初始化直方图
+
+        Args:
+            significant_digits: 有效数字位数（1-5），决定分桶精度
+        """
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits 必须在1到5之间")
+
+        self.significant_digits = significant_digits
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._sub_bucket_count = 1 << self._sub_bucket_bits
+        self._sub_bucket_half = self._sub_bucket_count >> 1
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+        self.count = 0
+        self.total = 0
+        self.min_value: Optional[int] = None
+        self.max_value: Optional[int] = None
+
+    def _index_of(self, value: int) -> int:
+        """计算值所在的桶序号"""
+        if value < self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self._sub_bucket_bits
+        sub_index = value >> shift
+        return self._sub_bucket_count + (shift - 1) * self._sub_bucket_half + (sub_index - self._sub_bucket_half)
+
+    def _highest_equivalent(self, index: int) -> int:
+        """获取桶内可表示的最大值"""
+        if index < self._sub_bucket_count:
+            return index
+        offset = index - self._sub_bucket_count
+        shift = offset // self._sub_bucket_half + 1
+        sub_index = offset % self._sub_bucket_half + self._sub_bucket_half
+        return ((sub_index + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """
+        记录一个延迟样本
+
+        Args:
+            seconds: 延迟(秒)
+        """
+        value = max(0, int(round(seconds * 1_000_000)))
+        index = self._index_of(value)
+
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            self.min_value = value if self.min_value is None else min(self.min_value, value)
+            self.max_value = value if self.max_value is None else max(self.max_value, value)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """
+        合并另一个直方图的样本（两者精度需一致）
+
+        Args:
+            other: 另一个直方图
+        """
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("只能合并精度相同的直方图")
+
+        with other._lock:
+            counts = dict(other._counts)
+            count, total = other.count, other.total
+            min_value, max_value = other.min_value, other.max_value
+
+        if not count:
+            return
+
+        with self._lock:
+            for index, n in counts.items():
+                self._counts[index] = self._counts.get(index, 0) + n
+            self.count += count
+            self.total += total
+            self.min_value = min_value if self.min_value is None else min(self.min_value, min_value)
+            self.max_value = max_value if self.max_value is None else max(self.max_value, max_value)
+
+    def percentile(self, percent: float) -> float:
+        """
+        获取百分位延迟
+
+        Args:
+            percent: 百分位（0-100）
+
+        Returns:
+            延迟(毫秒)，没有样本时返回0
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = max(1, math.ceil(min(100.0, max(0.0, percent)) / 100 * self.count))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= target:
+                    return min(self._highest_equivalent(index), self.max_value) / 1000
+        return self.max_ms
+
+    @property
+    def max_ms(self) -> float:
+        """最大延迟(毫秒)"""
+        return (self.max_value or 0) / 1000
+
+    @property
+    def min_ms(self) -> float:
+        """最小延迟(毫秒)"""
+        return (self.min_value or 0) / 1000
+
+    @property
+    def mean_ms(self) -> float:
+        """平均延迟(毫秒)"""
+        return self.total / self.count / 1000 if self.count else 0.0
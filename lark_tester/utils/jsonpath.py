@@ -0,0 +1,156 @@
+"""
+JSON路径取值模块
+
+支持 $.data.items[0].name、data.items[0].name（省略$）、$['key with space']、
+$.data.items[*].id 和 $.data.*，路径编译一次后可在多个响应上重复取值
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, List, Tuple, Union
+
+# 响应体不是JSON时的解析结果（与JSON中的null区分）
+NOT_JSON = object()
+
+_WILDCARD = object()
+_STEP_PATTERN = re.compile(r'''
+    \.(?P<key>[^.\[\]]+)
+  | \[\s*(?:(?P<index>-?\d+)|'(?P<squoted>[^']*)'|"(?P<dquoted>[^"]*)"|(?P<star>\*))\s*\]
+''', re.VERBOSE)
+
+Step = Union[str, int, object]
+
+
+def parse_json(text: Union[str, bytes, None]) -> Any:
+    """
+    解析响应体，供多个路径和格式化共用同一份解析结果
+
+    Args:
+        text: 响应体
+
+    Returns:
+        解析后的对象，空响应体或不是JSON时返回NOT_JSON
+    """
+    if not text:
+        return NOT_JSON
+    try:
+        return json.loads(text)
+    except (ValueError, TypeError):
+        return NOT_JSON
+
+
+class JSONPath:
+    """编译后的JSON路径"""
+
+    __slots__ = ('expression', 'steps', 'multiple')
+
+    def __init__(self, expression: str):
+        """
+        编译JSON路径
+
+        Args:
+            expression: 路径表达式
+
+        Raises:
+            ValueError: 路径格式错误
+        """
+        self.expression = expression
+        self.steps: Tuple[Step, ...] = _parse_steps(expression)
+        self.multiple = any(step is _WILDCARD for step in self.steps)
+
+    def get(self, doc: Any, default: Any = None) -> Any:
+        """
+        取路径对应的值
+
+        Args:
+            doc: 解析后的JSON对象
+            default: 路径不存在时的返回值
+
+        Returns:
+            路径的值；路径含通配符时返回所有匹配值的列表
+        """
+        if self.multiple:
+            return self.find_all(doc)
+        value = doc
+        for step in self.steps:
+            if isinstance(step, str):
+                if not isinstance(value, dict) or step not in value:
+                    return default
+            elif not isinstance(value, list) or not -len(value) <= step < len(value):
+                return default
+            value = value[step]
+        return default if value is NOT_JSON else value
+
+    def find_all(self, doc: Any) -> List[Any]:
+        """
+        取路径匹配的全部值
+
+        Args:
+            doc: 解析后的JSON对象
+
+        Returns:
+            匹配值列表，没有匹配时为空列表
+        """
+        if doc is NOT_JSON:
+            return []
+        values = [doc]
+        for step in self.steps:
+            matched = []
+            for value in values:
+                if step is _WILDCARD:
+                    if isinstance(value, dict):
+                        matched.extend(value.values())
+                    elif isinstance(value, list):
+                        matched.extend(value)
+                elif isinstance(step, str):
+                    if isinstance(value, dict) and step in value:
+                        matched.append(value[step])
+                elif isinstance(value, list) and -len(value) <= step < len(value):
+                    matched.append(value[step])
+            values = matched
+        return values
+
+    def __repr__(self) -> str:
+        return f"JSONPath({self.expression!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_path(expression: str) -> JSONPath:
+    """
+    编译JSON路径，相同表达式只编译一次
+
+    Args:
+        expression: 路径表达式
+
+    Returns:
+        JSONPath对象
+    """
+    return JSONPath(expression)
+
+
+def _parse_steps(expression: str) -> Tuple[Step, ...]:
+    """将路径表达式切分为键、下标和通配符"""
+    text = expression.strip()
+    if text.startswith('$'):
+        text = text[1:]
+    elif text and not text.startswith(('.', '[')):
+        text = '.' + text
+
+    steps: List[Step] = []
+    pos = 0
+    while pos < len(text):
+        match = _STEP_PATTERN.match(text, pos)
+        if not match:
+            raise ValueError(f"无效的JSON路径: {expression}")
+        if match.group('key') is not None:
+            key = match.group('key')
+            steps.append(_WILDCARD if key == '*' else key)
+        elif match.group('index') is not None:
+            steps.append(int(match.group('index')))
+        elif match.group('star') is not None:
+            steps.append(_WILDCARD)
+        else:
+            steps.append(match.group('squoted') if match.group('squoted') is not None else match.group('dquoted'))
+        pos = match.end()
+    return tuple(steps)
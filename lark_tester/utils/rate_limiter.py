@@ -0,0 +1,71 @@
+"""
+限流工具模块
+
+提供线程安全的令牌桶限流器，支持在收到限流响应时整体退避
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    令牌桶限流器
+
+    按固定速率补充令牌，允许不超过容量的突发请求（以等价的GCRA虚拟调度
+    方式实现，只需记录下一个理论发放时间）。reserve()只预约令牌并返回需要
+    等待的秒数，不会阻塞，同步和异步调用方都可以基于它实现等待。
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数（即QPS），小于等于0表示不限流
+            capacity: 桶容量（允许的突发请求数），默认与rate相同
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._burst = (self.capacity - 1) * self._interval
+        self._next_time = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        预约一个令牌
+
+        Returns:
+            调用方在发起请求前需要等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.rate <= 0:
+                return max(0.0, self._paused_until - now)
+
+            next_time = max(self._next_time, now)
+            self._next_time = next_time + self._interval
+            return max(0.0, next_time - self._burst - now)
+
+    def acquire(self) -> None:
+        """获取一个令牌，必要时阻塞等待"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        收到限流响应后暂停发放令牌
+
+        暂停期间及结束时桶内令牌视为清空，避免恢复后立即突发。
+
+        Args:
+            seconds: 暂停时长(秒)
+        """
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            self._paused_until = max(self._paused_until, resume_at)
+            self._next_time = max(self._next_time, resume_at + self._burst)
@@ -0,0 +1,123 @@
+"""
+响应体模块
+
+同一个响应在执行、断言和结果格式化之间共用一个ResponseBody，
+文本解码、JSON解析和表格预览各只进行一次
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from .jsonpath import NOT_JSON, parse_json
+
+# 默认的表格预览长度
+DEFAULT_PREVIEW_LENGTH = 2000
+
+_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+_UNSET = object()
+
+
+class ResponseBody:
+    """
+    响应体
+
+    保存原始字节，文本、JSON解析结果和截断后的预览在首次使用时生成并缓存。
+    JSON预览逐段渲染，达到长度上限后立即停止，超大响应不会被完整格式化。
+    """
+
+    __slots__ = ('_content', 'encoding', '_text', '_doc', '_previews')
+
+    def __init__(self, content: bytes = b'', encoding: Optional[str] = None):
+        """
+        初始化响应体
+
+        Args:
+            content: 原始字节
+            encoding: 响应声明的编码，默认utf-8
+        """
+        self._content: Optional[bytes] = content
+        self.encoding = encoding
+        self._text: Optional[str] = None
+        self._doc: Any = _UNSET
+        self._previews: Dict[int, str] = {}
+
+    @classmethod
+    def from_text(cls, text: Optional[str], doc: Any = None) -> 'ResponseBody':
+        """
+        根据已解码的文本创建响应体（回放、错误结果等没有原始字节的场景）
+
+        Args:
+            text: 响应体文本
+            doc: 已有的parse_json结果，为None时按需解析
+
+        Returns:
+            ResponseBody对象
+        """
+        body = cls(None, 'utf-8')
+        body._text = text or ''
+        if doc is not None:
+            body._doc = doc
+        return body
+
+    @property
+    def content(self) -> bytes:
+        """原始字节"""
+        if self._content is None:
+            self._content = self._text.encode('utf-8')
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """解码后的文本（截断处不完整的字符被替换）"""
+        if self._text is None:
+            try:
+                self._text = self._content.decode(self.encoding or 'utf-8', errors='replace')
+            except LookupError:
+                self._text = self._content.decode('utf-8', errors='replace')
+        return self._text
+
+    @property
+    def doc(self) -> Any:
+        """JSON解析结果，不是JSON时为NOT_JSON"""
+        if self._doc is _UNSET:
+            self._doc = parse_json(self.text)
+        return self._doc
+
+    def preview(self, max_length: int = DEFAULT_PREVIEW_LENGTH) -> str:
+        """
+        生成适合表格显示的响应体，JSON格式化缩进，超过长度时截断
+
+        Args:
+            max_length: 最大长度
+
+        Returns:
+            预览文本
+        """
+        if max_length not in self._previews:
+            self._previews[max_length] = self._render(max_length)
+        return self._previews[max_length]
+
+    def _render(self, max_length: int) -> str:
+        """渲染预览"""
+        if not self:
+            return ""
+
+        doc = self.doc
+        if doc is NOT_JSON:
+            text = self.text
+            return text if len(text) <= max_length else text[:max_length] + "...(内容被截断)"
+
+        parts = []
+        length = 0
+        for chunk in _PRETTY_ENCODER.iterencode(doc):
+            parts.append(chunk)
+            length += len(chunk)
+            if length > max_length:
+                return ''.join(parts)[:max_length] + "\n...(内容被截断)"
+        return ''.join(parts)
+
+    def __bool__(self) -> bool:
+        return bool(self._text if self._content is None else self._content)
+
+    def __len__(self) -> int:
+        return len(self.content)
@@ -0,0 +1,111 @@
+"""
+变量模板模块
+
+将含 ${变量名} 的文本编译为字面量和变量槽交替的片段，按文本缓存；
+渲染时一次遍历片段、一次拼接，耗时与文本长度和引用数成正比，与变量总数无关
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Mapping, Optional, Tuple
+
+_SLOT_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+
+def format_variable(value: Any) -> str:
+    """
+    变量值转换为代入文本的字符串
+
+    Args:
+        value: 变量值
+
+    Returns:
+        字符串原样返回，其他值按JSON编码（数字、true/false、null、对象）
+    """
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+class Template:
+    """编译后的变量模板"""
+
+    __slots__ = ('source', 'names', '_segments', '_tail')
+
+    def __init__(self, source: str):
+        """
+        编译模板
+
+        Args:
+            source: 模板文本
+        """
+        self.source = source
+        # (变量前的字面量, 变量名, 变量原文)
+        segments: List[Tuple[str, str, str]] = []
+        position = 0
+        for match in _SLOT_PATTERN.finditer(source):
+            segments.append((source[position:match.start()], match.group(1), match.group(0)))
+            position = match.end()
+        self._segments = tuple(segments)
+        self._tail = source[position:]
+        self.names: FrozenSet[str] = frozenset(name for _, name, _ in segments)
+
+    @property
+    def is_static(self) -> bool:
+        """模板中是否没有变量"""
+        return not self._segments
+
+    def unresolved(self, variables: Optional[Mapping[str, Any]] = None) -> List[str]:
+        """
+        获取在variables中没有值的变量
+
+        Args:
+            variables: 变量值
+
+        Returns:
+            未定义的变量名（按出现顺序，去重）
+        """
+        variables = variables or {}
+        missing = []
+        for _, name, _ in self._segments:
+            if name not in variables and name not in missing:
+                missing.append(name)
+        return missing
+
+    def render(self, variables: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        代入变量
+
+        Args:
+            variables: 变量值，未定义的变量保留原文 ${变量名}
+
+        Returns:
+            代入后的文本
+        """
+        if not self._segments:
+            return self.source
+        variables = variables or {}
+        parts = []
+        for literal, name, raw in self._segments:
+            parts.append(literal)
+            parts.append(format_variable(variables[name]) if name in variables else raw)
+        parts.append(self._tail)
+        return ''.join(parts)
+
+    def __repr__(self) -> str:
+        return f"Template({self.source!r})"
+
+
+@lru_cache(maxsize=4096)
+def compile_template(source: str) -> Template:
+    """
+    编译模板，相同文本只编译一次
+
+    Args:
+        source: 模板文本
+
+    Returns:
+        Template对象
+    """
+    return Template(source)
@@ -8,6 +8,9 @@ import json
 from typing import Dict, Any, List, Union, Optional
 from urllib.parse import urlparse
 
+from .assertion import AssertionSyntaxError, compile_assertion
+from .formatter import parse_extract_rules
+
 
 def validate_test_case(test_case: Dict[str, Any]) -> tuple[bool, List[str]]:
     """
@@ -61,6 +64,28 @@ def validate_test_case(test_case: Dict[str, Any]) -> tuple[bool, List[str]]:
         except ValueError:
             errors.append(f"状态码必须是数字: {expected_status}")
     
+    # 断言规则语法验证
+    assertion_rule = test_case.get('断言规则')
+    if isinstance(assertion_rule, str) and assertion_rule.strip():
+        is_valid, error = validate_assertion_rule(assertion_rule)
+        if not is_valid:
+            errors.append(error)
+    
+    # 提取变量规则验证
+    try:
+        parse_extract_rules(test_case.get('提取变量'))
+    except ValueError as e:
+        errors.append(str(e))
+    
+    # 响应时间上限验证（毫秒）
+    latency_budget = test_case.get('响应时间上限')
+    if latency_budget not in (None, ''):
+        try:
+            if float(latency_budget) <= 0:
+                errors.append(f"响应时间上限必须大于0: {latency_budget}")
+        except (TypeError, ValueError):
+            errors.append(f"响应时间上限必须是数字: {latency_budget}")
+    
     return len(errors) == 0, errors
 
 
@@ -113,13 +138,11 @@ def validate_assertion_rule(rule: str) -> tuple[bool, str]:
     if not rule or not isinstance(rule, str):
         return False, "断言规则不能为空"
     
-    # 支持的断言操作符
-    valid_operators = ['==', '!=', '>', '<', '>=', '<=', 'in', 'not in', 'contains']
-    
-    # 简单语法检查
-    has_operator = any(op in rule for op in valid_operators)
-    if not has_operator:
-        return False, f"断言规则必须包含有效操作符: {', '.join(valid_operators)}"
+    # 完整编译一次，编译结果按规则文本缓存，执行时不再重复解析
+    try:
+        compile_assertion(rule)
+    except AssertionSyntaxError as e:
+        return False, f"断言规则语法错误: {str(e)}"
     
     return True, ""
 
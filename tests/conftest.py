@@ -0,0 +1,91 @@
+"""
+测试公共fixture
+
+多维表格接口由进程内的MockBitableServer模拟，被测API由本地HTTP服务模拟，测试不访问网络。
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator
+
+import pytest
+
+from lark_tester.core.api_client import APIClient
+from lark_tester.core.lark_client import LarkClient
+from lark_tester.testing import MockBitableServer
+
+
+class TargetAPI:
+    """被测API的模拟服务，所有请求返回 status 和 body"""
+
+    def __init__(self):
+        self.status = 200
+        self.body: Dict[str, Any] = {'code': 0, 'msg': 'success'}
+        self.requests = 0
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), _TargetHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.target = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'TargetAPI':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._thread.join()
+        self._httpd.server_close()
+
+
+class _TargetHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self) -> None:
+        target: TargetAPI = self.server.target
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        target.requests += 1
+        body = json.dumps(target.body).encode('utf-8')
+        self.send_response(target.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def mock_server() -> Iterator[MockBitableServer]:
+    with MockBitableServer() as server:
+        yield server
+
+
+@pytest.fixture
+def lark_client(mock_server: MockBitableServer) -> Iterator[LarkClient]:
+    client = LarkClient('pt-test', mock_server.app_token, domain=mock_server.url, qps=0)
+    yield client
+    client.session.close()
+
+
+@pytest.fixture
+def target_api() -> Iterator[TargetAPI]:
+    api = TargetAPI().start()
+    yield api
+    api.stop()
+
+
+@pytest.fixture
+def api_client(target_api: TargetAPI) -> Iterator[APIClient]:
+    with APIClient(base_url=target_api.url, max_retries=0) as client:
+        yield client
@@ -0,0 +1,191 @@
+"""断言规则的编译和执行"""
+
+import json
+import re
+
+import pytest
+
+from lark_tester.utils.assertion import OPERATORS, AssertionSyntaxError, compile_assertion
+
+BODY = json.dumps({
+    'code': 0,
+    'message': 'ok',
+    'data': {
+        'token': 'abc',
+        'total': 3,
+        'items': [{'id': 1, 'name': '张三'}, {'id': 3, 'name': '李四'}],
+        'list': [1, 2],
+        'user': {'id': 7},
+    },
+}, ensure_ascii=False)
+
+
+def check(rule: str, status_code: int = 200, body: str = BODY) -> bool:
+    return compile_assertion(rule).evaluate(status_code, body)[0]
+
+
+@pytest.mark.parametrize('rule, expected', [
+    # and 优先于 or
+    ('$.code == 1 and $.code == 0 or $.code == 0', True),
+    ('$.code == 0 or $.code == 1 and $.code == 1', True),
+    ('($.code == 0 or $.code == 1) and $.code == 1', False),
+    # not 优先于 and
+    ('not $.code == 1 and $.code == 0', True),
+    ('not ($.code == 0 and $.code == 1)', True),
+    ('not $.code == 0 or $.message == ok', True),
+    ('not not $.code == 0', True),
+])
+def test_precedence(rule: str, expected: bool):
+    assert check(rule) is expected
+
+
+OPERATOR_CASES = [
+    ('$.code == 0', True),
+    ('$.code == 1', False),
+    ('$.code != 1', True),
+    ('$.code != 0', False),
+    ('$.data.total > 2', True),
+    ('$.data.total > 3', False),
+    ('$.data.total < 4', True),
+    ('$.data.total < 3', False),
+    ('$.data.total >= 3', True),
+    ('$.data.total >= 4', False),
+    ('$.data.total <= 3', True),
+    ('$.data.total <= 2', False),
+    ('status_code in [200, 201]', True),
+    ('status_code in [201, 204]', False),
+    ('status_code not in [500, 502]', True),
+    ('status_code not in [200]', False),
+    ("$.message contains 'o'", True),
+    ("$.message contains 'x'", False),
+    ("$.message not contains 'x'", True),
+    ("$.message not contains 'o'", False),
+]
+
+
+@pytest.mark.parametrize('rule, expected', OPERATOR_CASES)
+def test_operators(rule: str, expected: bool):
+    assert check(rule) is expected
+
+
+@pytest.mark.parametrize('op', OPERATORS)
+def test_every_operator_is_covered(op: str):
+    outcomes = {expected for rule, expected in OPERATOR_CASES if re.search(rf'\s{op}\s', rule)}
+    assert outcomes == {True, False}
+
+
+@pytest.mark.parametrize('rule, expected', [
+    # 数字与数字字符串按数值比较
+    ("$.code == '0'", True),
+    ('$.data.token == "abc"', True),
+    ("$.data.token == 'ab\\'c'", False),
+    ('$.data.missing == null', True),
+    ('$.data.missing == none', True),
+    ('$.data.token != null', True),
+    ('$.data.items[*].id contains 3', True),
+    ('$.data.items[0].name contains \'张\'', True),
+    ('length($.data.list) >= 1', True),
+    ('length($.data.items) == 3', False),
+    ('body contains "success"', False),
+    ('body contains \'"code": 0\'', True),
+    # 旧写法：省略 $. 的左侧字段、省略左侧的 contains、右侧不加引号的单词
+    ('code == 0', True),
+    ('data.token == abc', True),
+    ('message == ok', True),
+    ('message != ok', False),
+    ('contains ok', True),
+    ('contains missing', False),
+    ('message in [ok, fine]', True),
+])
+def test_literals(rule: str, expected: bool):
+    assert check(rule) is expected
+
+
+def test_keywords_are_case_insensitive():
+    assert check('$.code == 0 AND NOT $.code == 1 Or $.code == 2')
+    assert check('$.data.missing == NULL')
+
+
+@pytest.mark.parametrize('rule, text', [
+    ('{"status_code": "== 200"}', 'status_code == 200'),
+    ('{"status_code": 200, "response_json": {"$.code": 0}}', 'status_code == 200 and $.code == 0'),
+    ('{"response_json": {"$.message": "ok"}}', "$.message == 'ok'"),
+    ('{"response_json": {"$.data.list": "length > 0"}}', 'length($.data.list) > 0'),
+    ('{"response_json": {"$.message": "contains \'o\'"}}', "$.message contains 'o'"),
+    ('{"body": "contains \'ok\'"}', "body contains 'ok'"),
+    ('{"$.data.token": "!= null"}', '$.data.token != null'),
+])
+def test_json_rule_matches_text_rule(rule: str, text: str):
+    for status_code, body in ((200, BODY), (500, '{"code": 1, "message": "no"}')):
+        assert check(rule, status_code, body) is check(text, status_code, body)
+
+
+@pytest.mark.parametrize('rule, budgets', [
+    ('{"response_time": 1000, "status_code": "== 200"}', (('<=', 1000.0),)),
+    ('{"response_time": "< 1.5s"}', (('<', 1500.0),)),
+    ('{"response_time": "300ms"}', (('<=', 300.0),)),
+    ('response_time < 300ms and $.code == 0', (('<', 300.0),)),
+    ('response_time <= 2s', (('<=', 2000.0),)),
+    ('response_time < 300', (('<', 300.0),)),
+])
+def test_latency_budgets(rule: str, budgets: tuple):
+    compiled = compile_assertion(rule)
+    assert compiled.latency_budgets == budgets
+    # 响应时间断言不参与功能断言
+    assert compiled.evaluate(200, BODY)[0]
+
+
+@pytest.mark.parametrize('rule', [
+    # README 中的示例
+    '{"status_code": "== 200", "response_json": {"$.code": "== \'00000\'", "$.data.token": "!= null"}}',
+    '{"status_code": "== 200", "response_time": "< 1000", "response_json": {"$.code": "== \'00000\'", '
+    '"$.data.token": "!= null", "$.data.user.id": "> 0", "$.message": "contains \'成功\'", '
+    '"$.data.list": "length > 0"}}',
+    "status_code in [200, 201] and $.code == '00000' and ($.data.total > 0 or $.message contains '成功')",
+    'code == 0',
+    "contains 'success'",
+    'response_time < 300ms',
+    # 模块文档中的示例
+    'status_code == 200 and $.code == 0',
+    '$.data.items[0].name contains \'张\' or body contains "success"',
+    'data.code == 0 and $.data.items[*].id contains 3',
+    'not ($.data.total < 1) and length($.data.list) >= 1',
+    "status_code in [200, 201] and $.message not contains 'error'",
+])
+def test_documented_examples_compile(rule: str):
+    compile_assertion(rule)
+
+
+def test_readme_example_evaluates():
+    body = json.dumps({'code': '00000', 'message': '登录成功', 'data': {'token': 't', 'total': 0}},
+                      ensure_ascii=False)
+    rule = "status_code in [200, 201] and $.code == '00000' and ($.data.total > 0 or $.message contains '成功')"
+    assert check(rule, 201, body)
+    assert not check(rule, 500, body)
+
+
+def test_failure_message_names_clause_and_actual_value():
+    passed, error = compile_assertion('status_code == 200 and $.code == 1').evaluate(200, BODY)
+    assert not passed
+    assert error == '$.code == 1（实际值: 0）'
+
+
+@pytest.mark.parametrize('rule, message', [
+    ('', '断言规则不能为空'),
+    ('$.code ==', '规则不完整'),
+    ('$.code 0', '缺少比较运算符'),
+    ('($.code == 0', "缺少 ')'"),
+    ('$.code == 0 $.message == ok', '多余的内容'),
+    ('$.code == and', '无效的操作数: and'),
+    ('$.code == 0 && $.code == 1', '无法识别的内容'),
+    ('$.code == 5s', '时间单位只能用于response_time'),
+    ('response_time < 300ms or $.code == 0', '不能用or连接'),
+    ('not response_time < 300ms', '不能放在not之后'),
+    ('response_time contains 3', '响应时间断言格式应为'),
+    ('{"status_code": ', 'JSON格式错误'),
+    ('{"unknown": "== 1"}', '未知的断言项'),
+    ('{"response_time": "fast"}', '响应时间断言的值应为毫秒数'),
+])
+def test_syntax_errors(rule: str, message: str):
+    with pytest.raises(AssertionSyntaxError, match=re.escape(message)):
+        compile_assertion(rule)
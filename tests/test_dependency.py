@@ -0,0 +1,161 @@
+"""DependencyScheduler 与 AsyncDependencyScheduler 在相同依赖图上的结果一致"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from lark_tester.core.dependency import AsyncDependencyScheduler, DependencyScheduler
+
+
+def case(case_id: str, outputs: str = '', uses: str = '', produces: Optional[List[str]] = None,
+         fails: bool = False) -> Dict[str, Any]:
+    """
+    构造用例
+
+    Args:
+        case_id: 接口编号
+        outputs: 声明提取的变量（逗号分隔）
+        uses: 接口路径中引用的变量（逗号分隔）
+        produces: 实际提取到的变量，默认与outputs相同
+        fails: 执行时抛出异常
+    """
+    names = [name for name in outputs.split(',') if name]
+    return {
+        '_record_id': f'rec{case_id}',
+        '接口编号': case_id,
+        '接口路径': '/' + '/'.join(f'${{{name}}}' for name in uses.split(',') if name),
+        '提取变量': '\n'.join(f'{name} = $.{name}' for name in names),
+        '_produces': names if produces is None else produces,
+        '_fails': fails,
+    }
+
+
+def run_case(test_case: Dict[str, Any], variables: Dict[str, Any]) -> Dict[str, Any]:
+    if test_case['_fails']:
+        raise RuntimeError('boom')
+    return {
+        '_record_id': test_case['_record_id'],
+        '是否通过': 'PASS',
+        '_inputs': dict(sorted(variables.items())),
+        '_variables': {name: f"{test_case['接口编号']}.{name}" for name in test_case['_produces']},
+    }
+
+
+async def run_case_async(test_case: Dict[str, Any], variables: Dict[str, Any]) -> Dict[str, Any]:
+    await asyncio.sleep(0)
+    return run_case(test_case, variables)
+
+
+GRAPHS = {
+    'chain': [
+        case('A', outputs='a'),
+        case('B', outputs='b', uses='a'),
+        case('C', uses='b'),
+    ],
+    'diamond': [
+        case('A', outputs='a'),
+        case('B', outputs='b', uses='a'),
+        case('C', outputs='c', uses='a'),
+        case('D', uses='b,c'),
+    ],
+    'forward_reference': [
+        case('A', uses='token'),
+        case('B', outputs='token'),
+        case('C', outputs='token'),
+        case('D', uses='token'),
+    ],
+    'cycle': [
+        case('A', outputs='a', uses='b'),
+        case('B', outputs='b', uses='a'),
+        case('C', uses='a'),
+        case('D'),
+    ],
+    'self_reference': [
+        case('A', outputs='a', uses='a'),
+        case('B', uses='a'),
+    ],
+    'unresolved_variable': [
+        case('A', outputs='a', produces=[]),
+        case('B', outputs='b', uses='a'),
+        case('C', uses='b'),
+        case('D', uses='external'),
+    ],
+    'failing_upstream': [
+        case('A', outputs='a', fails=True),
+        case('B', uses='a'),
+        case('C'),
+    ],
+}
+
+
+def run_sync(test_cases: List[Dict[str, Any]], workers: int) -> List[Dict[str, Any]]:
+    # 逐条产出，模拟按分页到达的用例
+    return DependencyScheduler(run_case, workers=workers).run(iter(test_cases))
+
+
+def run_async(test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return asyncio.run(AsyncDependencyScheduler(run_case_async).run(test_cases))
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+@pytest.mark.parametrize('graph', sorted(GRAPHS))
+def test_sync_and_async_outcomes_match(graph: str, workers: int):
+    test_cases = GRAPHS[graph]
+
+    assert run_sync(test_cases, workers) == run_async(test_cases)
+
+
+def outcomes(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        result['_record_id'][3:]: result.get('_inputs') if result['是否通过'] == 'PASS' else result['响应体']
+        for result in results
+    }
+
+
+def test_chain_passes_variables_downstream():
+    results = run_sync(GRAPHS['chain'], workers=2)
+
+    assert outcomes(results) == {'A': {}, 'B': {'a': 'A.a'}, 'C': {'b': 'B.b'}}
+
+
+def test_diamond_waits_for_both_branches():
+    results = run_sync(GRAPHS['diamond'], workers=4)
+
+    assert outcomes(results)['D'] == {'b': 'B.b', 'c': 'C.c'}
+
+
+def test_forward_reference_binds_to_first_later_producer():
+    results = run_sync(GRAPHS['forward_reference'], workers=1)
+
+    assert outcomes(results)['A'] == {'token': 'B.token'}
+    assert outcomes(results)['D'] == {'token': 'C.token'}
+
+
+def test_cycle_and_downstream_are_blocked():
+    results = outcomes(run_sync(GRAPHS['cycle'], workers=2))
+
+    for case_id in 'ABC':
+        assert '用例之间存在循环依赖: A, B, C' in results[case_id]
+    assert results['D'] == {}
+
+
+def test_missing_variable_blocks_downstream():
+    results = outcomes(run_sync(GRAPHS['unresolved_variable'], workers=2))
+
+    assert '依赖的变量未提取到: a(用例A)' in results['B']
+    assert '依赖的变量未提取到: b(用例B)' in results['C']
+    # 没有任何用例提取的变量视为外部变量，用例照常执行
+    assert results['D'] == {}
+
+
+def test_independent_cases_run_in_parallel():
+    def slow(test_case: Dict[str, Any], variables: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(0.3)
+        return run_case(test_case, variables)
+
+    started = time.monotonic()
+    DependencyScheduler(slow, workers=4).run([case(case_id) for case_id in 'ABCD'])
+
+    assert time.monotonic() - started < 0.9
@@ -0,0 +1,107 @@
+"""LarkClient 批量写入、分页读取、限流重试和字段结构缓存"""
+
+import logging
+
+import pytest
+
+from lark_tester.core.lark_client import LarkClient
+from lark_tester.testing import MockBitableServer
+
+
+@pytest.fixture
+def no_pause(lark_client: LarkClient, monkeypatch: pytest.MonkeyPatch) -> list:
+    """记录限流暂停时长，不实际等待"""
+    pauses = []
+    monkeypatch.setattr(lark_client.rate_limiter, 'pause', pauses.append)
+    return pauses
+
+
+def test_batch_update_reports_failed_chunk(mock_server: MockBitableServer, lark_client: LarkClient,
+                                           monkeypatch: pytest.MonkeyPatch):
+    record_ids = mock_server.add_table('tbl', [{'名称': f'r{i}'} for i in range(3)])
+    monkeypatch.setattr(lark_client, 'BATCH_LIMIT', 2)
+    updates = [{'record_id': record_id, 'fields': {'名称': 'updated'}} for record_id in record_ids]
+    # 第二个分块包含不存在的记录，整块失败
+    updates.append({'record_id': 'recMissing', 'fields': {'名称': 'updated'}})
+
+    result = lark_client.batch_update_records('tbl', updates)
+
+    assert result.succeeded == record_ids[:2]
+    assert set(result.failed) == {record_ids[2], 'recMissing'}
+    assert not result.success
+    assert mock_server.requests['POST records/batch_update'] == 2
+    assert [r['fields']['名称'] for r in mock_server.get_records('tbl')] == ['updated', 'updated', 'r2']
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_iter_records_pages_in_order(mock_server: MockBitableServer, lark_client: LarkClient, prefetch: bool):
+    record_ids = mock_server.add_table('tbl', [{'序号': i} for i in range(45)])
+
+    records = list(lark_client.iter_records('tbl', page_size=10, prefetch=prefetch))
+
+    assert [r['record_id'] for r in records] == record_ids
+    assert [r['fields']['序号'] for r in records] == list(range(45))
+    assert mock_server.requests['GET records'] == 5
+
+
+def test_iter_records_stops_early_with_prefetch(mock_server: MockBitableServer, lark_client: LarkClient):
+    mock_server.add_table('tbl', [{'序号': i} for i in range(45)])
+
+    records = lark_client.iter_records('tbl', page_size=10, prefetch=True)
+    first = [next(records) for _ in range(3)]
+    records.close()
+
+    assert [r['fields']['序号'] for r in first] == [0, 1, 2]
+    # 当前页加上最多一个预取页
+    assert mock_server.requests['GET records'] <= 2
+
+
+def test_rate_limited_request_is_retried(mock_server: MockBitableServer, lark_client: LarkClient, no_pause: list):
+    mock_server.add_table('tbl', [{'序号': i} for i in range(3)])
+    mock_server.inject_rate_limit(2)
+
+    records = lark_client.get_all_records('tbl')
+
+    assert len(records) == 3
+    assert mock_server.rate_limited == 2
+    # 按Retry-After退避
+    assert no_pause == [1.0, 1.0]
+
+
+def test_rate_limit_retries_exhausted(mock_server: MockBitableServer, lark_client: LarkClient, no_pause: list,
+                                      monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture):
+    mock_server.add_table('tbl', [{'序号': 1}])
+    monkeypatch.setattr(lark_client, 'MAX_RATE_LIMIT_RETRIES', 2)
+    mock_server.inject_rate_limit(10)
+
+    with caplog.at_level(logging.ERROR):
+        records = lark_client.get_all_records('tbl')
+
+    assert records == []
+    assert mock_server.rate_limited == 3
+    assert len(no_pause) == 2
+    assert any('频率限制重试次数已用尽' in r.message and '(attempts 3/3)' in r.message for r in caplog.records)
+
+
+def test_missing_field_lookup_is_cached(mock_server: MockBitableServer, lark_client: LarkClient):
+    mock_server.add_table('tbl', fields={'名称': 1})
+
+    assert lark_client.get_field_by_name('tbl', '名称')['field_name'] == '名称'
+    mock_server.reset_stats()
+    for _ in range(3):
+        assert lark_client.get_field_by_name('tbl', '缺失') is None
+    assert mock_server.requests['GET fields'] == 1
+
+    # 新建字段后重新查找
+    lark_client.create_field('tbl', '其他', 1)
+    assert lark_client.get_field_by_name('tbl', '缺失') is None
+    assert mock_server.requests['GET fields'] == 2
+
+
+def test_list_fields_returns_copies(mock_server: MockBitableServer, lark_client: LarkClient):
+    mock_server.add_table('tbl', fields={'名称': 1})
+
+    lark_client.list_fields('tbl')[0]['field_name'] = 'changed'
+
+    assert lark_client.list_fields('tbl')[0]['field_name'] == '名称'
+    assert lark_client.get_field_by_name('tbl', '名称') is not None
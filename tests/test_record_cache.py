@@ -0,0 +1,83 @@
+"""RecordCache 全量和增量同步"""
+
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from lark_tester.core.lark_client import LarkClient
+from lark_tester.core.record_cache import RecordCache
+from lark_tester.testing import MockBitableServer
+from lark_tester.testing.mock_bitable import FIELD_MODIFIED_TIME
+
+FIELD_DATE = 5
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+@pytest.fixture
+def record_cache(tmp_path: Path) -> Iterator[RecordCache]:
+    cache = RecordCache(str(tmp_path / 'records.db'))
+    yield cache
+    cache.close()
+
+
+def test_incremental_sync_merges_changes_and_deletions(mock_server: MockBitableServer, lark_client: LarkClient,
+                                                      record_cache: RecordCache):
+    record_ids = mock_server.add_table('tbl', [{'名称': f'r{i}'} for i in range(4)],
+                                       fields={'更新时间': FIELD_MODIFIED_TIME})
+    first = list(record_cache.sync(lark_client, 'tbl', '更新时间'))
+    assert [r['record_id'] for r in first] == record_ids
+    assert record_cache.get_watermark(lark_client.app_token, 'tbl') is not None
+
+    lark_client.delete_record('tbl', record_ids[1])
+    lark_client.update_record('tbl', record_ids[2], {'名称': 'changed'})
+    mock_server.reset_stats()
+
+    second = list(record_cache.sync(lark_client, 'tbl', '更新时间'))
+
+    assert [r['record_id'] for r in second] == [record_ids[0], record_ids[2], record_ids[3]]
+    assert second[1]['fields']['名称'] == 'changed'
+    assert mock_server.requests['POST records/search'] == 1
+    # 缓存中也不再有已删除的记录
+    cached = list(record_cache.iter_records(lark_client.app_token, 'tbl'))
+    assert record_ids[1] not in {r['record_id'] for r in cached}
+
+
+def test_records_not_downloaded_are_marked_cached(mock_server: MockBitableServer, lark_client: LarkClient,
+                                                 record_cache: RecordCache):
+    old = int(time.time() * 1000) - 3 * DAY_MS
+    record_ids = mock_server.add_table('tbl', [{'名称': 'a', '更新时间': old}, {'名称': 'b', '更新时间': old}],
+                                       fields={'更新时间': FIELD_DATE})
+    first = list(record_cache.sync(lark_client, 'tbl', '更新时间'))
+    assert not any(r.get('cached') for r in first)
+
+    lark_client.update_record('tbl', record_ids[1], {'名称': 'b2', '更新时间': int(time.time() * 1000)})
+    second = {r['record_id']: r for r in record_cache.sync(lark_client, 'tbl', '更新时间')}
+
+    assert second[record_ids[0]].get('cached') is True
+    assert not second[record_ids[1]].get('cached')
+    assert second[record_ids[1]]['fields']['名称'] == 'b2'
+
+
+def test_update_fields_writes_into_cache(mock_server: MockBitableServer, lark_client: LarkClient,
+                                         record_cache: RecordCache):
+    record_ids = mock_server.add_table('tbl', [{'名称': 'a', '是否通过': 'FAIL'}],
+                                       fields={'更新时间': FIELD_MODIFIED_TIME})
+    list(record_cache.sync(lark_client, 'tbl', '更新时间'))
+
+    assert record_cache.update_fields(lark_client.app_token, 'tbl', record_ids[0], {'是否通过': 'PASS', '名称': None})
+    assert not record_cache.update_fields(lark_client.app_token, 'tbl', 'recMissing', {'是否通过': 'PASS'})
+
+    [record] = record_cache.iter_records(lark_client.app_token, 'tbl')
+    assert record['fields'] == {'是否通过': 'PASS', '更新时间': record['fields']['更新时间']}
+
+
+def test_sync_falls_back_without_modified_field(mock_server: MockBitableServer, lark_client: LarkClient,
+                                                record_cache: RecordCache):
+    record_ids = mock_server.add_table('tbl', [{'名称': 'a'}])
+
+    records = list(record_cache.sync(lark_client, 'tbl', '更新时间'))
+
+    assert [r['record_id'] for r in records] == record_ids
+    assert record_cache.get_watermark(lark_client.app_token, 'tbl') is None
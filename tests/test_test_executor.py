@@ -0,0 +1,107 @@
+"""TestExecutor 执行和结果回写"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from lark_tester.core.api_client import APIClient
+from lark_tester.core.lark_client import LarkClient
+from lark_tester.core.test_executor import TestExecutor
+from lark_tester.testing import MockBitableServer
+
+FIELD_DATE = 5
+DAY_MS = 24 * 60 * 60 * 1000
+# 用例表自带的结果字段（响应时间、性能断言由执行器按需创建）
+RESULT_COLUMNS = {'响应状态码': 1, '响应体': 1, '是否通过': 3}
+
+
+def make_cases(count: int, **extra):
+    return [
+        {'接口编号': f'T{i}', '请求方法': 'GET', '接口路径': f'/api/{i}', '断言规则': '$.code == 0',
+         '是否执行': True, **extra}
+        for i in range(count)
+    ]
+
+
+def run_cycle(lark_client: LarkClient, api_client: APIClient, table_id: str, **config) -> TestExecutor:
+    executor = TestExecutor(lark_client=lark_client, api_client=api_client, config=config)
+    try:
+        executor.run_full_test_cycle(table_id)
+    finally:
+        if executor.record_cache:
+            executor.record_cache.close()
+    return executor
+
+
+def test_results_are_written_back(mock_server: MockBitableServer, lark_client: LarkClient, api_client: APIClient):
+    mock_server.add_table('tbl', make_cases(3), fields=RESULT_COLUMNS)
+
+    executor = run_cycle(lark_client, api_client, 'tbl')
+
+    assert executor.write_stats['written'] == 3
+    assert [r['fields']['是否通过'] for r in mock_server.get_records('tbl')] == ['PASS'] * 3
+    assert mock_server.requests['POST records/batch_update'] == 1
+
+
+def test_unchanged_results_are_skipped(mock_server: MockBitableServer, lark_client: LarkClient,
+                                       api_client: APIClient, target_api):
+    mock_server.add_table('tbl', make_cases(3), fields=RESULT_COLUMNS)
+    run_cycle(lark_client, api_client, 'tbl')
+    mock_server.reset_stats()
+
+    executor = run_cycle(lark_client, api_client, 'tbl')
+
+    assert executor.write_stats['written'] == 0
+    assert executor.write_stats['skipped_records'] == 3
+    assert executor.write_stats['skipped_cached'] == 0
+    assert mock_server.requests['POST records/batch_update'] == 0
+
+    # 结果变化的记录只回写变化的字段
+    target_api.body = {'code': 1}
+    executor = run_cycle(lark_client, api_client, 'tbl')
+    assert executor.write_stats['written'] == 3
+    assert executor.write_stats['skipped_records'] == 0
+    assert [r['fields']['是否通过'] for r in mock_server.get_records('tbl')] == ['FAIL'] * 3
+
+
+def test_skip_unchanged_disabled(mock_server: MockBitableServer, lark_client: LarkClient, api_client: APIClient):
+    mock_server.add_table('tbl', make_cases(2), fields=RESULT_COLUMNS)
+    run_cycle(lark_client, api_client, 'tbl')
+
+    executor = run_cycle(lark_client, api_client, 'tbl', skip_unchanged_writes=False)
+
+    assert executor.write_stats['written'] == 2
+    assert executor.write_stats['skipped_records'] == 0
+
+
+def test_skips_against_cached_rows_are_reported(mock_server: MockBitableServer, lark_client: LarkClient,
+                                                api_client: APIClient, tmp_path: Path):
+    old = int(time.time() * 1000) - 3 * DAY_MS
+    mock_server.add_table('tbl', make_cases(3, 更新时间=old), fields={**RESULT_COLUMNS, '更新时间': FIELD_DATE})
+    cache_path = str(tmp_path / 'records.db')
+    run_cycle(lark_client, api_client, 'tbl', record_cache_path=cache_path)
+
+    executor = run_cycle(lark_client, api_client, 'tbl', record_cache_path=cache_path)
+    assert executor.write_stats['skipped_records'] == 3
+    assert executor.write_stats['skipped_cached'] == 3
+
+    # 不信任缓存的对比基准时照常回写
+    executor = run_cycle(lark_client, api_client, 'tbl', record_cache_path=cache_path, skip_unchanged_cached=False)
+    assert executor.write_stats['written'] == 3
+    assert executor.write_stats['skipped_records'] == 0
+
+
+def test_cache_follows_written_results(mock_server: MockBitableServer, lark_client: LarkClient,
+                                       api_client: APIClient, target_api, tmp_path: Path):
+    old = int(time.time() * 1000) - 3 * DAY_MS
+    mock_server.add_table('tbl', make_cases(1, 更新时间=old), fields={**RESULT_COLUMNS, '更新时间': FIELD_DATE})
+    cache_path = str(tmp_path / 'records.db')
+
+    passed = []
+    for code in (0, 1, 0):
+        target_api.body = {'code': code}
+        run_cycle(lark_client, api_client, 'tbl', record_cache_path=cache_path)
+        passed.append(mock_server.get_records('tbl')[0]['fields']['是否通过'])
+
+    assert passed == ['PASS', 'FAIL', 'PASS']